@@ -1,11 +1,20 @@
 from PyQt6.QtWidgets import QApplication
 from src.database import init_db
+from src.db_executor import get_executor
+from src.jobs import get_job_runner
+from src.language import preload_languages
+from src.settings import get_settings
 from src.ui.main_window import MainWindow
 import sys
 
 if __name__ == "__main__":
     init_db()
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(get_job_runner().shutdown)
+    app.aboutToQuit.connect(get_executor().shutdown)
+    app.aboutToQuit.connect(get_settings().flush)
     window = MainWindow()
     window.show()
+    # Інші мови завантажуються у фоні, щоб їх перемикання було миттєвим
+    preload_languages()
     sys.exit(app.exec())
\ No newline at end of file
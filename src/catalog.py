@@ -0,0 +1,185 @@
+"""
+Скомпільовані каталоги перекладів.
+
+Мовний файл src/locales/<code>.json містить вкладені словники. Каталог —
+це той самий переклад, розгорнутий в один словник з ключами через крапку
+('app.export.title'), тому пошук перекладу стає одним зверненням до dict.
+
+Розгорнуті каталоги зберігаються у файлах marshal у CACHE_DIR (кеш
+користувача, наприклад ~/.cache/SchedulePlanner/catalogs) разом зі
+шляхом, mtime та розміром JSON. Наступний запуск читає кеш без розбору
+JSON; якщо мовний файл змінився, каталог компілюється наново. Каталоги можна
+скомпілювати заздалегідь: python -m src.catalog
+"""
+
+import json
+import marshal
+import os
+import sys
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+LOCALES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+
+
+def _user_cache_dir() -> str:
+    """Повертає каталог кешу користувача для поточної платформи."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+    elif sys.platform == "darwin":
+        base = os.path.join(os.path.expanduser("~"), "Library", "Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "SchedulePlanner", "catalogs")
+
+
+# Кеш зберігається поза каталогом пакета, щоб не змінювати робочу копію
+# і працювати у встановленому додатку без прав на запис
+CACHE_DIR = _user_cache_dir()
+
+# Версія формату кешу; при зміні формату старі файли ігноруються
+CACHE_VERSION = 2
+
+Catalog = Dict[str, str]
+
+_catalogs: Dict[str, Catalog] = {}
+_lock = threading.Lock()
+
+
+def locale_path(lang_code: str) -> str:
+    """Повертає шлях до мовного файлу JSON."""
+    return os.path.join(LOCALES_DIR, f"{lang_code}.json")
+
+
+def cache_path(lang_code: str) -> str:
+    """Повертає шлях до скомпільованого каталогу."""
+    return os.path.join(CACHE_DIR, f"{lang_code}.catalog")
+
+
+def available_languages() -> Tuple[str, ...]:
+    """Повертає коди мов, для яких є мовні файли."""
+    return tuple(sorted(
+        name[:-len(".json")] for name in os.listdir(LOCALES_DIR) if name.endswith(".json")
+    ))
+
+
+def flatten(tree: Dict[str, Any], prefix: str = "") -> Catalog:
+    """
+    Розгортає вкладені словники перекладів у словник з ключами через крапку.
+
+    Args:
+        tree (dict): Вміст мовного файлу.
+        prefix (str): Префікс ключів поточного рівня.
+
+    Returns:
+        Dict[str, str]: Переклади за повними ключами (значення не-рядки пропускаються).
+    """
+    catalog = {}
+    for key, value in tree.items():
+        if isinstance(value, dict):
+            catalog.update(flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, str):
+            catalog[f"{prefix}{key}"] = value
+    return catalog
+
+
+def _source_stamp(source: str) -> Tuple[str, int, int]:
+    """Повертає шлях, mtime (нс) та розмір мовного файлу для перевірки кешу.
+
+    Шлях входить до відбитка, бо кеш користувача спільний для всіх копій
+    додатку.
+    """
+    stat = os.stat(source)
+    return source, stat.st_mtime_ns, stat.st_size
+
+
+def _read_cache(lang_code: str, stamp: Tuple[str, int, int]) -> Optional[Catalog]:
+    """Читає скомпільований каталог, якщо він актуальний."""
+    try:
+        with open(cache_path(lang_code), "rb") as f:
+            version, cached_stamp, catalog = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if version != CACHE_VERSION or tuple(cached_stamp) != stamp or not isinstance(catalog, dict):
+        return None
+    return catalog
+
+
+def _write_cache(lang_code: str, stamp: Tuple[str, int, int], catalog: Catalog) -> None:
+    """Записує скомпільований каталог (помилки запису не заважають роботі)."""
+    path = cache_path(lang_code)
+    tmp_path = f"{path}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            marshal.dump((CACHE_VERSION, stamp, catalog), f)
+        # Атомарна заміна, щоб паралельний запуск не прочитав половину файлу
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def compile_catalog(lang_code: str) -> Catalog:
+    """
+    Читає та розгортає мовний файл і оновлює його скомпільований кеш.
+
+    Args:
+        lang_code (str): Код мови (наприклад 'en', 'ukr').
+
+    Returns:
+        Dict[str, str]: Каталог перекладів.
+
+    Raises:
+        FileNotFoundError: Якщо мовного файлу немає.
+    """
+    source = locale_path(lang_code)
+    stamp = _source_stamp(source)
+    with open(source, "r", encoding="utf-8") as file:
+        catalog = flatten(json.load(file))
+    _write_cache(lang_code, stamp, catalog)
+    return catalog
+
+
+def load_catalog(lang_code: str) -> Catalog:
+    """
+    Повертає каталог перекладів мови.
+
+    Каталог шукається в пам'яті, потім у скомпільованому кеші, і лише
+    якщо кеш застарів або відсутній — компілюється з JSON.
+
+    Args:
+        lang_code (str): Код мови (наприклад 'en', 'ukr').
+
+    Returns:
+        Dict[str, str]: Каталог перекладів.
+
+    Raises:
+        FileNotFoundError: Якщо мовного файлу немає.
+    """
+    catalog = _catalogs.get(lang_code)
+    if catalog is not None:
+        return catalog
+
+    with _lock:
+        catalog = _catalogs.get(lang_code)
+        if catalog is None:
+            catalog = _read_cache(lang_code, _source_stamp(locale_path(lang_code)))
+            if catalog is None:
+                catalog = compile_catalog(lang_code)
+            _catalogs[lang_code] = catalog
+    return catalog
+
+
+def compile_all() -> Dict[str, int]:
+    """
+    Компілює каталоги всіх мов.
+
+    Returns:
+        Dict[str, int]: Кількість перекладів для кожної мови.
+    """
+    return {lang_code: len(compile_catalog(lang_code)) for lang_code in available_languages()}
+
+
+if __name__ == "__main__":
+    for code, count in compile_all().items():
+        print(f"{code}: {count} keys -> {cache_path(code)}")
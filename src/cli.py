@@ -0,0 +1,252 @@
+"""
+Командний рядок для пакетних операцій з розкладом без графічного інтерфейсу.
+
+Використання:
+    python -m src.cli import FILE [--mode merge] [--key natural] [--parallel]
+    python -m src.cli export FILE [--format ndjson] [--compact] [--level 9]
+    python -m src.cli validate FILE [--parallel]
+    python -m src.cli conflicts
+    python -m src.cli stats [--json]
+
+Модуль не імпортує PyQt6: він працює лише з src.formats та шаром бази
+даних, тому швидко запускається і підходить для cron та
+паралельних конвеєрів. Коди завершення: 0 — успіх, 1 — помилки в даних
+або знайдені конфлікти, 2 — неправильні аргументи.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from typing import Callable, Iterator, List, Optional, Sequence
+
+from src.compression import DEFAULT_LEVEL, MAX_LEVEL, MIN_LEVEL
+from src.database import DB_PATH, MERGE_KEYS, LessonRepository
+from src.formats import (
+    DEFAULT_BATCH_SIZE, FORMATS, ImportReport, LessonImportError, detect_format, export_rows,
+    iter_lessons, validated_lessons
+)
+from src.models import Lesson
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+
+# Скільки помилок зі звіту виводити за замовчуванням
+DEFAULT_MAX_ERRORS = 20
+
+
+def _error(message: str) -> None:
+    """Виводить повідомлення про помилку в stderr."""
+    print(f"error: {message}", file=sys.stderr)
+
+
+def _resolve_format(file_path: str, fmt: Optional[str]) -> Optional[str]:
+    """Повертає явно вказаний формат або визначає його за розширенням файлу."""
+    fmt = fmt or detect_format(file_path)
+    if fmt is None:
+        _error(f"cannot detect format of {file_path}, use --format")
+    return fmt
+
+
+def _read_batches(args: argparse.Namespace, fmt: str, report: ImportReport) -> Iterator[List[Lesson]]:
+    """Створює генератор частин уроків для файлу з аргументів."""
+    return iter_lessons(args.file, fmt, args.batch_size, report, args.parallel, args.workers)
+
+
+def _print_report(report: ImportReport, max_errors: int) -> None:
+    """Виводить помилки звіту про імпорт у stderr."""
+    shown = report.errors[:max_errors]
+    for issue in shown:
+        location = f"line {issue.line}: " if issue.line else ""
+        detail = f" ({issue.detail})" if issue.detail else ""
+        print(f"{location}{issue.reason}{detail}", file=sys.stderr)
+    hidden = report.error_count - len(shown)
+    if hidden > 0:
+        print(f"...and {hidden} more", file=sys.stderr)
+
+
+def _open_repository(args: argparse.Namespace) -> LessonRepository:
+    """Відкриває репозиторій бази даних з аргументів та застосовує міграції."""
+    repository = LessonRepository(args.db)
+    repository.init_schema()
+    return repository
+
+
+def cmd_validate(args: argparse.Namespace) -> int:
+    """Перевіряє файл без запису в базу даних."""
+    fmt = _resolve_format(args.file, args.format)
+    if fmt is None:
+        return EXIT_USAGE
+
+    report = ImportReport()
+    try:
+        for _ in validated_lessons(_read_batches(args, fmt, report), report):
+            pass
+    except LessonImportError:
+        _print_report(report, args.max_errors)
+        return EXIT_FAILED
+    except OSError as e:
+        _error(str(e))
+        return EXIT_FAILED
+
+    print(f"{report.lessons} lessons OK")
+    return EXIT_OK
+
+
+def cmd_import(args: argparse.Namespace) -> int:
+    """Імпортує файл у базу даних із заміною або злиттям."""
+    fmt = _resolve_format(args.file, args.format)
+    if fmt is None:
+        return EXIT_USAGE
+
+    report = ImportReport()
+    repository = _open_repository(args)
+    try:
+        lessons = validated_lessons(_read_batches(args, fmt, report), report)
+        if args.mode == "merge":
+            result = repository.merge_all(lessons, args.key)
+            print(f"{result.inserted} added, {result.updated} updated, {result.unchanged} unchanged")
+        else:
+            count = repository.replace_all(lessons)
+            print(f"{count} lessons imported")
+    except LessonImportError:
+        _print_report(report, args.max_errors)
+        return EXIT_FAILED
+    except (OSError, sqlite3.Error) as e:
+        _error(str(e))
+        return EXIT_FAILED
+    finally:
+        repository.close()
+    return EXIT_OK
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    """Експортує всі уроки з бази даних у файл."""
+    fmt = _resolve_format(args.file, args.format)
+    if fmt is None:
+        return EXIT_USAGE
+
+    repository = _open_repository(args)
+    try:
+        if repository.count() == 0:
+            print("no lessons to export", file=sys.stderr)
+            return EXIT_OK
+        count = export_rows(repository.iter_rows(), args.file, fmt, args.compact, level=args.level)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        # Частковий файл видаляє open_output, наявний args.file не змінюється
+        _error(str(e))
+        return EXIT_FAILED
+    finally:
+        repository.close()
+
+    print(f"{count} lessons exported to {args.file}")
+    return EXIT_OK
+
+
+def cmd_conflicts(args: argparse.Namespace) -> int:
+    """Виводить уроки, що перетинаються в часі."""
+    repository = _open_repository(args)
+    try:
+        conflicts = repository.find_conflicts()
+    finally:
+        repository.close()
+
+    for first, second in conflicts:
+        print(f"{first.day}: {first.start_time}-{first.end_time} {first.subject} (#{first.id})"
+              f" <-> {second.start_time}-{second.end_time} {second.subject} (#{second.id})")
+    print(f"{len(conflicts)} conflicts", file=sys.stderr)
+    return EXIT_FAILED if conflicts else EXIT_OK
+
+
+def cmd_stats(args: argparse.Namespace) -> int:
+    """Виводить кількість уроків загалом та за днями, типами тощо."""
+    repository = _open_repository(args)
+    try:
+        stats = {"total": repository.count()}
+        for column in LessonRepository.GROUP_COLUMNS:
+            stats[column] = dict(repository.count_by(column))
+    finally:
+        repository.close()
+
+    if args.json:
+        print(json.dumps(stats, ensure_ascii=False, indent=2))
+        return EXIT_OK
+
+    print(f"total: {stats['total']}")
+    for column in LessonRepository.GROUP_COLUMNS:
+        print(f"\nby {column}:")
+        for value, count in stats[column].items():
+            print(f"  {value if value is not None else '-'}: {count}")
+    return EXIT_OK
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Створює парсер аргументів командного рядка."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Import, export and check schedules without the GUI."
+    )
+    parser.add_argument("--db", default=DB_PATH, help=f"database file (default: {DB_PATH})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_file_command(name: str, func: Callable, help_text: str) -> argparse.ArgumentParser:
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("file", help="file path; .gz/.bz2/.xz are (de)compressed on the fly")
+        command.add_argument("--format", choices=sorted(FORMATS),
+                             help="file format (default: detected from the extension)")
+        command.set_defaults(func=func)
+        return command
+
+    for name, func, help_text in (("validate", cmd_validate, "check a file without importing it"),
+                                  ("import", cmd_import, "import a file into the database")):
+        command = add_file_command(name, func, help_text)
+        command.add_argument("--parallel", action="store_true",
+                             help="validate large CSV/NDJSON files in several processes")
+        command.add_argument("--workers", type=int, help="number of processes for --parallel")
+        command.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help=argparse.SUPPRESS)
+        command.add_argument("--max-errors", type=int, default=DEFAULT_MAX_ERRORS,
+                             help=f"errors to print (default: {DEFAULT_MAX_ERRORS})")
+        if name == "import":
+            command.add_argument("--mode", choices=("replace", "merge"), default="replace",
+                                 help="replace the schedule or merge into it (default: replace)")
+            command.add_argument("--key", choices=MERGE_KEYS, default="id",
+                                 help="merge key: id or natural (day, start_time, subject, room)")
+
+    command = add_file_command("export", cmd_export, "export all lessons to a file")
+    command.add_argument("--compact", action="store_true", help="compact JSON without indentation")
+    command.add_argument("--level", type=int, choices=range(MIN_LEVEL, MAX_LEVEL + 1),
+                         default=DEFAULT_LEVEL, metavar=f"{{{MIN_LEVEL}-{MAX_LEVEL}}}",
+                         help=f"compression level (default: {DEFAULT_LEVEL})")
+
+    command = commands.add_parser("conflicts", help="list lessons that overlap in time")
+    command.set_defaults(func=cmd_conflicts)
+
+    command = commands.add_parser("stats", help="show lesson counts")
+    command.add_argument("--json", action="store_true", help="print statistics as JSON")
+    command.set_defaults(func=cmd_stats)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Точка входу командного рядка.
+
+    Args:
+        argv (Sequence[str] | None): Аргументи (за замовчуванням sys.argv[1:]).
+
+    Returns:
+        int: Код завершення.
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except BrokenPipeError:
+        # Вивід обрізано (наприклад "| head"): це не помилка команди
+        sys.stdout = open(os.devnull, "w")
+        return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
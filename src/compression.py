@@ -0,0 +1,144 @@
+"""
+Потокове стиснення файлів імпорту та експорту.
+
+Формат стиснення визначається за останнім розширенням файлу (.gz, .bz2,
+.xz). Дані стискаються та розпаковуються потоково кодеками стандартної
+бібліотеки, тому файл ніколи не розпаковується в пам'ять цілком.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+from contextlib import contextmanager
+from typing import IO, BinaryIO, Iterator, Optional, Tuple
+
+# Рівень стиснення за замовчуванням (1 — найшвидше, 9 — найменший файл)
+DEFAULT_LEVEL = 6
+MIN_LEVEL = 1
+MAX_LEVEL = 9
+
+# Розмір буфера файлу на диску
+BUFFER_SIZE = 1024 * 1024
+
+# Помилки пошкодженого стисненого потоку
+CODEC_ERRORS = (OSError, EOFError, lzma.LZMAError)
+
+
+def _gzip(raw: BinaryIO, mode: str, level: int) -> BinaryIO:
+    return gzip.GzipFile(fileobj=raw, mode=mode, compresslevel=level)
+
+
+def _bz2(raw: BinaryIO, mode: str, level: int) -> BinaryIO:
+    return bz2.BZ2File(raw, mode=mode, compresslevel=level)
+
+
+def _xz(raw: BinaryIO, mode: str, level: int) -> BinaryIO:
+    return lzma.LZMAFile(raw, mode=mode, preset=level if mode == "wb" else None)
+
+
+CODECS = {".gz": _gzip, ".bz2": _bz2, ".xz": _xz}
+
+
+def split_compression(file_path: str) -> Tuple[str, Optional[str]]:
+    """
+    Відокремлює розширення стиснення від шляху до файлу.
+
+    Args:
+        file_path (str): Шлях до файлу (наприклад 'dump.json.gz').
+
+    Returns:
+        Tuple[str, Optional[str]]: Шлях без розширення стиснення та саме
+        розширення ('.gz', '.bz2', '.xz') або None.
+    """
+    base, ext = os.path.splitext(file_path)
+    ext = ext.lower()
+    if ext in CODECS:
+        return base, ext
+    return file_path, None
+
+
+def is_compressed(file_path: str) -> bool:
+    """Перевіряє, чи має файл розширення стиснення."""
+    return split_compression(file_path)[1] is not None
+
+
+def clamp_level(level: int) -> int:
+    """Обмежує рівень стиснення діапазоном MIN_LEVEL..MAX_LEVEL."""
+    return max(MIN_LEVEL, min(MAX_LEVEL, int(level)))
+
+
+# Розширення тимчасового файлу, у який пишеться експорт до перейменування
+PARTIAL_SUFFIX = ".part"
+
+
+@contextmanager
+def _open(file_path: str, mode: str, level: int, text: bool,
+          newline: Optional[str], open_path: Optional[str] = None) -> Iterator[Tuple[IO, BinaryIO]]:
+    """Відкриває файл, за потреби обгортаючи його кодеком і текстовим потоком.
+
+    Кодек визначається за file_path, а відкривається open_path (якщо задано).
+    """
+    raw = open(open_path or file_path, mode, buffering=BUFFER_SIZE)
+    stream = None
+    try:
+        codec = CODECS.get(split_compression(file_path)[1])
+        stream = codec(raw, mode, clamp_level(level)) if codec else raw
+        if text:
+            stream = io.TextIOWrapper(stream, encoding='utf-8', newline=newline)
+        yield stream, raw
+    finally:
+        try:
+            if stream is not None:
+                stream.close()
+        finally:
+            raw.close()
+
+
+def open_input(file_path: str, text: bool = True,
+               newline: Optional[str] = None) -> Iterator[Tuple[IO, BinaryIO]]:
+    """
+    Відкриває файл для потокового читання з розпакуванням за розширенням.
+
+    Args:
+        file_path (str): Шлях до файлу.
+        text (bool): Повернути текстовий потік UTF-8 замість байтового.
+        newline (str | None): Параметр newline текстового потоку.
+
+    Returns:
+        Контекстний менеджер, що повертає пару (потік даних, файл на диску).
+        Позиція файлу на диску (raw.tell()) показує прогрес читання.
+    """
+    return _open(file_path, "rb", DEFAULT_LEVEL, text, newline)
+
+
+@contextmanager
+def open_output(file_path: str, level: int = DEFAULT_LEVEL, text: bool = True,
+                newline: Optional[str] = None) -> Iterator[Tuple[IO, BinaryIO]]:
+    """
+    Відкриває файл для потокового запису зі стисненням за розширенням.
+
+    Дані пишуться у тимчасовий файл <file_path>.part поруч із цільовим,
+    який замінює file_path лише після успішного запису. Якщо запис
+    перервано помилкою або скасуванням, тимчасовий файл видаляється, а
+    наявний file_path залишається без змін.
+
+    Args:
+        file_path (str): Шлях до файлу.
+        level (int): Рівень стиснення (1–9).
+        text (bool): Повернути текстовий потік UTF-8 замість байтового.
+        newline (str | None): Параметр newline текстового потоку.
+
+    Returns:
+        Контекстний менеджер, що повертає пару (потік даних, файл на диску).
+    """
+    partial_path = file_path + PARTIAL_SUFFIX
+    try:
+        with _open(file_path, "wb", level, text, newline, open_path=partial_path) as streams:
+            yield streams
+        os.replace(partial_path, file_path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
@@ -1,30 +1,594 @@
 """
-Ініціалізація бази даних
+Ініціалізація бази даних та доступ до уроків.
+
+Усі запити до таблиці lessons проходять через LessonRepository, який
+тримає одне з'єднання SQLite на весь час роботи процесу.
 """
 
+import hashlib
 import sqlite3
 import os
+import threading
+from functools import wraps
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from src.models import Lesson
 
 
 DB_PATH = os.path.join("src/data", "schedule.db")
 
+LESSON_COLUMNS = "id, day, subject, start_time, end_time, type, room, color"
+
+# Колонки, що зберігаються разом з даними уроку під час INSERT
+STORED_COLUMNS = f"{LESSON_COLUMNS}, start_min, end_min, content_hash"
+
+# Версія схеми зберігається у PRAGMA user_version
+SCHEMA_VERSION = 2
+
+# Ключі зіставлення уроків під час злиття
+MERGE_KEYS = ("id", "natural")
+
+
+def _sql_time_to_minutes(column: str) -> str:
+    """Повертає SQL-вираз, що перетворює колонку HH:MM на хвилини."""
+    return f"""
+        CASE WHEN instr({column}, ':') > 0 THEN
+            CAST(substr({column}, 1, instr({column}, ':') - 1) AS INTEGER) * 60
+            + CAST(substr({column}, instr({column}, ':') + 1) AS INTEGER)
+        END
+    """
+
+
+def _content_hash(*values) -> int:
+    """
+    Обчислює стабільний хеш вмісту уроку.
+
+    Хеш не залежить від запуску процесу (на відміну від hash()), тому
+    зберігається в базі даних і дозволяє пропускати незмінені рядки при
+    злитті.
+
+    Args:
+        *values: day, subject, start_time, end_time, type, room, color.
+
+    Returns:
+        int: 64-бітне ціле зі знаком (тип INTEGER у SQLite).
+    """
+    data = "\x1f".join("\x00" if value is None else str(value) for value in values)
+    digest = hashlib.blake2b(data.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+def _lesson_row(lesson: Lesson) -> tuple:
+    """Повертає кортеж значень уроку для INSERT у порядку STORED_COLUMNS."""
+    content = (
+        lesson.day, lesson.subject,
+        lesson.start_time, lesson.end_time,
+        lesson.type, lesson.room, lesson.color
+    )
+    return (lesson.id, *content, lesson.start_min, lesson.end_min, _content_hash(*content))
+
+
+class MergeResult:
+    """Підсумок злиття уроків.
+
+    Attributes:
+        inserted (int): Кількість доданих уроків.
+        updated (int): Кількість уроків, вміст яких змінився.
+        unchanged (int): Кількість уроків, що вже були в базі без змін.
+    """
+
+    __slots__ = ("inserted", "updated", "unchanged")
+
+    def __init__(self, inserted: int = 0, updated: int = 0, unchanged: int = 0):
+        self.inserted = inserted
+        self.updated = updated
+        self.unchanged = unchanged
+
+    @property
+    def total(self) -> int:
+        """Загальна кількість оброблених уроків."""
+        return self.inserted + self.updated + self.unchanged
+
+
+def _synchronized(method: Callable) -> Callable:
+    """Виконує метод репозиторію під блокуванням з'єднання."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class LessonRepository:
+    """Репозиторій уроків з одним довготривалим з'єднанням.
+
+    Налаштування з'єднання (WAL, synchronous, mmap, кеш підготовлених
+    запитів) виконуються один раз при першому зверненні. З'єднання можна
+    використовувати з фонових потоків: доступ до нього серіалізується
+    блокуванням.
+
+    Attributes:
+        db_path (str): Шлях до файлу бази даних.
+    """
+
+    CACHED_STATEMENTS = 256
+    BULK_CHUNK_SIZE = 5000
+    STAGING_TABLE = "temp.lessons_staging"
+    MERGE_TABLE = "temp.lessons_merge"
+    # Колонки, за якими можна групувати статистику
+    GROUP_COLUMNS = ("day", "type", "subject", "room")
+    MMAP_SIZE = 64 * 1024 * 1024
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        f"PRAGMA mmap_size={MMAP_SIZE}",
+    )
+
+    def __init__(self, db_path: str = DB_PATH):
+        """Ініціалізація репозиторію.
+
+        Args:
+            db_path (str): Шлях до файлу бази даних.
+        """
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Повертає відкрите з'єднання, відкриваючи його за потреби."""
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._open()
+            return self._conn
+
+    def _open(self) -> sqlite3.Connection:
+        """Відкриває та налаштовує з'єднання з базою даних."""
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(
+            self.db_path,
+            cached_statements=self.CACHED_STATEMENTS,
+            check_same_thread=False
+        )
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        conn.create_function("lesson_content_hash", 7, _content_hash, deterministic=True)
+        return conn
+
+    def close(self) -> None:
+        """Закриває з'єднання з базою даних."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @_synchronized
+    def init_schema(self) -> None:
+        """Створює таблицю lessons, якщо її немає, та застосовує міграції."""
+        with self.connection as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS lessons (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    day TEXT NOT NULL,
+                    subject TEXT NOT NULL,
+                    start_time TEXT NOT NULL,
+                    end_time TEXT NOT NULL,
+                    type TEXT,
+                    room TEXT,
+                    color TEXT DEFAULT '#00a7e5',
+                    start_min INTEGER,
+                    end_min INTEGER,
+                    content_hash INTEGER
+                )
+            """)
+            self._migrate(conn)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_lessons_day_interval
+                ON lessons (day, start_min, end_min)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_lessons_natural_key
+                ON lessons (day, start_time, subject, room)
+            """)
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """Оновлює схему існуючої бази даних до SCHEMA_VERSION."""
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            self._add_interval_columns(conn)
+        if version < 2:
+            self._add_content_hash(conn)
+        if version < SCHEMA_VERSION:
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    @staticmethod
+    def _add_interval_columns(conn: sqlite3.Connection) -> None:
+        """Додає колонки start_min/end_min та заповнює їх для старих записів."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(lessons)")}
+        for column in ("start_min", "end_min"):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE lessons ADD COLUMN {column} INTEGER")
+        conn.execute(f"""
+            UPDATE lessons SET
+                start_min = {_sql_time_to_minutes("start_time")},
+                end_min = {_sql_time_to_minutes("end_time")}
+        """)
+
+    @staticmethod
+    def _add_content_hash(conn: sqlite3.Connection) -> None:
+        """Додає колонку content_hash та обчислює її для старих записів."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(lessons)")}
+        if "content_hash" not in columns:
+            conn.execute("ALTER TABLE lessons ADD COLUMN content_hash INTEGER")
+        conn.execute("""
+            UPDATE lessons SET content_hash =
+                lesson_content_hash(day, subject, start_time, end_time, type, room, color)
+        """)
+
+    @_synchronized
+    def fetch_all(self) -> List[Lesson]:
+        """Повертає всі уроки, впорядковані за днем та часом початку.
+
+        Returns:
+            List[Lesson]: Список уроків.
+        """
+        cursor = self.connection.execute(
+            f"SELECT {LESSON_COLUMNS} FROM lessons ORDER BY day, start_time"
+        )
+        return [Lesson(*row) for row in cursor.fetchall()]
+
+    def iter_rows(self, batch_size: int = BULK_CHUNK_SIZE) -> Iterator[List[tuple]]:
+        """Потоково повертає рядки таблиці lessons частинами через fetchmany.
+
+        Рядки не перетворюються на об'єкти Lesson, а курсор читає базу
+        поступово, тому пам'ять не залежить від кількості уроків. З'єднання
+        заблоковане, доки генератор не буде вичерпано або закрито.
+
+        Args:
+            batch_size (int): Кількість рядків в одній частині.
+
+        Yields:
+            List[tuple]: Частина рядків у порядку колонок LESSON_COLUMNS.
+        """
+        with self._lock:
+            cursor = self.connection.execute(
+                f"SELECT {LESSON_COLUMNS} FROM lessons ORDER BY day, start_time"
+            )
+            try:
+                while rows := cursor.fetchmany(batch_size):
+                    yield rows
+            finally:
+                cursor.close()
+
+    @_synchronized
+    def count(self) -> int:
+        """Повертає кількість уроків у базі даних."""
+        return self.connection.execute("SELECT COUNT(*) FROM lessons").fetchone()[0]
+
+    @_synchronized
+    def count_by(self, column: str) -> List[Tuple[Optional[str], int]]:
+        """Повертає кількість уроків для кожного значення колонки.
+
+        Args:
+            column (str): Одна з колонок GROUP_COLUMNS.
+
+        Returns:
+            List[Tuple[Optional[str], int]]: Пари (значення, кількість),
+            впорядковані за спаданням кількості.
+
+        Raises:
+            ValueError: Якщо колонка не підтримується.
+        """
+        if column not in self.GROUP_COLUMNS:
+            raise ValueError(f"Unsupported column: {column}")
+        cursor = self.connection.execute(f"""
+            SELECT {column}, COUNT(*) AS total FROM lessons
+            GROUP BY {column} ORDER BY total DESC, {column}
+        """)
+        return cursor.fetchall()
+
+    @_synchronized
+    def find_conflicts(self) -> List[Tuple[Lesson, Lesson]]:
+        """Знаходить усі пари уроків, що перетинаються в часі в один день.
+
+        Для кожного уроку виконується пошук діапазону по індексу
+        (day, start_min, end_min), як у has_conflict.
+
+        Returns:
+            List[Tuple[Lesson, Lesson]]: Пари уроків, що конфліктують.
+        """
+        columns = ", ".join(f"{alias}.{column.strip()}"
+                            for alias in ("a", "b") for column in LESSON_COLUMNS.split(","))
+        cursor = self.connection.execute(f"""
+            SELECT {columns}
+            FROM lessons AS a
+            JOIN lessons AS b INDEXED BY idx_lessons_day_interval
+                ON b.day = a.day AND b.start_min < a.end_min AND b.end_min > a.start_min
+                AND b.id > a.id
+            ORDER BY a.day, a.start_min, b.start_min
+        """)
+        width = len(LESSON_COLUMNS.split(","))
+        return [(Lesson(*row[:width]), Lesson(*row[width:])) for row in cursor.fetchall()]
+
+    @_synchronized
+    def has_conflict(self, lesson: Lesson) -> bool:
+        """Перевіряє, чи є вже урок на цей же час.
+
+        Запит виконується як один пошук діапазону по індексу
+        (day, start_min, end_min).
+
+        Args:
+            lesson (Lesson): Урок для перевірки.
+
+        Returns:
+            bool: True, якщо є конфлікт.
+        """
+        if lesson.start_min is None or lesson.end_min is None:
+            return False
+
+        cursor = self.connection.execute("""
+            SELECT EXISTS (
+                SELECT 1 FROM lessons INDEXED BY idx_lessons_day_interval
+                WHERE day = ? AND start_min < ? AND end_min > ? AND id != ?
+            )
+        """, (
+            lesson.day, lesson.end_min, lesson.start_min,
+            lesson.id or -1  # Для нового уроку id буде None
+        ))
+        return bool(cursor.fetchone()[0])
+
+    @_synchronized
+    def add(self, lesson: Lesson) -> int:
+        """Додає новий урок.
+
+        Args:
+            lesson (Lesson): Урок для додавання.
+
+        Returns:
+            int: Ідентифікатор створеного запису.
+        """
+        with self.connection as conn:
+            cursor = conn.execute(f"""
+                INSERT INTO lessons ({STORED_COLUMNS})
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, _lesson_row(lesson))
+        return cursor.lastrowid
+
+    @_synchronized
+    def update(self, lesson: Lesson) -> bool:
+        """Оновлює один урок за його ідентифікатором.
+
+        Args:
+            lesson (Lesson): Урок з новими даними.
+
+        Returns:
+            bool: True, якщо запис було знайдено та оновлено.
+        """
+        with self.connection as conn:
+            cursor = conn.execute("""
+                UPDATE lessons SET
+                    day = ?, subject = ?, start_time = ?, end_time = ?,
+                    type = ?, room = ?, color = ?, start_min = ?, end_min = ?,
+                    content_hash = ?
+                WHERE id = ?
+            """, _lesson_row(lesson)[1:] + (lesson.id,))
+        return cursor.rowcount > 0
+
+    @_synchronized
+    def delete(self, lesson_id: int) -> bool:
+        """Видаляє один урок.
+
+        Args:
+            lesson_id (int): Ідентифікатор уроку.
+
+        Returns:
+            bool: True, якщо запис було видалено.
+        """
+        with self.connection as conn:
+            cursor = conn.execute("DELETE FROM lessons WHERE id = ?", (lesson_id,))
+        return cursor.rowcount > 0
+
+    @_synchronized
+    def replace_all(self, lessons: Iterable[Lesson],
+                    progress: Optional[Callable[[int], None]] = None) -> int:
+        """Атомарно замінює всі уроки переданими.
+
+        Уроки потоково завантажуються у тимчасову таблицю частинами по
+        BULK_CHUNK_SIZE через executemany. Обмеження таблиці (PRIMARY KEY,
+        NOT NULL) перевіряють дані, після чого вміст підміняється в тій самій
+        транзакції. У разі помилки поточний розклад залишається без змін.
+
+        Args:
+            lessons (Iterable[Lesson]): Нові уроки (може бути генератором).
+            progress (Callable[[int], None] | None): Викликається з кількістю
+                вже завантажених уроків після кожної частини.
+
+        Returns:
+            int: Кількість імпортованих уроків.
+
+        Raises:
+            sqlite3.Error: Якщо дані не пройшли перевірку або сталася помилка БД.
+        """
+        conn = self.connection
+        conn.execute(f"""
+            CREATE TEMP TABLE IF NOT EXISTS {self.STAGING_TABLE} (
+                id INTEGER PRIMARY KEY,
+                day TEXT NOT NULL,
+                subject TEXT NOT NULL,
+                start_time TEXT NOT NULL,
+                end_time TEXT NOT NULL,
+                type TEXT,
+                room TEXT,
+                color TEXT DEFAULT '#00a7e5',
+                start_min INTEGER,
+                end_min INTEGER,
+                content_hash INTEGER
+            )
+        """)
+        rows = (_lesson_row(lesson) for lesson in lessons)
+        staged = 0
+        try:
+            with conn:
+                conn.execute(f"DELETE FROM {self.STAGING_TABLE}")
+                while chunk := list(islice(rows, self.BULK_CHUNK_SIZE)):
+                    conn.executemany(f"""
+                        INSERT INTO {self.STAGING_TABLE} ({STORED_COLUMNS})
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, chunk)
+                    staged += len(chunk)
+                    if progress:
+                        progress(staged)
+
+                conn.execute("DELETE FROM lessons")
+                conn.execute(f"""
+                    INSERT INTO lessons ({STORED_COLUMNS})
+                    SELECT {STORED_COLUMNS} FROM {self.STAGING_TABLE}
+                """)
+        finally:
+            with conn:
+                conn.execute(f"DELETE FROM {self.STAGING_TABLE}")
+        return staged
+
+    @_synchronized
+    def merge_all(self, lessons: Iterable[Lesson], key: str = "id",
+                  progress: Optional[Callable[[int], None]] = None) -> MergeResult:
+        """Додає нові та оновлює існуючі уроки, не чіпаючи решту розкладу.
+
+        Уроки зіставляються за id або за природним ключем (day, start_time,
+        subject, room; порожня кімната та NULL однакові). Якщо ключ
+        повторюється у файлі, береться останній урок з ним. Кожна частина з
+        BULK_CHUNK_SIZE уроків завантажується у тимчасову таблицю, а потім
+        переноситься одним
+        INSERT ... ON CONFLICT(id) DO UPDATE. Рядки з тим самим
+        content_hash не переписуються. Усі частини виконуються в одній
+        транзакції, тож у разі помилки розклад залишається без змін.
+
+        Args:
+            lessons (Iterable[Lesson]): Уроки для злиття (може бути генератором).
+            key (str): Ключ зіставлення: 'id' або 'natural'. Для природного
+                ключа id з файлу ігноруються, а нові уроки отримують нові id.
+            progress (Callable[[int], None] | None): Викликається з кількістю
+                вже оброблених уроків після кожної частини.
+
+        Returns:
+            MergeResult: Кількість доданих, оновлених та незмінених уроків.
+
+        Raises:
+            ValueError: Якщо ключ зіставлення невідомий.
+            sqlite3.Error: Якщо дані не пройшли перевірку або сталася помилка БД.
+        """
+        if key not in MERGE_KEYS:
+            raise ValueError(f"Unknown merge key: {key}")
+
+        conn = self.connection
+        conn.execute(f"""
+            CREATE TEMP TABLE IF NOT EXISTS {self.MERGE_TABLE} (
+                id INTEGER,
+                day TEXT NOT NULL,
+                subject TEXT NOT NULL,
+                start_time TEXT NOT NULL,
+                end_time TEXT NOT NULL,
+                type TEXT,
+                room TEXT,
+                color TEXT DEFAULT '#00a7e5',
+                start_min INTEGER,
+                end_min INTEGER,
+                content_hash INTEGER
+            )
+        """)
+        rows = (_lesson_row(lesson) for lesson in lessons)
+        result = MergeResult()
+        processed = 0
+        try:
+            with conn:
+                while chunk := list(islice(rows, self.BULK_CHUNK_SIZE)):
+                    conn.execute(f"DELETE FROM {self.MERGE_TABLE}")
+                    conn.executemany(f"""
+                        INSERT INTO {self.MERGE_TABLE} ({STORED_COLUMNS})
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, chunk)
+                    # Повтор ключа в одній частині — останній рядок файлу перемагає
+                    if key == "natural":
+                        conn.execute(f"""
+                            DELETE FROM {self.MERGE_TABLE} WHERE rowid NOT IN (
+                                SELECT MAX(rowid) FROM {self.MERGE_TABLE}
+                                GROUP BY day, start_time, subject, COALESCE(room, '')
+                            )
+                        """)
+                        # Порожня кімната з CSV ('') і з JSON (NULL) вважається однаковою
+                        conn.execute(f"""
+                            UPDATE {self.MERGE_TABLE} SET id = (
+                                SELECT l.id FROM lessons AS l INDEXED BY idx_lessons_natural_key
+                                WHERE l.day = lessons_merge.day
+                                    AND l.start_time = lessons_merge.start_time
+                                    AND l.subject = lessons_merge.subject
+                                    AND COALESCE(l.room, '') = COALESCE(lessons_merge.room, '')
+                                ORDER BY l.id LIMIT 1
+                            )
+                        """)
+                    else:
+                        conn.execute(f"""
+                            DELETE FROM {self.MERGE_TABLE} WHERE id IS NOT NULL AND rowid NOT IN (
+                                SELECT MAX(rowid) FROM {self.MERGE_TABLE}
+                                WHERE id IS NOT NULL GROUP BY id
+                            )
+                        """)
+
+                    # Оновлені та незмінені рахуються за різними id цільових уроків
+                    inserted, updated, unchanged = conn.execute(f"""
+                        SELECT
+                            COALESCE(SUM(l.id IS NULL), 0),
+                            COUNT(DISTINCT CASE WHEN l.content_hash IS NOT m.content_hash THEN l.id END),
+                            COUNT(DISTINCT CASE WHEN l.content_hash = m.content_hash THEN l.id END)
+                        FROM {self.MERGE_TABLE} AS m
+                        LEFT JOIN lessons AS l ON l.id = m.id
+                    """).fetchone()
+
+                    # WHERE true потрібен SQLite для розбору ON CONFLICT після SELECT
+                    conn.execute(f"""
+                        INSERT INTO lessons ({STORED_COLUMNS})
+                        SELECT {STORED_COLUMNS} FROM {self.MERGE_TABLE} WHERE true
+                        ORDER BY rowid
+                        ON CONFLICT (id) DO UPDATE SET
+                            day = excluded.day, subject = excluded.subject,
+                            start_time = excluded.start_time, end_time = excluded.end_time,
+                            type = excluded.type, room = excluded.room, color = excluded.color,
+                            start_min = excluded.start_min, end_min = excluded.end_min,
+                            content_hash = excluded.content_hash
+                        WHERE lessons.content_hash IS NOT excluded.content_hash
+                    """)
+
+                    result.inserted += inserted
+                    result.updated += updated
+                    result.unchanged += unchanged
+                    processed += len(chunk)
+                    if progress:
+                        progress(processed)
+        finally:
+            with conn:
+                conn.execute(f"DELETE FROM {self.MERGE_TABLE}")
+        return result
+
+
+_repository: Optional[LessonRepository] = None
+
+
+def get_repository() -> LessonRepository:
+    """Повертає спільний репозиторій уроків.
+
+    Returns:
+        LessonRepository: Єдиний екземпляр репозиторію на процес.
+    """
+    global _repository
+    if _repository is None:
+        _repository = LessonRepository()
+    return _repository
+
 
 def init_db() -> None:
     """Ініціалізує базу даних, створюючи таблицю lessons, якщо її немає."""
-    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS lessons (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            day TEXT NOT NULL,
-            subject TEXT NOT NULL,
-            start_time TEXT NOT NULL,
-            end_time TEXT NOT NULL,
-            type TEXT,
-            room TEXT,
-            color TEXT DEFAULT '#00a7e5'
-        )
-    """)
-    conn.commit()
-    conn.close()
+    get_repository().init_schema()
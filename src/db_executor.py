@@ -0,0 +1,141 @@
+"""
+Фонове виконання операцій з базою даних.
+
+Усі запити до LessonRepository виконуються у пулі з одним потоком, тому
+цикл подій Qt ніколи не блокується на SQLite, а операції зберігають
+порядок надходження. Результати повертаються через сигнали app_signals.
+"""
+
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QRunnable, QThreadPool
+
+from src.database import LessonRepository, get_repository
+from src.models import Lesson
+from src.signals import app_signals
+
+
+class _DatabaseTask(QRunnable):
+    """Завдання пулу потоків, що виконує одну операцію з базою даних."""
+
+    def __init__(self, func: Callable[[], None], error_key: str):
+        """Ініціалізація завдання.
+
+        Args:
+            func: Операція для виконання у фоновому потоці
+            error_key: Ключ перекладу повідомлення про помилку
+        """
+        super().__init__()
+        self._func = func
+        self._error_key = error_key
+
+    def run(self) -> None:
+        """Виконує операцію та повідомляє про помилку через сигнал."""
+        try:
+            self._func()
+        except Exception as e:
+            print(f"Database worker error: {e}")
+            app_signals.db_error.emit(self._error_key)
+
+
+class DatabaseExecutor:
+    """Виконавець операцій з уроками у фоновому потоці.
+
+    Attributes:
+        repository (LessonRepository): Репозиторій уроків.
+    """
+
+    SCHEDULE_REQUEST = "schedule"
+
+    def __init__(self, repository: Optional[LessonRepository] = None):
+        """Ініціалізація виконавця.
+
+        Args:
+            repository: Репозиторій уроків (за замовчуванням спільний)
+        """
+        self.repository = repository or get_repository()
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(1)
+
+    def _submit(self, func: Callable[[], None], error_key: str = "app.database.error") -> None:
+        """Ставить операцію в чергу пулу."""
+        self._pool.start(_DatabaseTask(func, error_key))
+
+    def load_lessons(self, request: str = SCHEDULE_REQUEST) -> None:
+        """Завантажує всі уроки.
+
+        Args:
+            request: Мітка запиту, з якою буде надіслано сигнал lessons_loaded
+        """
+        self._submit(lambda: app_signals.lessons_loaded.emit(request, self.repository.fetch_all()))
+
+    def add_lesson(self, lesson: Lesson) -> None:
+        """Додає урок, якщо він не конфліктує з існуючими.
+
+        Args:
+            lesson: Урок для додавання
+        """
+        def task() -> None:
+            if self.repository.has_conflict(lesson):
+                app_signals.lesson_conflict.emit(lesson)
+                return
+            lesson_id = self.repository.add(lesson)
+            app_signals.lesson_added.emit(lesson.replace(lesson_id=lesson_id))
+
+        self._submit(task)
+
+    def update_lesson(self, lesson: Lesson) -> None:
+        """Зберігає зміни уроку, якщо він не конфліктує з іншими.
+
+        Якщо уроку вже немає в базі (наприклад, його прибрав імпорт),
+        надсилається сигнал lesson_missing.
+
+        Args:
+            lesson: Урок з новими даними
+        """
+        def task() -> None:
+            if self.repository.has_conflict(lesson):
+                app_signals.lesson_conflict.emit(lesson)
+                return
+            if self.repository.update(lesson):
+                app_signals.lesson_saved.emit(lesson)
+            else:
+                app_signals.lesson_missing.emit(lesson.id)
+
+        self._submit(task)
+
+    def delete_lesson(self, lesson_id: int) -> None:
+        """Видаляє урок.
+
+        Якщо уроку вже немає в базі, надсилається сигнал lesson_missing.
+
+        Args:
+            lesson_id: Ідентифікатор уроку
+        """
+        def task() -> None:
+            if self.repository.delete(lesson_id):
+                app_signals.lesson_removed.emit(lesson_id)
+            else:
+                app_signals.lesson_missing.emit(lesson_id)
+
+        self._submit(task)
+
+    def shutdown(self) -> None:
+        """Чекає завершення всіх операцій та закриває з'єднання."""
+        self._pool.waitForDone()
+        self.repository.close()
+
+
+_executor: Optional[DatabaseExecutor] = None
+
+
+def get_executor() -> DatabaseExecutor:
+    """Повертає спільний виконавець операцій з базою даних.
+
+    Returns:
+        DatabaseExecutor: Єдиний екземпляр виконавця на процес.
+    """
+    global _executor
+    if _executor is None:
+        _executor = DatabaseExecutor()
+    return _executor
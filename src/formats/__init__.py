@@ -0,0 +1,22 @@
+"""
+Формати файлів уроків: імпорт, експорт та перевірка без графічного інтерфейсу.
+
+Пакет не імпортує PyQt6. Читачі та записувачі працюють зі шляхами або
+відкритими потоками, а діалоги лише питають шлях і передають його сюди.
+"""
+
+from src.formats.csv_format import CSV_HEADERS, iter_csv_lessons, read_csv_lessons, write_lessons_csv
+from src.formats.json_format import (
+    iter_json_lessons, iter_ndjson_lessons, read_json_lessons, read_ndjson_lessons,
+    write_lessons_json, write_lessons_ndjson
+)
+from src.formats.binary_format import iter_binary_lessons
+from src.formats.parallel import iter_csv_lessons_parallel, iter_ndjson_lessons_parallel
+from src.formats.registry import (
+    FORMATS, LessonFormat, detect_format, export_lessons, export_rows, get_format, iter_lessons,
+    load_lessons, open_file_filters, register_format, write_rows
+)
+from src.formats.report import (
+    DEFAULT_BATCH_SIZE, LESSON_FIELDS, ImportIssue, ImportReport, LessonImportError,
+    lesson_values, validated_lessons
+)
@@ -0,0 +1,62 @@
+"""
+Бінарний знімок розкладу (.schedule) як формат імпорту та експорту.
+
+Структура файлу описана в src.snapshot.
+"""
+
+from typing import Iterator, List, Optional
+
+from src.formats.report import DEFAULT_BATCH_SIZE, ImportReport
+from src.models import Lesson
+from src.snapshot import SnapshotError, SnapshotReader
+
+
+def iter_binary_lessons(file_path: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                        report: Optional[ImportReport] = None) -> Iterator[List[Lesson]]:
+    """
+    Читає уроки з бінарного знімка частинами.
+
+    Записи розпаковуються прямо з відображеного в пам'ять файлу, а день і
+    час уже збережені розібраними, тому повторної нормалізації немає.
+    Номером рядка у звіті є номер запису.
+
+    Args:
+        file_path (str): Шлях до файлу знімка.
+        batch_size (int): Максимальна кількість уроків в одній частині.
+        report (ImportReport | None): Звіт, у який записуються помилки.
+
+    Yields:
+        List[Lesson]: Частина уроків.
+    """
+    report = report if report is not None else ImportReport()
+    try:
+        reader = SnapshotReader(file_path)
+    except SnapshotError as e:
+        report.add_error(0, "parse_error", str(e))
+        return
+
+    seen_ids = set()
+    record = 0
+    with reader:
+        report.bytes_total = reader.size
+        try:
+            for lessons in reader.iter_batches(batch_size):
+                batch = []
+                for lesson in lessons:
+                    record += 1
+                    # Перевірка дублікатів ID
+                    if lesson.id in seen_ids:
+                        report.add_error(record, "duplicate_id", str(lesson.id))
+                        continue
+                    seen_ids.add(lesson.id)
+                    batch.append(lesson)
+
+                report.lessons += len(batch)
+                report.bytes_read = reader.records_offset + record * reader.RECORD_SIZE
+                if batch:
+                    yield batch
+        except (SnapshotError, UnicodeDecodeError) as e:
+            report.add_error(record + 1, "parse_error", str(e))
+            return
+
+    report.bytes_read = report.bytes_total
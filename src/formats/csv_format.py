@@ -0,0 +1,151 @@
+"""
+Формат CSV: запис рядків уроків та потокове читання з перевіркою.
+"""
+
+import csv
+import os
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, TextIO
+
+from src.compression import CODEC_ERRORS, open_input
+from src.formats.report import DEFAULT_BATCH_SIZE, ImportReport
+from src.models import Lesson
+
+CSV_HEADERS = ["ID", "Day", "Subject", "Start_time", "End_time", "Type", "Room", "Color"]
+
+REQUIRED_FIELDS_CVS = {
+    'ID': str,
+    'Day': str,
+    'Subject': str,
+    'Start_time': str,
+    'End_time': str,
+}
+
+
+def write_lessons_csv(batches: Iterable[Sequence[tuple]], f: TextIO) -> int:
+    """
+    Записує частини рядків уроків у CSV потік.
+
+    Args:
+        batches (Iterable[Sequence[tuple]]): Частини рядків у порядку LESSON_COLUMNS.
+        f (TextIO): Відкритий текстовий потік (newline='').
+
+    Returns:
+        int: Кількість записаних уроків.
+    """
+    writer = csv.writer(f)
+    writer.writerow(CSV_HEADERS)
+    count = 0
+    for rows in batches:
+        writer.writerows(rows)
+        count += len(rows)
+    return count
+
+
+def _validate_lesson_fields_cvs(row: dict) -> bool:
+    """Перевіряє, чи всі обов'язкові поля присутні та не є порожніми."""
+    for field, field_type in REQUIRED_FIELDS_CVS.items():
+        value = row.get(field)
+        if not isinstance(value, field_type) or not value:
+            return False
+    return True
+
+
+def _lesson_from_csv_row(row: dict) -> Lesson:
+    """Створює урок з перевіреного рядка CSV."""
+    return Lesson(
+        lesson_id=row['ID'],
+        day=row['Day'],
+        subject=row['Subject'],
+        start_time=row['Start_time'],
+        end_time=row['End_time'],
+        lesson_type=row.get('Type', ''),
+        room=row.get('Room', ''),
+        color=row.get('Color', '')
+    )
+
+
+def read_csv_lessons(f: TextIO, batch_size: int = DEFAULT_BATCH_SIZE,
+                     report: Optional[ImportReport] = None,
+                     tell: Optional[Callable[[], int]] = None) -> Iterator[List[Lesson]]:
+    """
+    Потоково читає уроки з текстового CSV потоку частинами.
+
+    Некоректні рядки не зупиняють читання, а потрапляють у звіт з номером
+    рядка та причиною.
+
+    Args:
+        f (TextIO): Відкритий текстовий потік (newline='').
+        batch_size (int): Максимальна кількість уроків в одній частині.
+        report (ImportReport | None): Звіт, у який записуються помилки.
+        tell (Callable[[], int] | None): Повертає кількість прочитаних
+            байтів для report.bytes_read.
+
+    Yields:
+        List[Lesson]: Частина коректних уроків.
+    """
+    report = report if report is not None else ImportReport()
+    seen_ids = set()
+    batch = []
+    reader = csv.DictReader(f)
+
+    try:
+        # Перевірка заголовків
+        fieldnames = reader.fieldnames or []
+        missing_headers = [h for h in REQUIRED_FIELDS_CVS if h not in fieldnames]
+        if missing_headers:
+            report.add_error(1, "missing_headers", ", ".join(missing_headers))
+            return
+
+        for row in reader:
+            line = reader.line_num
+            lesson_id = row.get("ID")
+
+            # Перевірка на пусті/відсутні обов'язкові поля
+            if not _validate_lesson_fields_cvs(row):
+                report.add_error(line, "invalid_fields")
+                continue
+
+            # Перевірка дублікатів ID
+            if lesson_id in seen_ids:
+                report.add_error(line, "duplicate_id", lesson_id)
+                continue
+            seen_ids.add(lesson_id)
+
+            batch.append(_lesson_from_csv_row(row))
+            report.lessons += 1
+            if len(batch) >= batch_size:
+                if tell:
+                    report.bytes_read = tell()
+                yield batch
+                batch = []
+
+    except (csv.Error, UnicodeDecodeError, *CODEC_ERRORS) as e:
+        report.add_error(reader.line_num, "parse_error", str(e))
+        return
+
+    if tell:
+        report.bytes_read = tell()
+    if batch:
+        yield batch
+
+
+def iter_csv_lessons(file_path: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                     report: Optional[ImportReport] = None) -> Iterator[List[Lesson]]:
+    """
+    Потоково читає уроки з CSV файлу частинами.
+
+    Файл читається рядок за рядком, тому пам'ять не залежить від його
+    розміру.
+
+    Args:
+        file_path (str): Шлях до CSV файлу (можливо стисненого).
+        batch_size (int): Максимальна кількість уроків в одній частині.
+        report (ImportReport | None): Звіт, у який записуються помилки.
+
+    Yields:
+        List[Lesson]: Частина коректних уроків.
+    """
+    report = report if report is not None else ImportReport()
+    with open_input(file_path, newline='') as (f, raw):
+        report.bytes_total = os.fstat(raw.fileno()).st_size
+        yield from read_csv_lessons(f, batch_size, report, raw.tell)
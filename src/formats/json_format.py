@@ -0,0 +1,240 @@
+"""
+Формати JSON (масив уроків) та NDJSON (один урок на рядок).
+"""
+
+import json
+import os
+from typing import IO, Callable, Iterable, Iterator, List, Optional, Sequence, TextIO
+
+from src.compression import CODEC_ERRORS, open_input
+from src.formats.report import DEFAULT_BATCH_SIZE, LESSON_FIELDS, ImportReport
+from src.json_stream import JsonArrayReader, JsonStreamError
+from src.models import Lesson
+
+REQUIRED_FIELDS_JSON = {
+    'id': int,
+    'day': str,
+    'subject': str,
+    'start_time': str,
+    'end_time': str,
+}
+
+
+def write_lessons_json(batches: Iterable[Sequence[tuple]], f: TextIO, compact: bool = False) -> int:
+    """
+    Записує частини рядків уроків у потік як JSON масив.
+
+    Масив формується поступово, тому список словників для всього
+    розкладу не створюється.
+
+    Args:
+        batches (Iterable[Sequence[tuple]]): Частини рядків у порядку LESSON_COLUMNS.
+        f (TextIO): Відкритий текстовий потік.
+        compact (bool): Записати без відступів і пробілів.
+
+    Returns:
+        int: Кількість записаних уроків.
+    """
+    if compact:
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        first_sep, sep, end = "", ",", "]"
+    else:
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=4)
+        first_sep, sep, end = "\n    ", ",\n    ", "\n]"
+
+    f.write("[")
+    count = 0
+    for rows in batches:
+        for row in rows:
+            text = encoder.encode(dict(zip(LESSON_FIELDS, row)))
+            if not compact:
+                text = text.replace("\n", "\n    ")
+            f.write(sep if count else first_sep)
+            f.write(text)
+            count += 1
+    f.write(end if count else "]")
+    return count
+
+
+def write_lessons_ndjson(batches: Iterable[Sequence[tuple]], f: TextIO) -> int:
+    """
+    Записує частини рядків уроків у потік як NDJSON (один об'єкт на рядок).
+
+    Args:
+        batches (Iterable[Sequence[tuple]]): Частини рядків у порядку LESSON_COLUMNS.
+        f (TextIO): Відкритий текстовий потік.
+
+    Returns:
+        int: Кількість записаних уроків.
+    """
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    count = 0
+    for rows in batches:
+        f.writelines(encoder.encode(dict(zip(LESSON_FIELDS, row))) + "\n" for row in rows)
+        count += len(rows)
+    return count
+
+
+def _validate_lesson_fields_json(row: dict) -> bool:
+    """Перевіряє, чи всі обов'язкові поля присутні та не є порожніми."""
+    for field, field_type in REQUIRED_FIELDS_JSON.items():
+        value = row.get(field)
+        if not isinstance(value, field_type) or not value:
+            return False
+    return True
+
+
+def read_json_lessons(f: TextIO, batch_size: int = DEFAULT_BATCH_SIZE,
+                      report: Optional[ImportReport] = None,
+                      tell: Optional[Callable[[], int]] = None) -> Iterator[List[Lesson]]:
+    """
+    Потоково читає уроки з текстового потоку з JSON масивом частинами.
+
+    Масив розбирається інкрементно по одному об'єкту, тому пікове
+    використання пам'яті визначається розміром частини, а не файлу.
+
+    Args:
+        f (TextIO): Відкритий текстовий потік.
+        batch_size (int): Максимальна кількість уроків в одній частині.
+        report (ImportReport | None): Звіт, у який записуються помилки.
+        tell (Callable[[], int] | None): Повертає кількість прочитаних
+            байтів для report.bytes_read.
+
+    Yields:
+        List[Lesson]: Частина коректних уроків.
+    """
+    report = report if report is not None else ImportReport()
+    seen_ids = set()
+    batch = []
+
+    try:
+        for line, item in JsonArrayReader(f):
+            # Перевірка обов'язкових полів
+            if not isinstance(item, dict) or not _validate_lesson_fields_json(item):
+                report.add_error(line, "invalid_fields")
+                continue
+
+            # Перевірка дублікатів ID
+            lesson_id = item["id"]
+            if lesson_id in seen_ids:
+                report.add_error(line, "duplicate_id", str(lesson_id))
+                continue
+            seen_ids.add(lesson_id)
+
+            batch.append(Lesson.from_dict(item))
+            report.lessons += 1
+            if len(batch) >= batch_size:
+                if tell:
+                    report.bytes_read = tell()
+                yield batch
+                batch = []
+
+    except JsonStreamError as e:
+        report.add_error(e.line, "parse_error", str(e))
+        return
+    except (UnicodeDecodeError, *CODEC_ERRORS) as e:
+        report.add_error(0, "parse_error", str(e))
+        return
+
+    if tell:
+        report.bytes_read = tell()
+    if batch:
+        yield batch
+
+
+def iter_json_lessons(file_path: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                      report: Optional[ImportReport] = None) -> Iterator[List[Lesson]]:
+    """
+    Потоково читає уроки з JSON файлу частинами.
+
+    Args:
+        file_path (str): Шлях до JSON файлу (можливо стисненого).
+        batch_size (int): Максимальна кількість уроків в одній частині.
+        report (ImportReport | None): Звіт, у який записуються помилки.
+
+    Yields:
+        List[Lesson]: Частина коректних уроків.
+    """
+    report = report if report is not None else ImportReport()
+    with open_input(file_path) as (f, raw):
+        report.bytes_total = os.fstat(raw.fileno()).st_size
+        yield from read_json_lessons(f, batch_size, report, raw.tell)
+
+
+def read_ndjson_lessons(f: IO, batch_size: int = DEFAULT_BATCH_SIZE,
+                        report: Optional[ImportReport] = None,
+                        tell: Optional[Callable[[], int]] = None) -> Iterator[List[Lesson]]:
+    """
+    Потоково читає уроки з NDJSON потоку (один JSON об'єкт на рядок) частинами.
+
+    Args:
+        f (IO): Відкритий байтовий або текстовий потік.
+        batch_size (int): Максимальна кількість уроків в одній частині.
+        report (ImportReport | None): Звіт, у який записуються помилки.
+        tell (Callable[[], int] | None): Повертає кількість прочитаних
+            байтів для report.bytes_read.
+
+    Yields:
+        List[Lesson]: Частина коректних уроків.
+    """
+    report = report if report is not None else ImportReport()
+    seen_ids = set()
+    batch = []
+
+    try:
+        for line, data in enumerate(f, start=1):
+            if not data.strip():
+                continue
+            try:
+                item = json.loads(data)
+            except ValueError as e:
+                report.add_error(line, "parse_error", str(e))
+                continue
+
+            # Перевірка обов'язкових полів
+            if not isinstance(item, dict) or not _validate_lesson_fields_json(item):
+                report.add_error(line, "invalid_fields")
+                continue
+
+            # Перевірка дублікатів ID
+            lesson_id = item["id"]
+            if lesson_id in seen_ids:
+                report.add_error(line, "duplicate_id", str(lesson_id))
+                continue
+            seen_ids.add(lesson_id)
+
+            batch.append(Lesson.from_dict(item))
+            report.lessons += 1
+            if len(batch) >= batch_size:
+                if tell:
+                    report.bytes_read = tell()
+                yield batch
+                batch = []
+
+    except CODEC_ERRORS as e:
+        report.add_error(0, "parse_error", str(e))
+        return
+
+    if tell:
+        report.bytes_read = tell()
+    if batch:
+        yield batch
+
+
+def iter_ndjson_lessons(file_path: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                        report: Optional[ImportReport] = None) -> Iterator[List[Lesson]]:
+    """
+    Потоково читає уроки з NDJSON файлу частинами.
+
+    Args:
+        file_path (str): Шлях до NDJSON файлу (можливо стисненого).
+        batch_size (int): Максимальна кількість уроків в одній частині.
+        report (ImportReport | None): Звіт, у який записуються помилки.
+
+    Yields:
+        List[Lesson]: Частина коректних уроків.
+    """
+    report = report if report is not None else ImportReport()
+    with open_input(file_path, text=False) as (f, raw):
+        report.bytes_total = os.fstat(raw.fileno()).st_size
+        yield from read_ndjson_lessons(f, batch_size, report, raw.tell)
@@ -0,0 +1,303 @@
+"""
+Паралельна перевірка великих файлів імпорту.
+
+Файл CSV або NDJSON ділиться на діапазони байтів, межі яких завжди
+припадають на кінець запису. Кожен діапазон перевіряється та
+нормалізується (розбір дня й часу в Lesson) в окремому процесі
+ProcessPoolExecutor, а результати об'єднуються в порядку файлу. Дублікати
+ID шукаються під час об'єднання, тому звіт про помилки збігається зі
+звітом послідовного імпорту.
+
+JSON масиви неможливо безпечно поділити без повного розбору, тому вони
+завжди читаються послідовно.
+"""
+
+import csv
+import io
+import json
+import mmap
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Deque, Generator, Iterator, List, Optional, Tuple
+
+from src.compression import is_compressed
+from src.formats.csv_format import (
+    REQUIRED_FIELDS_CVS, _lesson_from_csv_row, _validate_lesson_fields_cvs, iter_csv_lessons
+)
+from src.formats.json_format import _validate_lesson_fields_json, iter_ndjson_lessons
+from src.formats.report import DEFAULT_BATCH_SIZE, ImportReport
+from src.models import Lesson
+
+# Розмір діапазону байтів, що перевіряється одним процесом
+PARALLEL_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Результат перевірки одного запису: (рядок у діапазоні, урок або None, причина, деталі)
+ChunkEntry = Tuple[int, Optional[Lesson], str, str]
+
+
+def _split_ranges(file_path: str, start: int, chunk_size: int,
+                  quoted: bool) -> Iterator[Tuple[int, int]]:
+    """
+    Ділить файл на діапазони байтів, що закінчуються символом нового рядка.
+
+    Для CSV враховується парність лапок: межа не може потрапити всередину
+    поля в лапках, яке містить перенесення рядка.
+
+    Args:
+        file_path (str): Шлях до файлу.
+        start (int): Зміщення першого запису (після заголовка).
+        chunk_size (int): Бажаний розмір діапазону.
+        quoted (bool): Враховувати поля в лапках (CSV).
+
+    Yields:
+        Tuple[int, int]: Початок і кінець діапазону.
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if start >= size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = start
+            while pos < size:
+                end = pos + chunk_size
+                if end >= size:
+                    yield pos, size
+                    return
+                inside_quotes = quoted and mm[pos:end].count(b'"') % 2 == 1
+                while True:
+                    newline = mm.find(b"\n", end)
+                    if newline == -1:
+                        end = size
+                        break
+                    if quoted and mm[end:newline].count(b'"') % 2 == 1:
+                        inside_quotes = not inside_quotes
+                    end = newline + 1
+                    if not inside_quotes:
+                        break
+                yield pos, end
+                pos = end
+
+
+def _read_range(file_path: str, start: int, end: int) -> bytes:
+    """Читає діапазон байтів файлу."""
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
+def _decode_range(data: bytes) -> Tuple[Optional[str], List[ChunkEntry]]:
+    """Декодує діапазон як UTF-8 або повертає помилку з номером рядка."""
+    try:
+        return data.decode('utf-8'), []
+    except UnicodeDecodeError as e:
+        return None, [(data.count(b"\n", 0, e.start) + 1, None, "parse_error", str(e))]
+
+
+def _check_csv_range(file_path: str, start: int, end: int,
+                     fieldnames: List[str]) -> Tuple[List[ChunkEntry], int]:
+    """
+    Перевіряє записи CSV у діапазоні байтів (виконується в дочірньому процесі).
+
+    Args:
+        file_path (str): Шлях до CSV файлу.
+        start (int): Початок діапазону.
+        end (int): Кінець діапазону.
+        fieldnames (List[str]): Заголовки колонок з першого рядка файлу.
+
+    Returns:
+        Tuple[List[ChunkEntry], int]: Результати записів та кількість рядків у діапазоні.
+    """
+    data = _read_range(file_path, start, end)
+    text, entries = _decode_range(data)
+    if text is None:
+        return entries, data.count(b"\n")
+
+    reader = csv.DictReader(io.StringIO(text, newline=''), fieldnames=fieldnames)
+    try:
+        for row in reader:
+            if _validate_lesson_fields_cvs(row):
+                entries.append((reader.line_num, _lesson_from_csv_row(row), "", ""))
+            else:
+                entries.append((reader.line_num, None, "invalid_fields", ""))
+    except csv.Error as e:
+        entries.append((reader.line_num, None, "parse_error", str(e)))
+    return entries, data.count(b"\n")
+
+
+def _check_ndjson_range(file_path: str, start: int, end: int) -> Tuple[List[ChunkEntry], int]:
+    """
+    Перевіряє записи NDJSON у діапазоні байтів (виконується в дочірньому процесі).
+
+    Args:
+        file_path (str): Шлях до NDJSON файлу.
+        start (int): Початок діапазону.
+        end (int): Кінець діапазону.
+
+    Returns:
+        Tuple[List[ChunkEntry], int]: Результати записів та кількість рядків у діапазоні.
+    """
+    data = _read_range(file_path, start, end)
+    entries = []
+    for line, raw in enumerate(data.split(b"\n"), start=1):
+        if not raw.strip():
+            continue
+        try:
+            item = json.loads(raw)
+        except ValueError as e:
+            entries.append((line, None, "parse_error", str(e)))
+            continue
+        if isinstance(item, dict) and _validate_lesson_fields_json(item):
+            entries.append((line, Lesson.from_dict(item), "", ""))
+        else:
+            entries.append((line, None, "invalid_fields", ""))
+    return entries, data.count(b"\n")
+
+
+def _merge_ranges(check: Callable, file_path: str, ranges: Generator[Tuple[int, int], None, None],
+                  args: tuple, first_line: int, batch_size: int, report: ImportReport,
+                  workers: Optional[int]) -> Iterator[List[Lesson]]:
+    """
+    Перевіряє діапазони в пулі процесів та об'єднує результати в порядку файлу.
+
+    Одночасно в роботі знаходиться не більше двох діапазонів на процес,
+    тому пам'ять обмежена розміром діапазону, а не файлу.
+
+    Args:
+        check (Callable): Функція перевірки діапазону.
+        file_path (str): Шлях до файлу.
+        ranges (Generator): Діапазони байтів з _split_ranges.
+        args (tuple): Додаткові аргументи функції перевірки.
+        first_line (int): Номер рядка файлу, з якого починається перший діапазон.
+        batch_size (int): Максимальна кількість уроків в одній частині.
+        report (ImportReport): Звіт, у який записуються помилки.
+        workers (int | None): Кількість процесів (за замовчуванням — кількість ядер).
+
+    Yields:
+        List[Lesson]: Частина коректних уроків.
+    """
+    workers = workers or os.cpu_count() or 1
+    # spawn не копіює потоки Qt батьківського процесу
+    pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+    pending: Deque[Tuple[int, Future]] = deque()
+    seen_ids = set()
+    batch = []
+
+    def submit_next() -> None:
+        bounds = next(ranges, None)
+        if bounds is not None:
+            pending.append((bounds[1], pool.submit(check, file_path, *bounds, *args)))
+
+    try:
+        for _ in range(workers * 2):
+            submit_next()
+
+        while pending:
+            end, future = pending.popleft()
+            entries, line_count = future.result()
+            submit_next()
+
+            for line, lesson, reason, detail in entries:
+                line += first_line - 1
+                if lesson is None:
+                    report.add_error(line, reason, detail)
+                    # Як і при послідовному читанні, помилка розбору зупиняє імпорт
+                    if reason == "parse_error" and check is _check_csv_range:
+                        return
+                    continue
+
+                # Перевірка дублікатів ID між усіма діапазонами
+                if lesson.id in seen_ids:
+                    report.add_error(line, "duplicate_id", str(lesson.id))
+                    continue
+                seen_ids.add(lesson.id)
+
+                batch.append(lesson)
+                report.lessons += 1
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+
+            first_line += line_count
+            report.bytes_read = end
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        ranges.close()
+
+    if batch:
+        yield batch
+
+
+def iter_csv_lessons_parallel(file_path: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                              report: Optional[ImportReport] = None, workers: Optional[int] = None,
+                              chunk_size: int = PARALLEL_CHUNK_SIZE) -> Iterator[List[Lesson]]:
+    """
+    Читає уроки з CSV файлу, перевіряючи діапазони файлу паралельно.
+
+    Повертає ті самі частини та звіт, що й iter_csv_lessons. Стиснені
+    файли та файли, менші за один діапазон, читаються послідовно.
+
+    Args:
+        file_path (str): Шлях до CSV файлу.
+        batch_size (int): Максимальна кількість уроків в одній частині.
+        report (ImportReport | None): Звіт, у який записуються помилки.
+        workers (int | None): Кількість процесів.
+        chunk_size (int): Розмір діапазону байтів для одного процесу.
+
+    Yields:
+        List[Lesson]: Частина коректних уроків.
+    """
+    report = report if report is not None else ImportReport()
+    if is_compressed(file_path) or os.path.getsize(file_path) <= chunk_size:
+        yield from iter_csv_lessons(file_path, batch_size, report)
+        return
+
+    with open(file_path, 'rb') as f:
+        report.bytes_total = os.fstat(f.fileno()).st_size
+        header = f.readline()
+    try:
+        fieldnames = next(csv.reader([header.decode('utf-8')]), [])
+    except (csv.Error, UnicodeDecodeError) as e:
+        report.add_error(1, "parse_error", str(e))
+        return
+
+    # Перевірка заголовків
+    missing_headers = [h for h in REQUIRED_FIELDS_CVS if h not in fieldnames]
+    if missing_headers:
+        report.add_error(1, "missing_headers", ", ".join(missing_headers))
+        return
+
+    ranges = _split_ranges(file_path, len(header), chunk_size, quoted=True)
+    yield from _merge_ranges(_check_csv_range, file_path, ranges, (fieldnames,), 2, batch_size, report, workers)
+    report.bytes_read = report.bytes_total
+
+
+def iter_ndjson_lessons_parallel(file_path: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                                 report: Optional[ImportReport] = None, workers: Optional[int] = None,
+                                 chunk_size: int = PARALLEL_CHUNK_SIZE) -> Iterator[List[Lesson]]:
+    """
+    Читає уроки з NDJSON файлу, перевіряючи діапазони файлу паралельно.
+
+    Повертає ті самі частини та звіт, що й iter_ndjson_lessons. Стиснені
+    файли та файли, менші за один діапазон, читаються послідовно.
+
+    Args:
+        file_path (str): Шлях до NDJSON файлу.
+        batch_size (int): Максимальна кількість уроків в одній частині.
+        report (ImportReport | None): Звіт, у який записуються помилки.
+        workers (int | None): Кількість процесів.
+        chunk_size (int): Розмір діапазону байтів для одного процесу.
+
+    Yields:
+        List[Lesson]: Частина коректних уроків.
+    """
+    report = report if report is not None else ImportReport()
+    if is_compressed(file_path) or os.path.getsize(file_path) <= chunk_size:
+        yield from iter_ndjson_lessons(file_path, batch_size, report)
+        return
+
+    report.bytes_total = os.path.getsize(file_path)
+    ranges = _split_ranges(file_path, 0, chunk_size, quoted=False)
+    yield from _merge_ranges(_check_ndjson_range, file_path, ranges, (), 1, batch_size, report, workers)
+    report.bytes_read = report.bytes_total
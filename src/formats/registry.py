@@ -0,0 +1,282 @@
+"""
+Реєстр форматів файлів уроків.
+
+Кожен формат (LessonFormat) описує розширення файлу, функцію запису в
+потік та читачі файлу. Функції модуля приймають шляхи або відкриті
+потоки й не залежать від Qt, тому ними користуються діалоги, фонові
+завдання та командний рядок. Новий формат додається через register_format.
+"""
+
+import os
+from typing import Callable, Dict, IO, Iterable, Iterator, List, Optional, Sequence
+
+from src.compression import CODECS, DEFAULT_LEVEL, is_compressed, open_output, split_compression
+from src.formats.binary_format import iter_binary_lessons
+from src.formats.csv_format import iter_csv_lessons, write_lessons_csv
+from src.formats.json_format import (
+    iter_json_lessons, iter_ndjson_lessons, write_lessons_json, write_lessons_ndjson
+)
+from src.formats.parallel import iter_csv_lessons_parallel, iter_ndjson_lessons_parallel
+from src.formats.report import (
+    DEFAULT_BATCH_SIZE, ImportReport, lesson_values, validated_lessons
+)
+from src.models import Lesson
+from src.snapshot import write_snapshot
+
+# Назви кодеків для фільтрів діалогів збереження
+CODEC_NAMES = {".gz": "Gzip", ".bz2": "Bzip2", ".xz": "XZ"}
+
+
+class LessonFormat:
+    """Опис формату файлу уроків.
+
+    Attributes:
+        name (str): Ключ формату ('csv', 'json', ...).
+        extension (str): Розширення файлу без розширення стиснення.
+        title (str): Назва формату для фільтрів діалогів.
+        write (Callable): Записує частини рядків у відкритий потік:
+            (batches, f, compact) -> кількість уроків.
+        read (Callable): Читає файл частинами уроків:
+            (file_path, batch_size, report) -> Iterator[List[Lesson]].
+        read_parallel (Callable | None): Читач, що перевіряє файл у пулі
+            процесів (додатково приймає workers).
+        text (bool): write отримує текстовий потік (False — байтовий).
+        newline (str | None): Параметр newline текстового потоку.
+        compressible (bool): Чи можна стискати файли формату.
+    """
+
+    __slots__ = ("name", "extension", "title", "write", "read", "read_parallel",
+                 "text", "newline", "compressible")
+
+    def __init__(self, name: str, extension: str, title: str, write: Callable, read: Callable,
+                 read_parallel: Optional[Callable] = None, text: bool = True,
+                 newline: Optional[str] = None, compressible: bool = True):
+        self.name = name
+        self.extension = extension
+        self.title = title
+        self.write = write
+        self.read = read
+        self.read_parallel = read_parallel
+        self.text = text
+        self.newline = newline
+        self.compressible = compressible
+
+    def __repr__(self) -> str:
+        return f"LessonFormat(name={self.name!r}, extension={self.extension!r})"
+
+    @property
+    def save_filter(self) -> str:
+        """Фільтр діалогу збереження: звичайний файл та кожен кодек окремо."""
+        filters = [f"{self.title} Files (*{self.extension})"]
+        if self.compressible:
+            filters += [f"{name} {self.title} (*{self.extension}{ext})" for ext, name in CODEC_NAMES.items()]
+        return ";;".join(filters)
+
+    @property
+    def open_filter(self) -> str:
+        """Фільтр діалогу відкриття, що включає стиснені файли."""
+        patterns = [f"*{self.extension}"]
+        if self.compressible:
+            patterns += [f"*{self.extension}{ext}" for ext in CODECS]
+        return f"{self.title} Files ({' '.join(patterns)})"
+
+
+# Зареєстровані формати за ключем
+FORMATS: Dict[str, LessonFormat] = {}
+
+
+def register_format(fmt: LessonFormat) -> LessonFormat:
+    """
+    Додає формат до реєстру (або замінює формат з тим самим ключем).
+
+    Args:
+        fmt (LessonFormat): Опис формату.
+
+    Returns:
+        LessonFormat: Той самий опис формату.
+    """
+    FORMATS[fmt.name] = fmt
+    return fmt
+
+
+def get_format(name: str) -> LessonFormat:
+    """
+    Повертає формат за ключем.
+
+    Raises:
+        ValueError: Якщо формат не зареєстровано.
+    """
+    try:
+        return FORMATS[name]
+    except KeyError:
+        raise ValueError(f"Unsupported format: {name}") from None
+
+
+def detect_format(file_path: str) -> Optional[str]:
+    """
+    Визначає формат файлу за розширенням, ігноруючи розширення стиснення.
+
+    Args:
+        file_path (str): Шлях до файлу (наприклад 'dump.json.gz').
+
+    Returns:
+        Optional[str]: Ключ формату або None, якщо формат не підтримується.
+    """
+    base_path, codec = split_compression(file_path)
+    ext = os.path.splitext(base_path)[1].lower()
+    for fmt in FORMATS.values():
+        if ext == fmt.extension:
+            return None if codec is not None and not fmt.compressible else fmt.name
+    return None
+
+
+def open_file_filters() -> str:
+    """Повертає фільтр діалогу відкриття для всіх зареєстрованих форматів."""
+    return ";;".join(fmt.open_filter for fmt in FORMATS.values())
+
+
+def write_rows(batches: Iterable[Sequence[tuple]], f: IO, fmt: str, compact: bool = False) -> int:
+    """
+    Записує частини рядків уроків у відкритий потік.
+
+    Args:
+        batches (Iterable[Sequence[tuple]]): Частини рядків у порядку LESSON_COLUMNS.
+        f (IO): Текстовий або байтовий потік (див. LessonFormat.text).
+        fmt (str): Ключ формату.
+        compact (bool): Компактний JSON без відступів.
+
+    Returns:
+        int: Кількість записаних уроків.
+    """
+    return get_format(fmt).write(batches, f, compact)
+
+
+def _track_written(batches: Iterable[Sequence[tuple]], f,
+                   progress: Callable[[int, int], None]) -> Iterator[Sequence[tuple]]:
+    """Передає частини рядків далі, повідомляючи про кількість записаних байтів."""
+    for rows in batches:
+        yield rows
+        progress(len(rows), f.tell())
+
+
+def export_rows(batches: Iterable[Sequence[tuple]], file_path: str, fmt: str,
+                compact: bool = False,
+                progress: Optional[Callable[[int, int], None]] = None,
+                level: int = DEFAULT_LEVEL) -> int:
+    """
+    Записує частини рядків уроків у файл вибраного формату.
+
+    Якщо шлях закінчується на .gz, .bz2 або .xz, дані потоково стискаються
+    відповідним кодеком.
+
+    Args:
+        batches (Iterable[Sequence[tuple]]): Частини рядків, наприклад
+            LessonRepository.iter_rows().
+        file_path (str): Шлях до файлу.
+        fmt (str): Ключ формату ('csv', 'json', 'ndjson' або 'binary').
+        compact (bool): Компактний JSON без відступів.
+        progress (Callable[[int, int], None] | None): Викликається після
+            кожної частини з кількістю її рядків та розміром файлу в байтах.
+        level (int): Рівень стиснення (1–9).
+
+    Returns:
+        int: Кількість записаних уроків.
+
+    Raises:
+        ValueError: Якщо формат невідомий або не підтримує стиснення.
+    """
+    file_format = get_format(fmt)
+    if is_compressed(file_path) and not file_format.compressible:
+        raise ValueError(f"{file_format.title} files cannot be compressed")
+
+    with open_output(file_path, level, text=file_format.text, newline=file_format.newline) as (f, raw):
+        if progress:
+            batches = _track_written(batches, raw, progress)
+        return file_format.write(batches, f, compact)
+
+
+def export_lessons(lessons: Iterable[Lesson], file_path: str, fmt: str,
+                   compact: bool = False, level: int = DEFAULT_LEVEL) -> int:
+    """
+    Записує список уроків у файл вибраного формату.
+
+    Args:
+        lessons (Iterable[Lesson]): Уроки для експорту.
+        file_path (str): Шлях до файлу.
+        fmt (str): Ключ формату.
+        compact (bool): Компактний JSON без відступів.
+        level (int): Рівень стиснення (1–9).
+
+    Returns:
+        int: Кількість записаних уроків.
+    """
+    return export_rows([[lesson_values(lesson) for lesson in lessons]], file_path, fmt, compact, level=level)
+
+
+def iter_lessons(file_path: str, fmt: Optional[str] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                 report: Optional[ImportReport] = None, parallel: bool = False,
+                 workers: Optional[int] = None) -> Iterator[List[Lesson]]:
+    """
+    Створює генератор частин уроків з файлу.
+
+    Args:
+        file_path (str): Шлях до файлу.
+        fmt (str | None): Ключ формату (за замовчуванням — за розширенням).
+        batch_size (int): Максимальна кількість уроків в одній частині.
+        report (ImportReport | None): Звіт, у який записуються помилки.
+        parallel (bool): Перевіряти файл у пулі процесів, якщо формат це підтримує.
+        workers (int | None): Кількість процесів для parallel.
+
+    Returns:
+        Iterator[List[Lesson]]: Частини коректних уроків.
+
+    Raises:
+        ValueError: Якщо формат невідомий.
+    """
+    file_format = get_format(fmt or detect_format(file_path))
+    if parallel and file_format.read_parallel is not None:
+        return file_format.read_parallel(file_path, batch_size, report, workers=workers)
+    return file_format.read(file_path, batch_size, report)
+
+
+def load_lessons(file_path: str, fmt: Optional[str] = None) -> List[Lesson]:
+    """
+    Читає всі уроки з файлу.
+
+    Args:
+        file_path (str): Шлях до файлу.
+        fmt (str | None): Ключ формату (за замовчуванням — за розширенням).
+
+    Returns:
+        List[Lesson]: Список уроків.
+
+    Raises:
+        ValueError: Якщо формат невідомий.
+        LessonImportError: Якщо файл містить помилки або не містить уроків.
+    """
+    report = ImportReport()
+    return list(validated_lessons(iter_lessons(file_path, fmt, report=report), report))
+
+
+register_format(LessonFormat(
+    "csv", ".csv", "CSV",
+    write=lambda batches, f, compact: write_lessons_csv(batches, f),
+    read=iter_csv_lessons, read_parallel=iter_csv_lessons_parallel, newline='',
+))
+register_format(LessonFormat(
+    "json", ".json", "JSON",
+    write=write_lessons_json,
+    # JSON масив не ділиться на діапазони, тому читається лише послідовно
+    read=iter_json_lessons,
+))
+register_format(LessonFormat(
+    "ndjson", ".ndjson", "NDJSON",
+    write=lambda batches, f, compact: write_lessons_ndjson(batches, f),
+    read=iter_ndjson_lessons, read_parallel=iter_ndjson_lessons_parallel,
+))
+register_format(LessonFormat(
+    "binary", ".schedule", "Schedule Snapshot",
+    write=lambda batches, f, compact: write_snapshot(batches, f),
+    # Знімок читається через mmap, тому не стискається і не потребує перевірки
+    read=iter_binary_lessons, text=False, compressible=False,
+))
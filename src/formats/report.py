@@ -0,0 +1,120 @@
+"""
+Звіт про імпорт та спільні константи форматів.
+"""
+
+from itertools import chain
+from typing import Iterable, Iterator, List
+
+from src.models import Lesson
+
+# Кількість уроків в одній частині потокового імпорту
+DEFAULT_BATCH_SIZE = 1000
+
+# Ключі JSON у порядку колонок LESSON_COLUMNS
+LESSON_FIELDS = ("id", "day", "subject", "start_time", "end_time", "type", "room", "color")
+
+# Скільки помилок звіт зберігає докладно; решта лише рахується
+MAX_KEPT_ERRORS = 100
+
+
+class ImportIssue:
+    """Помилка в одному записі файлу імпорту.
+
+    Attributes:
+        line (int): Номер рядка у файлі (0 — помилка всього файлу).
+        reason (str): Код причини ('missing_headers', 'invalid_fields',
+            'duplicate_id', 'parse_error', 'empty').
+        detail (str): Додаткові відомості (назви полів, ID тощо).
+    """
+
+    __slots__ = ("line", "reason", "detail")
+
+    def __init__(self, line: int, reason: str, detail: str = ""):
+        self.line = line
+        self.reason = reason
+        self.detail = detail
+
+    def __repr__(self) -> str:
+        return f"ImportIssue(line={self.line!r}, reason={self.reason!r}, detail={self.detail!r})"
+
+
+class ImportReport:
+    """Структурований звіт про імпорт.
+
+    Attributes:
+        errors (List[ImportIssue]): Перші MAX_KEPT_ERRORS знайдених помилок.
+        error_count (int): Загальна кількість помилок.
+        lessons (int): Кількість коректних уроків.
+        bytes_read (int): Скільки байтів файлу вже прочитано.
+        bytes_total (int): Розмір файлу в байтах.
+        merge_result (MergeResult | None): Кількість доданих, оновлених та
+            незмінених уроків (лише для імпорту в режимі злиття).
+    """
+
+    def __init__(self) -> None:
+        self.errors: List[ImportIssue] = []
+        self.error_count = 0
+        self.lessons = 0
+        self.bytes_read = 0
+        self.bytes_total = 0
+        self.merge_result = None
+
+    @property
+    def ok(self) -> bool:
+        """True, якщо імпорт не містить помилок."""
+        return not self.error_count
+
+    def add_error(self, line: int, reason: str, detail: str = "") -> None:
+        """Додає помилку до звіту.
+
+        Після MAX_KEPT_ERRORS помилок звіт лише збільшує лічильник, тому
+        файл із систематичною помилкою в кожному рядку не накопичує
+        мільйони об'єктів ImportIssue.
+        """
+        self.error_count += 1
+        if len(self.errors) < MAX_KEPT_ERRORS:
+            self.errors.append(ImportIssue(line, reason, detail))
+
+
+class LessonImportError(Exception):
+    """Імпорт перервано через помилки у файлі.
+
+    Attributes:
+        report (ImportReport): Звіт з переліком помилок.
+    """
+
+    def __init__(self, report: ImportReport):
+        super().__init__(f"Import failed with {report.error_count} error(s)")
+        self.report = report
+
+
+def lesson_values(lesson: Lesson) -> tuple:
+    """Повертає значення уроку в порядку колонок LESSON_COLUMNS."""
+    return (
+        lesson.id, lesson.day, lesson.subject, lesson.start_time,
+        lesson.end_time, lesson.type, lesson.room, lesson.color
+    )
+
+
+def validated_lessons(batches: Iterable[List[Lesson]], report: ImportReport) -> Iterator[Lesson]:
+    """
+    Передає уроки з частин далі та перериває імпорт, якщо звіт містить помилки.
+
+    Виняток виникає після того, як усі частини прочитано, тому споживач
+    (наприклад, LessonRepository.replace_all) відкочує транзакцію.
+
+    Args:
+        batches (Iterable[List[Lesson]]): Частини уроків.
+        report (ImportReport): Звіт, який заповнюється під час читання.
+
+    Yields:
+        Lesson: Коректні уроки.
+
+    Raises:
+        LessonImportError: Якщо у файлі є помилки або він не містить уроків.
+    """
+    yield from chain.from_iterable(batches)
+    if report.ok and report.lessons == 0:
+        report.add_error(0, "empty")
+    if not report.ok:
+        raise LessonImportError(report)
@@ -0,0 +1,301 @@
+"""
+Фонові завдання імпорту та експорту.
+
+JobRunner виконує довгі операції з файлами у власному QThreadPool, щоб
+розбір і запис великих розкладів не блокували інтерфейс. Кожне завдання
+(Job) рахує оброблені рядки та байти, періодично надсилає сигнал
+job_progress зі швидкістю обробки і може бути скасоване користувачем.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from PyQt6.QtCore import QRunnable, QThreadPool
+
+from src.compression import DEFAULT_LEVEL
+from src.database import LessonRepository, get_repository
+from src.models import Lesson
+from src.signals import app_signals
+from src.formats import ImportReport, LessonImportError, export_rows, validated_lessons
+
+
+class JobCancelled(Exception):
+    """Завдання скасоване користувачем."""
+
+
+class Job:
+    """Стан одного фонового завдання.
+
+    Attributes:
+        kind (str): Тип завдання ('import' або 'export').
+        state (str): Поточний стан (RUNNING, DONE, FAILED, CANCELLED).
+        rows (int): Кількість оброблених рядків.
+        rows_total (int): Загальна кількість рядків (0 — невідомо).
+        bytes_done (int): Кількість оброблених байтів.
+        bytes_total (int): Загальний розмір у байтах (0 — невідомо).
+        result: Результат завдання.
+    """
+
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    # Мінімальний інтервал між сигналами прогресу, секунди
+    PROGRESS_INTERVAL = 0.1
+
+    def __init__(self, kind: str, func: Callable[["Job"], Any]):
+        """Ініціалізація завдання.
+
+        Args:
+            kind (str): Тип завдання.
+            func (Callable[[Job], Any]): Робота, яка отримує саме завдання
+                для звітування про прогрес.
+        """
+        self.kind = kind
+        self.state = self.RUNNING
+        self.rows = 0
+        self.rows_total = 0
+        self.bytes_done = 0
+        self.bytes_total = 0
+        self.result: Any = None
+        self._func = func
+        self._cancelled = threading.Event()
+        self._started = time.monotonic()
+        self._last_emit = 0.0
+
+    @property
+    def cancelled(self) -> bool:
+        """True, якщо користувач попросив скасувати завдання."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Просить завдання зупинитися при наступній перевірці."""
+        self._cancelled.set()
+
+    def check(self) -> None:
+        """Перериває роботу, якщо завдання скасоване.
+
+        Raises:
+            JobCancelled: Якщо було викликано cancel().
+        """
+        if self._cancelled.is_set():
+            raise JobCancelled()
+
+    @property
+    def elapsed(self) -> float:
+        """Час виконання в секундах."""
+        return max(time.monotonic() - self._started, 1e-6)
+
+    @property
+    def rows_per_sec(self) -> float:
+        """Середня швидкість обробки рядків."""
+        return self.rows / self.elapsed
+
+    @property
+    def bytes_per_sec(self) -> float:
+        """Середня швидкість обробки даних у байтах."""
+        return self.bytes_done / self.elapsed
+
+    @property
+    def percent(self) -> int:
+        """Відсоток виконання за байтами або рядками (0, якщо обсяг невідомий)."""
+        if self.bytes_total:
+            return min(100, self.bytes_done * 100 // self.bytes_total)
+        if self.rows_total:
+            return min(100, self.rows * 100 // self.rows_total)
+        return 0
+
+    def advance(self, rows: int, bytes_done: Optional[int] = None) -> None:
+        """Оновлює прогрес і надсилає сигнал не частіше за PROGRESS_INTERVAL.
+
+        Args:
+            rows (int): Кількість щойно оброблених рядків.
+            bytes_done (int | None): Загальна кількість оброблених байтів.
+
+        Raises:
+            JobCancelled: Якщо завдання скасоване.
+        """
+        self.rows += rows
+        if bytes_done is not None:
+            self.bytes_done = bytes_done
+        now = time.monotonic()
+        if now - self._last_emit >= self.PROGRESS_INTERVAL:
+            self._last_emit = now
+            self._emit_progress()
+        self.check()
+
+    def _emit_progress(self) -> None:
+        """Надсилає сигнал прогресу з поточними показниками."""
+        app_signals.job_progress.emit(self, self.percent, self.rows,
+                                      self.rows_per_sec, self.bytes_per_sec)
+
+    def run(self) -> None:
+        """Виконує роботу та надсилає сигнал job_finished."""
+        self._started = time.monotonic()
+        try:
+            self.check()
+            self.result = self._func(self)
+            self.state = self.DONE
+        except JobCancelled:
+            self.state = self.CANCELLED
+        except Exception as e:
+            print(f"Job error: {e}")
+            self.state = self.FAILED
+        finally:
+            self._emit_progress()
+            app_signals.job_finished.emit(self)
+
+
+class _JobTask(QRunnable):
+    """Завдання пулу потоків, що виконує один Job."""
+
+    def __init__(self, job: Job, on_done: Callable[[Job], None]):
+        super().__init__()
+        self._job = job
+        self._on_done = on_done
+
+    def run(self) -> None:
+        """Виконує завдання у фоновому потоці."""
+        try:
+            self._job.run()
+        finally:
+            self._on_done(self._job)
+
+
+class JobRunner:
+    """Виконавець фонових завдань імпорту та експорту.
+
+    Завдання виконуються по одному, оскільки всі вони працюють з тим
+    самим файлом бази даних.
+
+    Attributes:
+        repository (LessonRepository): Репозиторій уроків.
+    """
+
+    def __init__(self, repository: Optional[LessonRepository] = None):
+        """Ініціалізація виконавця.
+
+        Args:
+            repository: Репозиторій уроків (за замовчуванням спільний)
+        """
+        self.repository = repository or get_repository()
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(1)
+        self._jobs: List[Job] = []
+        self._jobs_lock = threading.Lock()
+
+    def start(self, job: Job) -> Job:
+        """Ставить завдання в чергу.
+
+        Args:
+            job: Завдання
+
+        Returns:
+            Job: Те саме завдання (для скасування та перевірки стану).
+        """
+        with self._jobs_lock:
+            self._jobs.append(job)
+        self._pool.start(_JobTask(job, self._job_done))
+        return job
+
+    def _job_done(self, job: Job) -> None:
+        """Прибирає завершене завдання зі списку активних."""
+        with self._jobs_lock:
+            self._jobs.remove(job)
+
+    def run_import(self, batches: Iterable[List[Lesson]], report: ImportReport,
+                   mode: str = "replace", key: str = "id") -> Job:
+        """Запускає потоковий імпорт, що замінює поточний розклад або зливається з ним.
+
+        Якщо звіт містить помилки або завдання скасоване, транзакція
+        відкочується і розклад залишається без змін. Результат завдання —
+        звіт про імпорт; у режимі злиття він містить merge_result.
+
+        Args:
+            batches: Генератор частин уроків (наприклад iter_csv_lessons)
+            report: Звіт, який заповнює генератор
+            mode: 'replace' — замінити всі уроки, 'merge' — додати нові
+                та оновити змінені
+            key: Ключ зіставлення для злиття ('id' або 'natural')
+
+        Returns:
+            Job: Завдання імпорту.
+        """
+        def track(job: Job) -> Iterator[List[Lesson]]:
+            for batch in batches:
+                job.bytes_total = report.bytes_total
+                job.advance(len(batch), report.bytes_read)
+                yield batch
+
+        def work(job: Job) -> ImportReport:
+            try:
+                lessons = validated_lessons(track(job), report)
+                if mode == "merge":
+                    report.merge_result = self.repository.merge_all(lessons, key)
+                    count = report.merge_result.total
+                else:
+                    count = self.repository.replace_all(lessons)
+            except LessonImportError:
+                pass
+            except (OSError, sqlite3.Error) as e:
+                report.add_error(0, "invalid_data", str(e))
+            else:
+                app_signals.lessons_replaced.emit(count)
+            return report
+
+        return self.start(Job("import", work))
+
+    def run_export(self, file_path: str, fmt: str, compact: bool = False,
+                   level: int = DEFAULT_LEVEL) -> Job:
+        """Запускає потоковий експорт усіх уроків у файл.
+
+        Результат завдання — кількість записаних уроків (0 — немає даних).
+        Файл записується через тимчасовий <file_path>.part, тому скасування
+        або помилка не змінюють наявний файл.
+
+        Args:
+            file_path: Шлях до файлу
+            fmt: Ключ формату з src.formats.FORMATS
+            compact: Компактний JSON без відступів
+            level: Рівень стиснення для .gz/.bz2/.xz
+
+        Returns:
+            Job: Завдання експорту.
+        """
+        def work(job: Job) -> int:
+            job.rows_total = self.repository.count()
+            if job.rows_total == 0:
+                return 0
+            return export_rows(self.repository.iter_rows(), file_path, fmt, compact,
+                               progress=job.advance, level=level)
+
+        return self.start(Job("export", work))
+
+    def cancel_all(self) -> None:
+        """Скасовує всі завдання, що виконуються або чекають у черзі."""
+        with self._jobs_lock:
+            for job in self._jobs:
+                job.cancel()
+
+    def shutdown(self) -> None:
+        """Скасовує завдання та чекає їх завершення."""
+        self.cancel_all()
+        self._pool.waitForDone()
+
+
+_runner: Optional[JobRunner] = None
+
+
+def get_job_runner() -> JobRunner:
+    """Повертає спільний виконавець фонових завдань.
+
+    Returns:
+        JobRunner: Єдиний екземпляр виконавця на процес.
+    """
+    global _runner
+    if _runner is None:
+        _runner = JobRunner()
+    return _runner
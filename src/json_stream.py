@@ -0,0 +1,155 @@
+"""
+Інкрементне читання JSON масивів.
+
+JsonArrayReader розбирає масив верхнього рівня по одному елементу за раз,
+читаючи файл частинами фіксованого розміру. У пам'яті одночасно
+знаходяться лише поточна частина тексту та один розібраний елемент,
+тому навіть дуже великі файли експорту не потрібно завантажувати цілком.
+"""
+
+import json
+from typing import Any, Iterator, TextIO, Tuple
+
+_WHITESPACE = " \t\n\r"
+# Помилка або число ближче до кінця буфера можуть бути лише обірваним
+# літералом ('tru', '12.', '\\u00') і перевіряються після дочитування
+_TRUNCATION_MARGIN = 16
+
+
+class JsonStreamError(ValueError):
+    """Помилка формату JSON під час інкрементного читання.
+
+    Attributes:
+        line (int): Номер рядка, у якому виявлено помилку.
+    """
+
+    def __init__(self, message: str, line: int):
+        super().__init__(f"{message} (line {line})")
+        self.line = line
+
+
+class JsonArrayReader:
+    """Ітератор елементів JSON масиву верхнього рівня.
+
+    Attributes:
+        chunk_size (int): Кількість символів, що читаються за один раз.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, stream: TextIO, chunk_size: int = CHUNK_SIZE):
+        """Ініціалізація читача.
+
+        Args:
+            stream (TextIO): Текстовий потік з JSON масивом.
+            chunk_size (int): Розмір частини для читання.
+        """
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._line = 1  # Номер рядка в позиції _line_pos буфера
+        self._line_pos = 0
+        self._eof = False
+
+    def _fill(self, size: int = 0) -> bool:
+        """Дочитує наступну частину, відкидаючи вже розібраний текст.
+
+        Args:
+            size (int): Мінімальна кількість символів для читання
+                (не менше chunk_size).
+
+        Returns:
+            bool: False, якщо потік закінчився.
+        """
+        if self._eof:
+            return False
+        chunk = self.stream.read(max(size, self.chunk_size))
+        if not chunk:
+            self._eof = True
+            return False
+        if self._pos < len(self._buffer):
+            self._line_at(self._pos)
+            self._buffer = self._buffer[self._pos:] + chunk
+        else:
+            self._line += self._buffer.count("\n", self._line_pos)
+            self._buffer = chunk
+        self._pos = 0
+        self._line_pos = 0
+        return True
+
+    def _line_at(self, pos: int) -> int:
+        """Повертає номер рядка для позиції в буфері.
+
+        Лічильник рядків просувається від попередньої позиції, тому кожен
+        символ буфера переглядається лише один раз.
+        """
+        if pos >= self._line_pos:
+            self._line += self._buffer.count("\n", self._line_pos, pos)
+            self._line_pos = pos
+            return self._line
+        return self._line - self._buffer.count("\n", pos, self._line_pos)
+
+    def _is_truncated(self, error: json.JSONDecodeError) -> bool:
+        """Перевіряє, чи помилка спричинена лише кінцем буфера."""
+        return (len(self._buffer) - error.pos <= _TRUNCATION_MARGIN
+                or error.msg.startswith("Unterminated string"))
+
+    def _peek(self) -> str:
+        """Пропускає пробіли та повертає наступний символ ('' в кінці потоку)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, expected: str) -> str:
+        """Зчитує один зі структурних символів або повідомляє про помилку."""
+        char = self._peek()
+        if not char or char not in expected:
+            found = repr(char) if char else "end of file"
+            raise JsonStreamError(f"Expected {' or '.join(map(repr, expected))}, found {found}",
+                                  self._line_at(self._pos))
+        self._pos += 1
+        return char
+
+    def _decode_item(self) -> Tuple[int, Any]:
+        """Розбирає один елемент масиву, дочитуючи потік за потреби."""
+        self._peek()
+        while True:
+            try:
+                item, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                # Дочитуємо лише обірваний елемент; помилка всередині буфера
+                # повідомляється одразу, без читання решти файлу
+                if self._is_truncated(e) and self._fill(len(self._buffer) - self._pos):
+                    continue
+                raise JsonStreamError(e.msg, self._line_at(e.pos)) from None
+            # Число в кінці буфера може продовжуватися в наступній частині ('12' + '.5')
+            if (isinstance(item, (int, float)) and len(self._buffer) - end <= _TRUNCATION_MARGIN
+                    and self._fill(len(self._buffer) - self._pos)):
+                continue
+            line = self._line_at(self._pos)
+            self._pos = end
+            return line, item
+
+    def __iter__(self) -> Iterator[Tuple[int, Any]]:
+        """Повертає пари (номер рядка, елемент) для кожного елемента масиву.
+
+        Raises:
+            JsonStreamError: Якщо вміст не є коректним JSON масивом.
+        """
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+        else:
+            while True:
+                yield self._decode_item()
+                if self._expect(",]") == "]":
+                    break
+
+        if self._peek():
+            raise JsonStreamError("Extra data after JSON array", self._line_at(self._pos))
@@ -1,22 +1,100 @@
-import json
+"""
+Переклади інтерфейсу.
+
+Каталоги всіх мов (src.catalog) після запуску завантажуються у фоновому
+потоці й залишаються в пам'яті, тому зміна мови лише підміняє посилання
+на готовий словник. Для кожної мови один раз будується каталог із
+ланцюжком запасних мов (FALLBACK_CHAIN): ключі, яких немає в перекладі,
+беруться з англійської.
+
+Віджети з перекладеним текстом реєструються через bind_text, і після
+зміни мови retranslate оновлює лише їхні тексти, не перебудовуючи
+інтерфейс.
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from src.catalog import available_languages, load_catalog
 from src.settings import load_language, save_language
 
-_translations = {}
+DEFAULT_LANGUAGE = "en"
+
+# Мови, з яких послідовно беруться відсутні ключі
+FALLBACK_CHAIN: Tuple[str, ...] = (DEFAULT_LANGUAGE,)
+
+# Розгорнутий каталог поточної мови з урахуванням запасних мов
+_translations: Dict[str, str] = {}
+# Готові каталоги з запасними мовами за кодом мови
+_resolved: Dict[str, Dict[str, str]] = {}
+_resolved_lock = threading.Lock()
+_preload_thread: Optional[threading.Thread] = None
+
+# Зареєстровані віджети: ключ перекладу -> {(id віджета, метод): (віджет, метод, шаблон)}
+_bindings: Dict[str, Dict[Tuple[int, str], Tuple[Any, str, str]]] = {}
+# Зворотний індекс: (id віджета, метод) -> ключ перекладу
+_bound_keys: Dict[Tuple[int, str], str] = {}
+
+
+def _resolve(lang_code: str) -> Dict[str, str]:
+    """Повертає каталог мови, доповнений ключами запасних мов.
+
+    Args:
+        lang_code (str): Код мови.
+
+    Returns:
+        Dict[str, str]: Каталог, у якому кожен ключ має переклад.
+
+    Raises:
+        FileNotFoundError: Якщо мовного файлу немає.
+    """
+    catalog = _resolved.get(lang_code)
+    if catalog is not None:
+        return catalog
+
+    chain = (lang_code,) + tuple(code for code in FALLBACK_CHAIN if code != lang_code)
+    merged: Dict[str, str] = {}
+    # Від останньої запасної мови до основної, щоб основна мала пріоритет
+    for code in reversed(chain):
+        try:
+            merged.update(load_catalog(code))
+        except FileNotFoundError:
+            if code == lang_code:
+                raise
+
+    with _resolved_lock:
+        return _resolved.setdefault(lang_code, merged)
+
+
+def _preload() -> None:
+    """Завантажує каталоги всіх мов (виконується у фоновому потоці)."""
+    for lang_code in available_languages():
+        try:
+            _resolve(lang_code)
+        except (OSError, ValueError) as e:
+            print(f"Translations preload error ({lang_code}): {e}")
+
+
+def preload_languages() -> None:
+    """Запускає фонове завантаження каталогів усіх мов (один раз)."""
+    global _preload_thread
+    if _preload_thread is None:
+        _preload_thread = threading.Thread(target=_preload, name="translations-preload", daemon=True)
+        _preload_thread.start()
 
 
 def load_translations() -> None:
-    """Завантажує мовні файли відповідно до поточної мови."""
-    global _translations
-    lang_code = load_language()
-    lang_file = f"src/locales/{lang_code}.json"
+    """Встановлює каталог перекладів відповідно до збереженої мови."""
+    _activate(load_language())
+
 
+def _activate(lang_code: str) -> None:
+    """Робить мову поточною; невідома мова замінюється мовою за замовчуванням."""
+    global _translations
     try:
-        with open(lang_file, "r", encoding="utf-8") as file:
-            _translations = json.load(file)
+        _translations = _resolve(lang_code)
     except FileNotFoundError:
-        # Якщо файл не знайдено, завантажується англійська мова за замовчуванням
-        with open("src/locales/en.json", "r", encoding="utf-8") as file:
-            _translations = json.load(file)
+        _translations = _resolve(DEFAULT_LANGUAGE)
 
 
 def tr(key: str) -> str:
@@ -26,15 +104,10 @@ def tr(key: str) -> str:
         key (str): Ключ перекладу (наприклад 'app.lesson_dialog.title').
 
     Returns:
-        str: Перекладений текст або ключ, якщо переклад не знайдено.
+        str: Переклад поточною мовою, англійською, якщо його немає,
+        або сам ключ, якщо ключ невідомий.
     """
-    keys = key.split(".")
-    result = _translations
-    for k in keys:
-        if not isinstance(result, dict):
-            break
-        result = result.get(k, {})
-    return result if isinstance(result, str) else key
+    return _translations.get(key, key)
 
 
 def set_language(lang_code: str) -> None:
@@ -44,4 +117,46 @@ def set_language(lang_code: str) -> None:
         lang_code (str): Код мови (наприклад 'en', 'ukr').
     """
     save_language(lang_code)
-    load_translations()
+    _activate(lang_code)
+
+
+def bind_text(widget: Any, key: str, setter: str = "setText", template: str = "{}") -> None:
+    """Встановлює перекладений текст віджета та реєструє його для retranslate.
+
+    Повторний виклик для того самого віджета й методу замінює ключ.
+    Реєстрація знімається автоматично, коли віджет Qt знищується.
+
+    Args:
+        widget: Віджет (або інший об'єкт з методом setter).
+        key (str): Ключ перекладу.
+        setter (str): Назва методу, що встановлює текст ('setText', 'setWindowTitle').
+        template (str): Шаблон тексту, у який підставляється переклад.
+    """
+    target = (id(widget), setter)
+    old_key = _bound_keys.get(target)
+    if old_key is None and hasattr(widget, "destroyed"):
+        widget.destroyed.connect(lambda *_, widget_id=id(widget): _unbind(widget_id))
+    elif old_key is not None and old_key != key:
+        _bindings[old_key].pop(target, None)
+
+    _bound_keys[target] = key
+    _bindings.setdefault(key, {})[target] = (widget, setter, template)
+    getattr(widget, setter)(template.format(tr(key)))
+
+
+def _unbind(widget_id: int) -> None:
+    """Знімає всі реєстрації знищеного віджета."""
+    for target in [target for target in _bound_keys if target[0] == widget_id]:
+        _bindings[_bound_keys.pop(target)].pop(target, None)
+
+
+def retranslate() -> None:
+    """Оновлює тексти всіх зареєстрованих віджетів поточною мовою."""
+    for key, targets in _bindings.items():
+        text = tr(key)
+        for widget, setter, template in list(targets.values()):
+            try:
+                getattr(widget, setter)(template.format(text))
+            except RuntimeError:
+                # Об'єкт C++ уже видалено, а сигнал destroyed ще не оброблено
+                _unbind(id(widget))
@@ -0,0 +1,286 @@
+"""
+Колонкове сховище уроків.
+
+LessonStore зберігає уроки по колонках: день і час — у масивах array('H'),
+текстові поля — кодами в інтернованій таблиці рядків. Це займає значно
+менше пам'яті, ніж десятки тисяч окремих об'єктів Lesson, і дозволяє
+фільтрувати, сортувати та шукати перетини, проходячи лише потрібні
+колонки. Об'єкти Lesson створюються ліниво, коли їх запитує UI.
+"""
+
+from array import array
+from itertools import compress
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.models import Lesson, restore_lesson
+
+# Значення для відсутнього дня або часу в колонках array('H')
+MISSING = 0xFFFF
+
+# Код текстової колонки для значення None (спільний зі знімками src.snapshot)
+NULL_STRING = 0xFFFFFFFF
+
+
+def to_column(value: Optional[int]) -> int:
+    """Перетворює необов'язкове ціле число на значення колонки array('H')."""
+    return value if value is not None and 0 <= value < MISSING else MISSING
+
+
+def from_column(value: int) -> Optional[int]:
+    """Перетворює значення колонки array('H') назад на необов'язкове ціле число."""
+    return None if value == MISSING else value
+
+
+class StringTable:
+    """Таблиця інтернованих рядків: кожен унікальний рядок зберігається один раз."""
+
+    __slots__ = ("strings", "_codes")
+
+    def __init__(self) -> None:
+        self.strings: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def intern(self, value: Optional[str]) -> int:
+        """Повертає код рядка, додаючи його до таблиці за потреби.
+
+        Args:
+            value (str | None): Рядок; None отримує зарезервований код NULL_STRING.
+
+        Returns:
+            int: Код рядка.
+        """
+        if value is None:
+            return NULL_STRING
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.strings)
+            self.strings.append(value)
+        return code
+
+    def lookup(self, value: Optional[str]) -> Optional[int]:
+        """Повертає код рядка або None, якщо такого рядка немає в таблиці."""
+        if value is None:
+            return NULL_STRING
+        return self._codes.get(value)
+
+    def __getitem__(self, code: int) -> Optional[str]:
+        return None if code == NULL_STRING else self.strings[code]
+
+
+class LessonStore:
+    """Колонкове сховище уроків з індексом id → рядок.
+
+    Attributes:
+        days (array): Індекси днів тижня.
+        starts (array): Початок уроку у хвилинах.
+        ends (array): Кінець уроку у хвилинах.
+        strings (StringTable): Таблиця рядків для текстових колонок.
+    """
+
+    # Порядок збігається з текстовими слотами Lesson (див. lesson())
+    TEXT_COLUMNS = ("day", "subject", "start_time", "end_time", "type", "room", "color")
+
+    def __init__(self, lessons: Iterable[Lesson] = ()):
+        """Ініціалізація сховища.
+
+        Args:
+            lessons (Iterable[Lesson]): Початкові уроки.
+        """
+        self.ids: List[Any] = []
+        self.days = array('H')
+        self.starts = array('H')
+        self.ends = array('H')
+        self.strings = StringTable()
+        self.text: Dict[str, array] = {column: array('I') for column in self.TEXT_COLUMNS}
+        self._rows: Dict[Any, int] = {}
+        for lesson in lessons:
+            self.upsert(lesson)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, lesson_id: Any) -> bool:
+        return lesson_id in self._rows
+
+    def __iter__(self) -> Iterator[Lesson]:
+        return self.lessons(range(len(self)))
+
+    def __getitem__(self, row: int) -> Lesson:
+        return self.lesson(row)
+
+    def upsert(self, lesson: Lesson) -> int:
+        """Додає урок або замінює урок з тим самим id.
+
+        Уроки без id завжди додаються як нові рядки.
+
+        Args:
+            lesson (Lesson): Урок.
+
+        Returns:
+            int: Номер рядка уроку.
+        """
+        row = self._rows.get(lesson.id) if lesson.id is not None else None
+        values = (
+            to_column(lesson.day_index),
+            to_column(lesson.start_min),
+            to_column(lesson.end_min),
+        )
+        codes = [self.strings.intern(getattr(lesson, column)) for column in self.TEXT_COLUMNS]
+
+        if row is None:
+            row = len(self.ids)
+            self.ids.append(lesson.id)
+            self.days.append(values[0])
+            self.starts.append(values[1])
+            self.ends.append(values[2])
+            for column, code in zip(self.TEXT_COLUMNS, codes):
+                self.text[column].append(code)
+            if lesson.id is not None:
+                self._rows[lesson.id] = row
+        else:
+            self.days[row], self.starts[row], self.ends[row] = values
+            for column, code in zip(self.TEXT_COLUMNS, codes):
+                self.text[column][row] = code
+        return row
+
+    def remove(self, lesson_id: Any) -> bool:
+        """Видаляє урок, переносячи останній рядок на його місце.
+
+        Args:
+            lesson_id: Ідентифікатор уроку.
+
+        Returns:
+            bool: True, якщо урок було видалено.
+        """
+        row = self._rows.pop(lesson_id, None)
+        if row is None:
+            return False
+
+        last = len(self.ids) - 1
+        columns = [self.days, self.starts, self.ends, *self.text.values()]
+        if row != last:
+            moved_id = self.ids[last]
+            self.ids[row] = moved_id
+            for column in columns:
+                column[row] = column[last]
+            if moved_id is not None:
+                self._rows[moved_id] = row
+        self.ids.pop()
+        for column in columns:
+            column.pop()
+        return True
+
+    def row_of(self, lesson_id: Any) -> Optional[int]:
+        """Повертає номер рядка уроку за id або None."""
+        return self._rows.get(lesson_id)
+
+    def get(self, lesson_id: Any) -> Optional[Lesson]:
+        """Повертає урок за id або None."""
+        row = self._rows.get(lesson_id)
+        return self.lesson(row) if row is not None else None
+
+    def lesson(self, row: int) -> Lesson:
+        """Створює об'єкт Lesson для рядка сховища.
+
+        Args:
+            row (int): Номер рядка.
+
+        Returns:
+            Lesson: Урок.
+        """
+        strings = self.strings
+        # День і час уже розібрані в колонках, тому Lesson не парсить їх повторно
+        return restore_lesson(
+            self.ids[row],
+            *(strings[codes[row]] for codes in self.text.values()),
+            from_column(self.days[row]),
+            from_column(self.starts[row]),
+            from_column(self.ends[row])
+        )
+
+    def lessons(self, rows: Iterable[int]) -> Iterator[Lesson]:
+        """Ліниво повертає уроки для переданих рядків."""
+        return (self.lesson(row) for row in rows)
+
+    def filter(self, day_index: Optional[int] = None, **text_values: str) -> List[int]:
+        """Повертає рядки, що відповідають усім умовам.
+
+        Args:
+            day_index (int | None): Індекс дня тижня.
+            **text_values: Значення текстових колонок (наприклад room='A019');
+                None відбирає уроки без значення, на відміну від порожнього рядка.
+
+        Returns:
+            List[int]: Номери рядків.
+        """
+        conditions = []
+        if day_index is not None:
+            conditions.append((self.days, day_index))
+        for column, value in text_values.items():
+            if column not in self.text:
+                raise KeyError(f"Unknown lesson column: {column}")
+            code = self.strings.lookup(value)
+            if code is None:
+                return []
+            conditions.append((self.text[column], code))
+
+        if not conditions:
+            return list(range(len(self)))
+
+        # Перша умова проходить колонку цілком, решта — лише відібрані рядки
+        (first_column, first_value), *rest = conditions
+        rows = list(compress(range(len(self)), (value == first_value for value in first_column)))
+        for column, expected in rest:
+            rows = [row for row in rows if column[row] == expected]
+        return rows
+
+    def sorted_rows(self, rows: Optional[Iterable[int]] = None) -> List[int]:
+        """Сортує рядки за днем та часом початку.
+
+        Args:
+            rows (Iterable[int] | None): Рядки для сортування (за замовчуванням усі).
+
+        Returns:
+            List[int]: Відсортовані номери рядків.
+        """
+        keys = array('L', ((day << 16) | start for day, start in zip(self.days, self.starts)))
+        return sorted(range(len(self)) if rows is None else rows, key=keys.__getitem__)
+
+    def overlapping(self, day_index: int, start_min: int, end_min: int,
+                    exclude_id: Any = None) -> List[int]:
+        """Повертає рядки уроків, що перетинаються з проміжком часу.
+
+        Args:
+            day_index (int): Індекс дня тижня.
+            start_min (int): Початок проміжку у хвилинах.
+            end_min (int): Кінець проміжку у хвилинах.
+            exclude_id: Ідентифікатор уроку, який слід ігнорувати.
+
+        Returns:
+            List[int]: Номери рядків.
+        """
+        return [
+            row for row, (day, start, end) in enumerate(zip(self.days, self.starts, self.ends))
+            if day == day_index and start < end_min and end > start_min
+            and end != MISSING and self.ids[row] != exclude_id
+        ]
+
+    def conflicts(self) -> List[Tuple[int, int]]:
+        """Знаходить усі пари уроків, що перетинаються в межах одного дня.
+
+        Returns:
+            List[Tuple[int, int]]: Пари номерів рядків.
+        """
+        pairs = []
+        active: List[int] = []
+        current_day = None
+        for row in self.sorted_rows():
+            day, start, end = self.days[row], self.starts[row], self.ends[row]
+            if day == MISSING or start == MISSING or end == MISSING:
+                continue
+            if day != current_day:
+                current_day, active = day, []
+            active = [other for other in active if self.ends[other] > start]
+            pairs.extend((other, row) for other in active)
+            active.append(row)
+        return pairs
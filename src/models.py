@@ -1,8 +1,58 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+# Назви днів тижня всіма мовами інтерфейсу (індекс 0 — понеділок)
+DAY_TRANSLATIONS = {
+    'en': ["monday", "tuesday", "wednesday", "thursday", "friday"],
+    'uk': ["понеділок", "вівторок", "середа", "четвер", "п'ятниця"],
+    'pl': ["poniedziałek", "wtorek", "środa", "czwartek", "piątek"]
+}
+
+_DAY_INDEX = {
+    day: idx
+    for days in DAY_TRANSLATIONS.values()
+    for idx, day in enumerate(days)
+}
+
+
+def day_to_index(day: str) -> Optional[int]:
+    """Повертає індекс дня тижня за його назвою будь-якою мовою.
+
+    Args:
+        day (str): Назва дня (наприклад 'Monday', 'Середа').
+
+    Returns:
+        Optional[int]: Індекс дня (0 — понеділок) або None.
+    """
+    try:
+        return _DAY_INDEX.get(day.lower().strip())
+    except AttributeError:
+        return None
+
+
+def time_to_minutes(time_str: str) -> Optional[int]:
+    """Перетворює час у форматі HH:MM на кількість хвилин від початку доби.
+
+    Args:
+        time_str (str): Час у форматі HH:MM.
+
+    Returns:
+        Optional[int]: Кількість хвилин або None, якщо формат некоректний.
+    """
+    try:
+        hours, minutes = map(int, time_str.split(":"))
+    except (ValueError, AttributeError):
+        return None
+    if hours < 0 or not 0 <= minutes < 60:
+        return None
+    return hours * 60 + minutes
 
 
 class Lesson:
-    """Модель уроку.
+    """Незмінна модель уроку.
+
+    Клас використовує __slots__ замість словника атрибутів, а час і день
+    тижня розбираються один раз під час створення, тому відображення
+    розкладу не парсить рядки повторно.
 
     Attributes:
         id (int | None): Унікальний ідентифікатор уроку.
@@ -13,8 +63,16 @@ class Lesson:
         type (str): Тип заняття ('Online', 'Offline').
         room (str): Аудиторія.
         color (str): Колір для візуалізації.
+        day_index (int | None): Індекс дня тижня (0 — понеділок).
+        start_min (int | None): Час початку у хвилинах від початку доби.
+        end_min (int | None): Час закінчення у хвилинах від початку доби.
     """
 
+    __slots__ = (
+        "id", "day", "subject", "start_time", "end_time", "type", "room", "color",
+        "day_index", "start_min", "end_min"
+    )
+
     def __init__(
         self,
         lesson_id: int | None = None,
@@ -26,14 +84,67 @@ class Lesson:
         room: str = "",
         color: str = ""
     ):
-        self.id = lesson_id
-        self.day = day
-        self.subject = subject
-        self.start_time = start_time
-        self.end_time = end_time
-        self.type = lesson_type
-        self.room = room
-        self.color = color
+        init = object.__setattr__
+        init(self, "id", lesson_id)
+        init(self, "day", day)
+        init(self, "subject", subject)
+        init(self, "start_time", start_time)
+        init(self, "end_time", end_time)
+        init(self, "type", lesson_type)
+        init(self, "room", room)
+        init(self, "color", color)
+        init(self, "day_index", day_to_index(day))
+        init(self, "start_min", time_to_minutes(start_time))
+        init(self, "end_min", time_to_minutes(end_time))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Lesson is immutable, cannot set '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Lesson is immutable, cannot delete '{name}'")
+
+    def _fields(self) -> tuple:
+        """Повертає кортеж аргументів конструктора."""
+        return (
+            self.id, self.day, self.subject, self.start_time,
+            self.end_time, self.type, self.room, self.color
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Lesson):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        return hash(self._fields())
+
+    def __reduce__(self) -> tuple:
+        # Розібрані значення передаються разом з полями, тому уроки, що
+        # повертаються з інших процесів, не парсяться повторно
+        return restore_lesson, tuple(getattr(self, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return (
+            f"Lesson(id={self.id!r}, day={self.day!r}, subject={self.subject!r}, "
+            f"start_time={self.start_time!r}, end_time={self.end_time!r})"
+        )
+
+    def replace(self, **changes: Any) -> "Lesson":
+        """Створює копію уроку з іншими значеннями полів.
+
+        Args:
+            **changes: Нові значення з іменами аргументів конструктора
+                (наприклад lesson_id=5).
+
+        Returns:
+            Lesson: Новий екземпляр уроку.
+        """
+        fields = dict(zip(
+            ("lesson_id", "day", "subject", "start_time", "end_time", "lesson_type", "room", "color"),
+            self._fields()
+        ))
+        fields.update(changes)
+        return Lesson(**fields)
 
     def to_dict(self) -> Dict[str, Any]:
         """Перетворює урок у словник.
@@ -72,3 +183,19 @@ class Lesson:
             room=data.get("room", ""),
             color=data.get("color", "")
         )
+
+
+# Дескриптори слотів Lesson для швидкого відновлення без __init__
+_SLOT_SETTERS = tuple(getattr(Lesson, name).__set__ for name in Lesson.__slots__)
+
+
+def restore_lesson(*values: Any) -> Lesson:
+    """Відновлює урок за значеннями слотів без повторного розбору дня та часу.
+
+    Значення передаються в порядку Lesson.__slots__, тобто разом з уже
+    розібраними day_index, start_min та end_min.
+    """
+    lesson = object.__new__(Lesson)
+    for setter, value in zip(_SLOT_SETTERS, values):
+        setter(lesson, value)
+    return lesson
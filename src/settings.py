@@ -1,16 +1,151 @@
-from PyQt6.QtCore import QSettings
+"""
+Налаштування додатку.
+
+AppSettings один раз читає всі значення з QSettings і далі віддає їх з
+пам'яті. Зміни записуються у QSettings не одразу, а разом після паузи
+FLUSH_DELAY_MS (або при виході з додатку через flush), а сигнал changed
+повідомляє віджети про нове значення.
+
+Функції load_*/save_* залишаються тонкими обгортками над спільним
+об'єктом get_settings().
+"""
+
+from typing import Any, Dict, Optional, Set
+
+from PyQt6.QtCore import QCoreApplication, QObject, QSettings, QTimer, pyqtSignal
 
 # Глобальні налаштування
 SETTINGS = QSettings("MyUniversity", "SchedulePlanner")
 
 
+class _Setting:
+    """Типізоване поле AppSettings, що зберігається у QSettings під ключем key."""
+
+    def __init__(self, key: str, value_type: type, default: Any):
+        self.key = key
+        self.type = value_type
+        self.default = default
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Optional["AppSettings"], owner: type) -> Any:
+        if instance is None:
+            return self
+        return instance._values[self.name]
+
+    def __set__(self, instance: "AppSettings", value: Any) -> None:
+        instance.set(self.name, value)
+
+
+class AppSettings(QObject):
+    """Кеш налаштувань у пам'яті з відкладеним записом у QSettings.
+
+    Signals:
+        changed (str, object): Назва поля та його нове значення.
+    """
+
+    changed = pyqtSignal(str, object)
+
+    # Затримка перед записом змін у QSettings, мс
+    FLUSH_DELAY_MS = 500
+
+    theme = _Setting("app_theme", str, "dark_theme")
+    language = _Setting("language", str, "en")
+    notifications = _Setting("notifications", bool, True)
+    view_mode = _Setting("view_mode", str, "daily")
+    render_engine = _Setting("render_engine", str, "widgets")
+    compression_level = _Setting("compression_level", int, 6)
+
+    def __init__(self, store: QSettings = SETTINGS):
+        """Ініціалізація: читає всі налаштування зі сховища.
+
+        Args:
+            store (QSettings): Сховище налаштувань.
+        """
+        super().__init__()
+        self._store = store
+        self._fields: Dict[str, _Setting] = {
+            name: field for name, field in vars(type(self)).items() if isinstance(field, _Setting)
+        }
+        self._values: Dict[str, Any] = {
+            name: self._read(field) for name, field in self._fields.items()
+        }
+        self._dirty: Set[str] = set()
+        self._timer: Optional[QTimer] = None
+
+    def _read(self, field: _Setting) -> Any:
+        """Читає значення поля з QSettings з перетворенням типу."""
+        return field.type(self._store.value(field.key, field.default, type=field.type))
+
+    def get(self, name: str) -> Any:
+        """Повертає значення поля з пам'яті."""
+        return self._values[name]
+
+    def set(self, name: str, value: Any) -> None:
+        """
+        Змінює значення поля та планує запис у QSettings.
+
+        Args:
+            name (str): Назва поля (наприклад 'theme').
+            value: Нове значення.
+        """
+        field = self._fields[name]
+        value = field.type(value)
+        if self._values[name] == value:
+            return
+        self._values[name] = value
+        self._dirty.add(name)
+        self._schedule_flush()
+        self.changed.emit(name, value)
+
+    def _schedule_flush(self) -> None:
+        """Перезапускає таймер запису; без циклу подій Qt записує одразу."""
+        if QCoreApplication.instance() is None:
+            self.flush()
+            return
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setSingleShot(True)
+            self._timer.setInterval(self.FLUSH_DELAY_MS)
+            self._timer.timeout.connect(self.flush)
+        self._timer.start()
+
+    def flush(self) -> None:
+        """Записує всі змінені поля у QSettings."""
+        if self._timer is not None:
+            self._timer.stop()
+        if not self._dirty:
+            return
+        for name in self._dirty:
+            self._store.setValue(self._fields[name].key, self._values[name])
+        self._dirty.clear()
+        self._store.sync()
+
+
+_settings: Optional[AppSettings] = None
+
+
+def get_settings() -> AppSettings:
+    """Повертає спільний об'єкт налаштувань.
+
+    Returns:
+        AppSettings: Налаштування, прочитані при першому виклику.
+    """
+    global _settings
+    if _settings is None:
+        _settings = AppSettings()
+    return _settings
+
+
 def save_theme(theme_name: str) -> None:
     """Зберігає тему інтерфейсу.
 
     Args:
         theme_name (str): Назва теми (наприклад 'dark_theme').
     """
-    SETTINGS.setValue("app_theme", theme_name)
+    get_settings().theme = theme_name
 
 
 def load_theme() -> str:
@@ -19,7 +154,7 @@ def load_theme() -> str:
     Returns:
         str: Назва теми або 'dark_theme' за замовчуванням.
     """
-    return str(SETTINGS.value("app_theme", "dark_theme"))
+    return get_settings().theme
 
 
 def save_language(lang_code: str) -> None:
@@ -28,7 +163,7 @@ def save_language(lang_code: str) -> None:
     Args:
         lang_code (str): Код мови (наприклад 'en', 'ukr').
     """
-    SETTINGS.setValue("language", lang_code)
+    get_settings().language = lang_code
 
 
 def load_language() -> str:
@@ -37,7 +172,7 @@ def load_language() -> str:
     Returns:
         str: Код мови або 'en' за замовчуванням.
     """
-    return str(SETTINGS.value("language", "en"))
+    return get_settings().language
 
 
 def save_notifications(enabled: bool) -> None:
@@ -46,7 +181,7 @@ def save_notifications(enabled: bool) -> None:
     Args:
         enabled (bool): True, якщо сповіщення увімкнені.
     """
-    SETTINGS.setValue("notifications", enabled)
+    get_settings().notifications = enabled
 
 
 def load_notifications() -> bool:
@@ -55,7 +190,7 @@ def load_notifications() -> bool:
     Returns:
         bool: Стан сповіщень.
     """
-    return bool(SETTINGS.value("notifications", True, type=bool))
+    return get_settings().notifications
 
 
 def save_view_mode(mode: str) -> None:
@@ -64,7 +199,7 @@ def save_view_mode(mode: str) -> None:
     Args:
         mode (str): Режим ('daily', 'weekly' тощо).
     """
-    SETTINGS.setValue("view_mode", mode)
+    get_settings().view_mode = mode
 
 
 def load_view_mode() -> str:
@@ -73,4 +208,40 @@ def load_view_mode() -> str:
     Returns:
         str: Режим відображення.
     """
-    return str(SETTINGS.value("view_mode", "daily"))
+    return get_settings().view_mode
+
+
+def save_render_engine(engine: str) -> None:
+    """Зберігає рушій відображення розкладу.
+
+    Args:
+        engine (str): Рушій ('widgets' або 'scene').
+    """
+    get_settings().render_engine = engine
+
+
+def load_render_engine() -> str:
+    """Повертає збережений рушій відображення розкладу.
+
+    Returns:
+        str: Рушій або 'widgets' за замовчуванням.
+    """
+    return get_settings().render_engine
+
+
+def save_compression_level(level: int) -> None:
+    """Зберігає рівень стиснення для експорту у .gz/.bz2/.xz.
+
+    Args:
+        level (int): Рівень стиснення (1–9).
+    """
+    get_settings().compression_level = level
+
+
+def load_compression_level() -> int:
+    """Повертає збережений рівень стиснення.
+
+    Returns:
+        int: Рівень стиснення або 6 за замовчуванням.
+    """
+    return get_settings().compression_level
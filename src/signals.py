@@ -3,13 +3,20 @@ from PyQt6.QtCore import pyqtSignal, QObject
 
 class AppSignals(QObject):
     show_notification = pyqtSignal(str, bool)
-    load_current_theme = pyqtSignal()
-    update_all_button_icons = pyqtSignal()
     set_new_language = pyqtSignal(str)
-    lessons_imported = pyqtSignal(list)
-    render_lessons = pyqtSignal()
+    set_render_engine = pyqtSignal(str)
     lesson_updated = pyqtSignal(object)
     lesson_deleted = pyqtSignal(object)
+    db_error = pyqtSignal(str)
+    lessons_loaded = pyqtSignal(str, list)
+    lesson_conflict = pyqtSignal(object)
+    lesson_added = pyqtSignal(object)
+    lesson_saved = pyqtSignal(object)
+    lesson_removed = pyqtSignal(object)
+    lesson_missing = pyqtSignal(object)
+    lessons_replaced = pyqtSignal(int)
+    job_progress = pyqtSignal(object, int, int, float, float)
+    job_finished = pyqtSignal(object)
 
 
 app_signals = AppSignals()
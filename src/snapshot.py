@@ -0,0 +1,257 @@
+"""
+Бінарний формат знімка розкладу.
+
+Структура файлу (little-endian):
+- заголовок HEADER: сигнатура, версія, розмір запису, кількість записів
+  та зміщення секцій;
+- записи RECORD фіксованої ширини: id, коди рядків для текстових полів
+  та вже розібрані індекс дня і час у хвилинах;
+- таблиця рядків: кількість, масив зміщень і UTF-8 дані всіх унікальних
+  рядків.
+
+SnapshotReader відкриває файл через mmap і розпаковує записи прямо з
+відображеної пам'яті, а рядки декодує ліниво, тому завантаження не
+потребує розбору тексту чи часу.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from src.lesson_store import MISSING, NULL_STRING, to_column
+from src.models import Lesson, day_to_index, restore_lesson, time_to_minutes
+
+MAGIC = b"SCHEDSNP"
+VERSION = 1
+
+# сигнатура, версія, прапорці, розмір запису, кількість записів,
+# зміщення записів, зміщення таблиці рядків
+HEADER = struct.Struct("<8sHHIQQQ")
+# id, day, subject, start_time, end_time, type, room, color, day_index, start_min, end_min
+RECORD = struct.Struct("<q7I3H")
+
+
+class SnapshotError(ValueError):
+    """Файл не є коректним знімком розкладу."""
+
+
+class SnapshotWriter:
+    """Потоковий запис знімка розкладу.
+
+    Записи додаються частинами одразу у файл, таблиця рядків накопичується
+    в пам'яті (лише унікальні значення) і записується разом із заголовком
+    при закритті.
+    """
+
+    def __init__(self, f: BinaryIO):
+        """Ініціалізація запису.
+
+        Args:
+            f (BinaryIO): Відкритий для запису бінарний файл з підтримкою seek.
+        """
+        self.f = f
+        self.count = 0
+        self._strings: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self._start = f.tell()
+        f.write(b"\0" * HEADER.size)
+
+    def _code(self, value: Optional[str]) -> int:
+        """Повертає код рядка, додаючи його до таблиці за потреби."""
+        if value is None:
+            return NULL_STRING
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._strings)
+            self._strings.append(value)
+        return code
+
+    def write_rows(self, rows: Sequence[tuple]) -> None:
+        """Записує рядки уроків у порядку колонок LESSON_COLUMNS.
+
+        Args:
+            rows (Sequence[tuple]): Рядки (id, day, subject, start_time,
+                end_time, type, room, color).
+        """
+        code = self._code
+        self.f.write(b"".join(
+            RECORD.pack(
+                int(lesson_id), code(day), code(subject), code(start_time), code(end_time),
+                code(lesson_type), code(room), code(color),
+                to_column(day_to_index(day)),
+                to_column(time_to_minutes(start_time)),
+                to_column(time_to_minutes(end_time))
+            )
+            for lesson_id, day, subject, start_time, end_time, lesson_type, room, color in rows
+        ))
+        self.count += len(rows)
+
+    def close(self) -> None:
+        """Записує таблицю рядків та заголовок."""
+        strings_offset = self.f.tell() - self._start
+        encoded = [s.encode("utf-8") for s in self._strings]
+        offsets = array("I", [0])
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+        if sys.byteorder != "little":
+            offsets.byteswap()
+
+        self.f.write(struct.pack("<I", len(encoded)))
+        self.f.write(offsets.tobytes())
+        self.f.writelines(encoded)
+
+        end = self.f.tell()
+        self.f.seek(self._start)
+        self.f.write(HEADER.pack(MAGIC, VERSION, 0, RECORD.size, self.count,
+                                 HEADER.size, strings_offset))
+        self.f.seek(end)
+
+
+def write_snapshot(batches: Iterable[Sequence[tuple]], f: BinaryIO) -> int:
+    """
+    Записує частини рядків уроків у бінарний знімок.
+
+    Args:
+        batches (Iterable[Sequence[tuple]]): Частини рядків у порядку LESSON_COLUMNS.
+        f (BinaryIO): Відкритий для запису бінарний файл.
+
+    Returns:
+        int: Кількість записаних уроків.
+    """
+    writer = SnapshotWriter(f)
+    for rows in batches:
+        writer.write_rows(rows)
+    writer.close()
+    return writer.count
+
+
+class SnapshotReader:
+    """Читання знімка розкладу через mmap.
+
+    Attributes:
+        RECORD_SIZE (int): Розмір одного запису в байтах.
+        path (str): Шлях до файлу.
+        size (int): Розмір файлу в байтах.
+        records_offset (int): Зміщення першого запису.
+    """
+
+    RECORD_SIZE = RECORD.size
+
+    def __init__(self, path: str):
+        """Відкриває та перевіряє знімок.
+
+        Args:
+            path (str): Шлях до файлу знімка.
+
+        Raises:
+            SnapshotError: Якщо файл пошкоджений або має іншу версію.
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Порожній файл
+                raise SnapshotError("File is empty") from None
+        try:
+            self._parse()
+        except (SnapshotError, struct.error) as e:
+            self.close()
+            raise SnapshotError(str(e)) from None
+
+    def _parse(self) -> None:
+        """Перевіряє заголовок і межі секцій."""
+        self.size = len(self._mm)
+        magic, version, _, record_size, count, records_offset, strings_offset = \
+            HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise SnapshotError("Not a schedule snapshot")
+        if version != VERSION or record_size != RECORD.size:
+            raise SnapshotError(f"Unsupported snapshot version {version}")
+        if records_offset + count * record_size > strings_offset or strings_offset + 4 > self.size:
+            raise SnapshotError("Snapshot is truncated")
+
+        string_count, = struct.unpack_from("<I", self._mm, strings_offset)
+        offsets_start = strings_offset + 4
+        data_start = offsets_start + (string_count + 1) * 4
+        if data_start > self.size:
+            raise SnapshotError("Snapshot is truncated")
+
+        self._offsets = array("I", self._mm[offsets_start:data_start])
+        if sys.byteorder != "little":
+            self._offsets.byteswap()
+        if data_start + self._offsets[-1] > self.size:
+            raise SnapshotError("Snapshot is truncated")
+
+        self.records_offset = records_offset
+        self._count = count
+        self._data_start = data_start
+        self._strings: List[Optional[str]] = [None] * string_count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> "SnapshotReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Закриває відображення файлу."""
+        self._mm.close()
+
+    def string(self, code: int) -> Optional[str]:
+        """Повертає рядок за кодом, декодуючи його при першому зверненні.
+
+        Raises:
+            SnapshotError: Якщо код виходить за межі таблиці.
+        """
+        if code == NULL_STRING:
+            return None
+        try:
+            value = self._strings[code]
+        except IndexError:
+            raise SnapshotError(f"Invalid string reference {code}") from None
+        if value is None:
+            start = self._data_start + self._offsets[code]
+            end = self._data_start + self._offsets[code + 1]
+            value = self._strings[code] = self._mm[start:end].decode("utf-8")
+        return value
+
+    def iter_batches(self, batch_size: int) -> Iterator[List[Lesson]]:
+        """Повертає уроки частинами, розпаковуючи записи прямо з mmap.
+
+        Args:
+            batch_size (int): Кількість уроків в одній частині.
+
+        Yields:
+            List[Lesson]: Частина уроків.
+
+        Raises:
+            SnapshotError: Якщо запис посилається на неіснуючий рядок.
+        """
+        # Таблиця рядків невелика, тому декодується один раз цілком
+        strings = {code: self.string(code) for code in range(len(self._strings))}
+        strings[NULL_STRING] = None
+        minutes = {MISSING: None}
+        view = memoryview(self._mm)
+        try:
+            for first in range(0, self._count, batch_size):
+                start = self.records_offset + first * RECORD.size
+                end = start + min(batch_size, self._count - first) * RECORD.size
+                yield [
+                    restore_lesson(
+                        lesson_id, strings[day], strings[subject], strings[start_time],
+                        strings[end_time], strings[lesson_type], strings[room], strings[color],
+                        minutes.get(day_index, day_index), minutes.get(start_min, start_min),
+                        minutes.get(end_min, end_min)
+                    )
+                    for (lesson_id, day, subject, start_time, end_time, lesson_type, room,
+                         color, day_index, start_min, end_min) in RECORD.iter_unpack(view[start:end])
+                ]
+        except KeyError as e:
+            raise SnapshotError(f"Invalid string reference {e.args[0]}") from None
+        finally:
+            view.release()
@@ -0,0 +1,133 @@
+"""
+Кеш тем оформлення.
+
+ThemeManager один раз читає QSS обох тем та всі варіанти іконок
+(<назва>-light.png / <назва>-dark.png), тому зміна теми не звертається
+до диска. Іконки масштабуються під розмір і devicePixelRatio кнопки один
+раз, а готові QPixmap та QIcon кешуються для кожної щільності екрана.
+"""
+
+import os
+from typing import Dict, Optional, Tuple
+
+from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtGui import QIcon, QPixmap
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STYLES_DIR = os.path.join(BASE_DIR, "styles")
+ICONS_DIR = os.path.join(BASE_DIR, "images", "icons")
+
+THEMES = ("dark_theme", "light_theme")
+# Суфікс файлу іконки для кожної теми
+ICON_SUFFIXES = {"dark_theme": "-dark", "light_theme": "-light"}
+
+
+class ThemeManager:
+    """Завантажені в пам'ять стилі та іконки всіх тем."""
+
+    def __init__(self, styles_dir: str = STYLES_DIR, icons_dir: str = ICONS_DIR):
+        """Ініціалізація: читає QSS усіх тем та всі файли іконок.
+
+        Args:
+            styles_dir (str): Каталог з файлами <тема>.qss.
+            icons_dir (str): Каталог з іконками PNG.
+        """
+        self._stylesheets: Dict[str, str] = {}
+        for theme in THEMES:
+            try:
+                with open(os.path.join(styles_dir, f"{theme}.qss"), "r", encoding="utf-8") as f:
+                    self._stylesheets[theme] = f.read()
+            except IOError as e:
+                print(f"Theme load error: {e}")
+                self._stylesheets[theme] = ""
+
+        # Вихідні зображення за назвою файлу без розширення ('globe-dark')
+        self._sources: Dict[str, QPixmap] = {}
+        for file_name in os.listdir(icons_dir):
+            name, ext = os.path.splitext(file_name)
+            if ext.lower() == ".png":
+                pixmap = QPixmap(os.path.join(icons_dir, file_name))
+                if not pixmap.isNull():
+                    self._sources[name] = pixmap
+
+        self._pixmaps: Dict[Tuple[str, int, int, float], QPixmap] = {}
+        self._icons: Dict[Tuple[str, str, int, int, float], QIcon] = {}
+
+    def stylesheet(self, theme: str) -> str:
+        """Повертає QSS теми (темна тема, якщо тема невідома)."""
+        return self._stylesheets.get(theme, self._stylesheets["dark_theme"])
+
+    def _source(self, name: str, theme: str) -> Optional[Tuple[str, QPixmap]]:
+        """Знаходить варіант іконки для теми або іконку без суфікса."""
+        for key in (f"{name}{ICON_SUFFIXES.get(theme, '-dark')}", name):
+            pixmap = self._sources.get(key)
+            if pixmap is not None:
+                return key, pixmap
+        return None
+
+    def pixmap(self, name: str, theme: str, size: QSize, dpr: float = 1.0) -> QPixmap:
+        """
+        Повертає іконку, масштабовану під розмір та щільність екрана.
+
+        Args:
+            name (str): Назва іконки без суфікса теми ('globe').
+            theme (str): Тема ('dark_theme' або 'light_theme').
+            size (QSize): Логічний розмір іконки.
+            dpr (float): devicePixelRatio екрана.
+
+        Returns:
+            QPixmap: Масштабоване зображення (порожнє, якщо іконки немає).
+        """
+        found = self._source(name, theme)
+        if found is None:
+            return QPixmap()
+        source_key, source = found
+
+        cache_key = (source_key, size.width(), size.height(), dpr)
+        pixmap = self._pixmaps.get(cache_key)
+        if pixmap is None:
+            pixmap = source.scaled(
+                size * dpr, Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            pixmap.setDevicePixelRatio(dpr)
+            self._pixmaps[cache_key] = pixmap
+        return pixmap
+
+    def icon(self, name: str, theme: str, size: QSize, dpr: float = 1.0) -> QIcon:
+        """
+        Повертає закешовану іконку для теми, розміру та щільності екрана.
+
+        Args:
+            name (str): Назва іконки без суфікса теми ('globe').
+            theme (str): Тема ('dark_theme' або 'light_theme').
+            size (QSize): Логічний розмір іконки.
+            dpr (float): devicePixelRatio екрана.
+
+        Returns:
+            QIcon: Іконка (порожня, якщо файлу немає).
+        """
+        cache_key = (name, theme, size.width(), size.height(), dpr)
+        icon = self._icons.get(cache_key)
+        if icon is None:
+            icon = QIcon(self.pixmap(name, theme, size, dpr))
+            self._icons[cache_key] = icon
+        return icon
+
+
+_manager: Optional[ThemeManager] = None
+
+
+def get_theme_manager() -> ThemeManager:
+    """Повертає спільний кеш тем.
+
+    QPixmap потребує QApplication, тому кеш створюється при першому
+    виклику, а не під час імпорту модуля.
+
+    Returns:
+        ThemeManager: Єдиний екземпляр на процес.
+    """
+    global _manager
+    if _manager is None:
+        _manager = ThemeManager()
+    return _manager
@@ -3,19 +3,27 @@
 
 Підтримує:
 - Експорт у формат CSV
-- Експорт у формат JSON
+- Експорт у формат JSON (з відступами або компактно)
+- Експорт у формат NDJSON (один урок на рядок)
+- Експорт у бінарний знімок розкладу (.schedule)
+- Потокове стиснення (.gz, .bz2, .xz) з налаштовуваним рівнем
 - Вибір місця збереження файлу
 - Повідомлення про результат операції
+
+Сам запис виконується у фоновому потоці потоково з курсора бази даних.
 """
 
-import sqlite3
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QPushButton
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QCheckBox, QFileDialog, QLabel, QSpinBox
+)
 
 from src.signals import app_signals
 from src.language import tr
-from src.utils import export_to_csv, export_to_json
-from src.database import DB_PATH
-from src.models import Lesson
+from src.compression import MIN_LEVEL, MAX_LEVEL
+from src.formats import get_format
+from src.jobs import Job, get_job_runner
+from src.settings import load_compression_level, save_compression_level
+from src.ui.job_progress import JobProgressPanel
 
 
 class ExportDialog(QDialog):
@@ -31,7 +39,10 @@ class ExportDialog(QDialog):
             parent: Батьківський віджет
         """
         super().__init__(parent)
+        self._format_type = None
+        self._job = None
         self._init_ui()
+        app_signals.job_finished.connect(self._on_job_finished)
 
     def _init_ui(self) -> None:
         """Ініціалізація інтерфейсу користувача."""
@@ -43,61 +54,114 @@ class ExportDialog(QDialog):
 
         self.csv_btn = QPushButton(tr("app.export.csv"))
         self.json_btn = QPushButton(tr("app.export.json"))
+        self.ndjson_btn = QPushButton(tr("app.export.ndjson"))
+        self.binary_btn = QPushButton(tr("app.export.binary"))
+        self.compact_check = QCheckBox(tr("app.export.compact_json"))
 
         self.csv_btn.clicked.connect(self._export_as_csv)
         self.json_btn.clicked.connect(self._export_as_json)
+        self.ndjson_btn.clicked.connect(self._export_as_ndjson)
+        self.binary_btn.clicked.connect(self._export_as_binary)
 
         layout.addWidget(self.csv_btn)
         layout.addWidget(self.json_btn)
+        layout.addWidget(self.ndjson_btn)
+        layout.addWidget(self.binary_btn)
+        layout.addWidget(self.compact_check)
+
+        self.level_spin = QSpinBox()
+        self.level_spin.setRange(MIN_LEVEL, MAX_LEVEL)
+        self.level_spin.setValue(load_compression_level())
+        level_row = QHBoxLayout()
+        level_row.addWidget(QLabel(tr("app.export.compression_level")))
+        level_row.addWidget(self.level_spin)
+        layout.addLayout(level_row)
+
+        self.progress_panel = JobProgressPanel(self)
+        layout.addWidget(self.progress_panel)
 
         self.setLayout(layout)
 
     def _export_as_csv(self) -> None:
         """Експортує дані у формат CSV."""
-        lessons = self._get_lessons_from_db()
-        if not lessons:
-            self._show_error(tr("app.export.no_data"))
-            return
-
-        result = export_to_csv(lessons, self)
-        self._handle_export_result(result, "csv")
+        self._start_export("csv")
 
     def _export_as_json(self) -> None:
         """Експортує дані у формат JSON."""
-        lessons = self._get_lessons_from_db()
-        if not lessons:
+        self._start_export("json")
+
+    def _export_as_ndjson(self) -> None:
+        """Експортує дані у формат NDJSON."""
+        self._start_export("ndjson")
+
+    def _export_as_binary(self) -> None:
+        """Експортує дані у бінарний знімок розкладу."""
+        self._start_export("binary")
+
+    def _start_export(self, format_type: str) -> None:
+        """Запитує шлях до файлу та запускає фоновий експорт.
+
+        Args:
+            format_type: Тип формату ('csv', 'json', 'ndjson' або 'binary')
+        """
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, tr(f"app.export.{format_type}"), "", get_format(format_type).save_filter
+        )
+        if not file_path:  # Користувач скасував операцію
+            self.reject()
+            return
+
+        level = self.level_spin.value()
+        save_compression_level(level)
+        self._format_type = format_type
+        self._set_buttons_enabled(False)
+        self._job = get_job_runner().run_export(
+            file_path, format_type, self.compact_check.isChecked(), level
+        )
+        self.progress_panel.track(self._job)
+
+    def _on_job_finished(self, job: Job) -> None:
+        """Обробляє завершення фонового експорту.
+
+        Args:
+            job: Завершене завдання
+        """
+        if job is not self._job:
+            return
+        self._job = None
+        self.progress_panel.reset()
+        self._set_buttons_enabled(True)
+
+        if job.state == Job.CANCELLED:
+            return
+        if job.state == Job.DONE and job.result == 0:
             self._show_error(tr("app.export.no_data"))
             return
+        self._handle_export_result(job.state == Job.DONE, self._format_type)
 
-        result = export_to_json(lessons, self)
-        self._handle_export_result(result, "json")
+    def reject(self) -> None:
+        """Скасовує експорт, якщо вікно закривають під час його виконання."""
+        self.progress_panel.cancel()
+        super().reject()
 
-    @staticmethod
-    def _get_lessons_from_db() -> list[Lesson]:
-        """Отримує уроки з бази даних.
+    def _set_buttons_enabled(self, enabled: bool) -> None:
+        """Вмикає або вимикає кнопки експорту.
 
-        Returns:
-            Список об'єктів Lesson
+        Args:
+            enabled: Чи доступні кнопки
         """
-        try:
-            with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM lessons")
-                return [Lesson(*row) for row in cursor.fetchall()]
-        except sqlite3.Error:
-            return []
+        self.csv_btn.setEnabled(enabled)
+        self.json_btn.setEnabled(enabled)
+        self.ndjson_btn.setEnabled(enabled)
+        self.binary_btn.setEnabled(enabled)
 
     def _handle_export_result(self, result: bool, format_type: str) -> None:
         """Обробляє результат експорту.
 
         Args:
             result: Результат операції експорту
-            format_type: Тип формату ('csv' або 'json')
+            format_type: Тип формату ('csv', 'json', 'ndjson' або 'binary')
         """
-        if result is None:  # Користувач скасував операцію
-            self.reject()
-            return
-
         key = f"{format_type}_success" if result else f"{format_type}_failed"
         self._show_notification(tr(f"app.export.{key}"), result)
         self.accept() if result else self.reject()
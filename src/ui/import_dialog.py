@@ -5,18 +5,22 @@
 - Вибір файлу через діалогове вікно
 - Drag-and-drop файлів
 - Валідацію формату файлу
-- Імпорт уроків у базу даних
+- Бінарні знімки розкладу (.schedule)
+- Стиснені файли (.csv.gz, .json.gz, .json.bz2, .json.xz тощо)
+- Імпорт уроків у базу даних із заміною або злиттям з поточним розкладом
 """
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel,
-    QFileDialog
+    QFileDialog, QCheckBox, QComboBox
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent
 from src.language import tr
-from src.utils import import_from_csv, import_from_json
+from src.jobs import Job, get_job_runner
+from src.formats import ImportReport, detect_format, iter_lessons, open_file_filters
 from src.signals import app_signals
+from src.ui.job_progress import JobProgressPanel
 
 
 class ImportDialog(QDialog):
@@ -24,7 +28,14 @@ class ImportDialog(QDialog):
 
     MIN_WIDTH = 400
     MIN_HEIGHT = 300
-    FILE_FILTERS = "CSV Files (*.csv);;JSON Files (*.json)"
+    # Режими імпорту: (режим, ключ зіставлення, ключ перекладу)
+    IMPORT_MODES = (
+        ("replace", "id", "app.import.mode_replace"),
+        ("merge", "id", "app.import.mode_merge_id"),
+        ("merge", "natural", "app.import.mode_merge_natural"),
+    )
+    # Скільки помилок зі звіту показувати у вікні
+    MAX_SHOWN_ERRORS = 5
 
     def __init__(self, parent=None):
         """Ініціалізація діалогового вікна.
@@ -34,7 +45,10 @@ class ImportDialog(QDialog):
         """
         super().__init__(parent)
         self.parent = parent
+        self._job = None
+        self._format = "csv"
         self._init_ui()
+        app_signals.job_finished.connect(self._on_job_finished)
 
     def _init_ui(self) -> None:
         """Ініціалізація інтерфейсу користувача."""
@@ -49,11 +63,27 @@ class ImportDialog(QDialog):
         self.label.setStyleSheet("border: 2px dashed #aaa; padding: 20px;")
         layout.addWidget(self.label)
 
+        self.mode_combo = QComboBox()
+        for _, _, text_key in self.IMPORT_MODES:
+            self.mode_combo.addItem(tr(text_key))
+        layout.addWidget(self.mode_combo)
+
+        self.parallel_check = QCheckBox(tr("app.import.parallel"))
+        layout.addWidget(self.parallel_check)
+
+        self.progress_panel = JobProgressPanel(self)
+        layout.addWidget(self.progress_panel)
+
         self.setLayout(layout)
 
+    def reject(self) -> None:
+        """Скасовує імпорт, якщо вікно закривають під час його виконання."""
+        self.progress_panel.cancel()
+        super().reject()
+
     def mousePressEvent(self, event) -> None:
         """Обробка click мишею для відкриття файлу."""
-        if event.button() == Qt.MouseButton.LeftButton:
+        if event.button() == Qt.MouseButton.LeftButton and self._job is None:
             self._open_file_dialog()
 
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
@@ -73,7 +103,7 @@ class ImportDialog(QDialog):
             self,
             tr("app.import.select_file"),
             "",
-            self.FILE_FILTERS
+            open_file_filters()
         )
         if file_path:
             self._handle_file(file_path)
@@ -81,48 +111,85 @@ class ImportDialog(QDialog):
     def _handle_file(self, file_path: str) -> None:
         """Обробляє вибраний файл для імпорту.
 
+        Формат визначається за розширенням; стиснені файли (.gz, .bz2,
+        .xz) розпаковуються потоково під час читання.
+
         Args:
             file_path: Шлях до файлу для імпорту
         """
         try:
-            if file_path.endswith(".csv"):
-                self._import_csv(file_path)
-            elif file_path.endswith(".json"):
-                self._import_json(file_path)
-            else:
+            fmt = detect_format(file_path)
+            if fmt is None:
                 self._show_error(tr("app.import.unsupported_format"))
+            else:
+                self._start_import(fmt, file_path)
 
         except Exception as e:
             print(f"Import dialog error: {e}")
             self._show_error(tr("app.import.file_corrupted"))
 
-    def _import_csv(self, file_path: str) -> None:
-        """Імпортує дані з CSV файлу.
+    def _start_import(self, fmt: str, file_path: str) -> None:
+        """Запускає потоковий імпорт у фоновому потоці.
 
         Args:
-            file_path: Шлях до CSV файлу
+            fmt: Формат файлу ('csv', 'json', 'ndjson' або 'binary')
+            file_path: Шлях до файлу
         """
-        lessons = import_from_csv(file_path)
-        if not lessons:
-            self._show_error(tr("app.import.csv_failed"))
+        if self._job is not None:
             return
 
-        app_signals.lessons_imported.emit(lessons)
-        self._show_success(tr("app.import.csv_success"))
+        mode, key, _ = self.IMPORT_MODES[self.mode_combo.currentIndex()]
+
+        self._format = fmt
+        report = ImportReport()
+        self.label.setText(tr("app.import.progress"))
+        self._job = get_job_runner().run_import(
+            iter_lessons(file_path, fmt, report=report, parallel=self.parallel_check.isChecked()),
+            report, mode, key
+        )
+        self.progress_panel.track(self._job)
 
-    def _import_json(self, file_path: str) -> None:
-        """Імпортує дані з JSON файлу.
+    def _on_job_finished(self, job: Job) -> None:
+        """Показує результат фонового імпорту.
 
         Args:
-            file_path: Шлях до JSON файлу
+            job: Завершене завдання
         """
-        lessons = import_from_json(file_path)
-        if not lessons:
-            self._show_error(tr("app.import.json_failed"))
+        if job is not self._job:
+            return
+
+        self._job = None
+        self.progress_panel.reset()
+        if job.state == Job.CANCELLED:
+            self.label.setText(tr("app.jobs.cancelled"))
+            return
+        if job.state == Job.FAILED:
+            self._show_error(tr("app.import.file_corrupted"))
+            return
+
+        report = job.result
+        if report.ok and report.merge_result is not None:
+            result = report.merge_result
+            self._show_success(tr("app.import.merge_success").format(
+                inserted=result.inserted, updated=result.updated, unchanged=result.unchanged
+            ))
+            return
+        if report.ok:
+            self._show_success(tr(f"app.import.{self._format}_success"))
             return
 
-        app_signals.lessons_imported.emit(lessons)
-        self._show_success(tr("app.import.json_success"))
+        lines = [tr(f"app.import.{self._format}_failed")]
+        shown = report.errors[:self.MAX_SHOWN_ERRORS]
+        for issue in shown:
+            reason = tr(f"app.import.error_{issue.reason}").format(detail=issue.detail)
+            if issue.line:
+                reason = tr("app.import.error_line").format(line=issue.line, reason=reason)
+            lines.append(reason)
+        hidden = report.error_count - len(shown)
+        if hidden > 0:
+            lines.append(tr("app.import.more_errors").format(count=hidden))
+        self.label.setText("\n".join(lines))
+        app_signals.show_notification.emit(lines[0], False)
 
     def _show_success(self, message: str) -> None:
         """Показує повідомлення про успішний імпорт.
@@ -0,0 +1,104 @@
+"""
+Панель прогресу фонового завдання.
+
+Показує відсоток виконання, кількість оброблених рядків, швидкість
+(рядків і байтів за секунду) та кнопку скасування. Використовується
+діалогами імпорту та експорту.
+"""
+
+from typing import Optional
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QPushButton
+
+from src.jobs import Job
+from src.language import tr
+from src.signals import app_signals
+
+
+def _format_bytes(value: float) -> str:
+    """Форматує кількість байтів у зручному для читання вигляді."""
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+class JobProgressPanel(QWidget):
+    """Панель прогресу одного фонового завдання."""
+
+    def __init__(self, parent=None):
+        """Ініціалізація панелі.
+
+        Args:
+            parent: Батьківський віджет
+        """
+        super().__init__(parent)
+        self.job: Optional[Job] = None
+        self._init_ui()
+        self.setVisible(False)
+        app_signals.job_progress.connect(self._on_job_progress)
+
+    def _init_ui(self) -> None:
+        """Ініціалізація інтерфейсу користувача."""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.progress_bar = QProgressBar()
+        self.stats_label = QLabel()
+        self.cancel_btn = QPushButton(tr("app.jobs.cancel"))
+        self.cancel_btn.clicked.connect(self.cancel)
+
+        row = QHBoxLayout()
+        row.addWidget(self.stats_label, 1)
+        row.addWidget(self.cancel_btn)
+
+        layout.addWidget(self.progress_bar)
+        layout.addLayout(row)
+
+    def track(self, job: Job) -> None:
+        """Починає відображати прогрес завдання.
+
+        Args:
+            job: Завдання
+        """
+        self.job = job
+        self.progress_bar.setValue(0)
+        # Поки обсяг невідомий, смуга показує індикатор зайнятості
+        self.progress_bar.setRange(0, 0)
+        self.stats_label.setText("")
+        self.cancel_btn.setEnabled(True)
+        self.setVisible(True)
+
+    def reset(self) -> None:
+        """Ховає панель після завершення завдання."""
+        self.job = None
+        self.setVisible(False)
+
+    def cancel(self) -> None:
+        """Скасовує завдання, що відображається."""
+        if self.job is not None:
+            self.job.cancel()
+            self.cancel_btn.setEnabled(False)
+
+    def _on_job_progress(self, job: Job, percent: int, rows: int,
+                         rows_per_sec: float, bytes_per_sec: float) -> None:
+        """Оновлює смугу прогресу та показники швидкості.
+
+        Args:
+            job: Завдання, що надіслало сигнал
+            percent: Відсоток виконання (0, якщо обсяг невідомий)
+            rows: Кількість оброблених рядків
+            rows_per_sec: Швидкість у рядках за секунду
+            bytes_per_sec: Швидкість у байтах за секунду
+        """
+        if job is not self.job:
+            return
+        if job.bytes_total or job.rows_total:
+            self.progress_bar.setRange(0, 100)
+            self.progress_bar.setValue(percent)
+        self.stats_label.setText(tr("app.jobs.stats").format(
+            rows=rows,
+            rows_per_sec=round(rows_per_sec),
+            speed=_format_bytes(bytes_per_sec)
+        ))
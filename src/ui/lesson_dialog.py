@@ -263,8 +263,8 @@ class LessonDialog(QDialog):
         if not self._validate_inputs():
             return
 
-        lesson = self.get_data()
-        app_signals.lesson_updated.emit(lesson)  # Emit signal for save
+        if self.edit_mode:
+            app_signals.lesson_updated.emit(self.get_data())  # Emit signal for save
         self.accept()
 
     def delete_and_close(self) -> None:
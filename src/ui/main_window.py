@@ -5,25 +5,24 @@
 Також надає функціонал зміни теми, мови та сповіщень.
 """
 
-import os
-import sqlite3
 from typing import List, Tuple
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QFrame, QToolButton
 )
 from PyQt6.QtGui import QIcon
 from PyQt6.QtCore import Qt
-from src.database import DB_PATH
+from src.db_executor import DatabaseExecutor, get_executor
 from src.models import Lesson
 from src.notification import Notification
 from src.ui.export_dialog import ExportDialog
 from src.ui.import_dialog import ImportDialog
 from src.ui.lesson_dialog import LessonDialog
-from src.settings import save_theme, load_theme, load_language, load_notifications
+from src.settings import get_settings, save_theme, load_theme, load_language, load_notifications
 from src.ui.settings_dialog import SettingsDialog
 from src.ui.schedule_view import ScheduleWidget
-from src.language import set_language, tr, load_translations
+from src.language import bind_text, load_translations, retranslate, set_language, tr
 from src.signals import app_signals
+from src.themes import get_theme_manager
 
 
 class MainWindow(QMainWindow):
@@ -32,18 +31,25 @@ class MainWindow(QMainWindow):
     def __init__(self) -> None:
         """Ініціалізує головне вікно додатку."""
         super().__init__()
+        load_translations()
         self._setup_window_properties()
         self.notification = Notification(self)
         self.notification.hide()
         self.icon_buttons = []
-        load_translations()
 
         # Connect signals for other files
         app_signals.show_notification.connect(self._show_notification)
-        app_signals.load_current_theme.connect(self._load_current_theme)
-        app_signals.update_all_button_icons.connect(self._update_all_button_icons)
+        get_settings().changed.connect(self._on_setting_changed)
         app_signals.set_new_language.connect(self._set_new_language)
-        app_signals.lessons_imported.connect(self._bulk_insert_lessons)
+        app_signals.set_render_engine.connect(self._set_render_engine)
+        app_signals.lessons_loaded.connect(self._on_lessons_loaded)
+        app_signals.lesson_added.connect(self._on_lesson_added)
+        app_signals.lesson_updated.connect(self._update_lesson)
+        app_signals.lesson_deleted.connect(self._delete_lesson)
+        app_signals.lesson_conflict.connect(self._on_lesson_conflict)
+        app_signals.lesson_missing.connect(self._on_lesson_missing)
+        app_signals.lessons_replaced.connect(self._on_lessons_replaced)
+        app_signals.db_error.connect(self._on_db_error)
 
         self.languages = self._initialize_languages()
         self.current_language_index = self._load_language_index()
@@ -53,7 +59,7 @@ class MainWindow(QMainWindow):
 
     def _setup_window_properties(self) -> None:
         """Налаштовує основні властивості вікна."""
-        self.setWindowTitle(tr("app.title"))
+        bind_text(self, "app.title", "setWindowTitle")
         self.setGeometry(100, 50, 1280, 720)
         self.setMinimumSize(1280, 720)
         self._load_current_theme()
@@ -89,7 +95,7 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(right_frame)
         main_layout.setStretch(1, 1)
 
-        self._update_ui_texts()
+        self._bind_ui_texts()
         self._update_all_button_icons()
         self._update_language_button_text()
 
@@ -152,7 +158,6 @@ class MainWindow(QMainWindow):
             QToolButton: Готова кнопка.
         """
         btn = QToolButton()
-        btn.setIcon(QIcon(f"src/images/icons/{icon_name}"))
         btn.setText(text)
         btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         btn.setObjectName("sidebarButton")
@@ -178,152 +183,144 @@ class MainWindow(QMainWindow):
         _, lang_code = self.languages[self.current_language_index]
         set_language(lang_code)
         self._update_language_button_text()
-        self._update_ui_texts()
-        self.schedule_widget.refresh_translation()
+        retranslate()
 
     def _update_language_button_text(self) -> None:
         """Оновлює текст кнопки зміни мови."""
         lang_name, _ = self.languages[self.current_language_index]
         self.language_button.setText(lang_name)
 
-    def _update_ui_texts(self) -> None:
-        """Оновлює всі тексти інтерфейсу відповідно до поточної мови."""
-        self.setWindowTitle(tr("app.title"))
-        self.add_btn.setText(tr("app.buttons.add"))
-        self.export_schedule.setText(tr("app.buttons.export_csv"))
-        self.import_schedule.setText(tr("app.buttons.import_csv"))
-        self.settings_btn.setText(tr("app.buttons.settings"))
-        theme_text = tr("app.buttons.light_theme") if load_theme() == "light_theme" else tr("app.buttons.dark_theme")
-        self.theme_btn.setText(theme_text)
+    def _bind_ui_texts(self) -> None:
+        """Встановлює тексти бічної панелі та реєструє їх для зміни мови."""
+        bind_text(self.add_btn, "app.buttons.add")
+        bind_text(self.export_schedule, "app.buttons.export_csv")
+        bind_text(self.import_schedule, "app.buttons.import_csv")
+        bind_text(self.settings_btn, "app.buttons.settings")
+        self._update_theme_button_text()
+
+    def _update_theme_button_text(self) -> None:
+        """Прив'язує кнопку теми до ключа перекладу поточної теми."""
+        theme_key = "app.buttons.light_theme" if load_theme() == "light_theme" else "app.buttons.dark_theme"
+        bind_text(self.theme_btn, theme_key)
 
     def _load_lessons(self) -> None:
-        """Завантажує уроки з бази даних та відображає їх у розкладі."""
-        try:
-            with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM lessons ORDER BY day, start_time")
-                lessons = [Lesson(*row) for row in cursor.fetchall()]
-                self.schedule_widget.set_lessons(lessons)
-        except sqlite3.Error:
-            self._show_notification(tr("app.database.error"), False)
-
-    def _check_lesson_conflict(self, new_lesson: Lesson) -> bool:
-        """Перевіряє, чи є вже урок на цей же час.
+        """Запускає фонове завантаження уроків з бази даних."""
+        self.schedule_widget.set_loading(True)
+        get_executor().load_lessons()
 
-        Args:
-            new_lesson: Новий урок для перевірки
+    def _on_lessons_loaded(self, request: str, lessons: list) -> None:
+        """Відображає завантажені уроки у розкладі.
 
-        Returns:
-            True, якщо є конфлікт, False - якщо ні
+        Args:
+            request (str): Мітка запиту на завантаження.
+            lessons (list): Завантажені уроки.
         """
-        try:
-            with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT COUNT(*) FROM lessons 
-                    WHERE day = ? 
-                    AND (
-                        (start_time <= ? AND end_time > ?) OR
-                        (start_time < ? AND end_time >= ?) OR
-                        (start_time >= ? AND end_time <= ?)
-                    )
-                    AND id != ?
-                """, (
-                    new_lesson.day,
-                    new_lesson.start_time, new_lesson.start_time,
-                    new_lesson.end_time, new_lesson.end_time,
-                    new_lesson.start_time, new_lesson.end_time,
-                    new_lesson.id or -1  # Для нового уроку id буде None
-                ))
-                count = cursor.fetchone()[0]
-                return count > 0
-        except sqlite3.Error:
-            self._show_notification(tr("app.database.error"), False)
-            return False
+        if request != DatabaseExecutor.SCHEDULE_REQUEST:
+            return
+        self.schedule_widget.set_lessons(lessons)
+        self.schedule_widget.set_loading(False)
 
     def _add_lesson(self) -> None:
         """Відкриває діалогове вікно для додавання нового уроку."""
         dialog = LessonDialog(parent=self)
         if dialog.exec() == LessonDialog.DialogCode.Accepted:
-            lesson = dialog.get_data()
-            try:
-                with sqlite3.connect(DB_PATH) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        INSERT INTO lessons (day, subject, start_time, end_time, type, room, color)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        lesson.day, lesson.subject, lesson.start_time,
-                        lesson.end_time, lesson.type, lesson.room, lesson.color
-                    ))
-                    conn.commit()
-                    self._load_lessons()
-                    self._show_notification(tr("app.lesson_dialog.added"), True)
-            except sqlite3.Error:
-                self._show_notification(tr("app.database.error"), False)
-
-    def _bulk_insert_lessons(self, lessons: list) -> None:
-        """Додає список уроків до бази даних.
+            get_executor().add_lesson(dialog.get_data())
+
+    def _on_lesson_added(self, lesson: Lesson) -> None:
+        """Повідомляє про додавання уроку.
+
+        Розклад додає блок уроку сам через сигнал lesson_added, без
+        повторного читання всієї таблиці.
+
+        Args:
+            lesson (Lesson): Доданий урок.
+        """
+        self._show_notification(tr("app.lesson_dialog.added"), True)
+
+    @staticmethod
+    def _update_lesson(lesson: Lesson) -> None:
+        """Зберігає зміни уроку в базі даних.
+
+        Args:
+            lesson (Lesson): Відредагований урок.
+        """
+        get_executor().update_lesson(lesson)
+
+    @staticmethod
+    def _delete_lesson(lesson_id: int) -> None:
+        """Видаляє урок з бази даних.
+
+        Args:
+            lesson_id (int): Ідентифікатор уроку.
+        """
+        get_executor().delete_lesson(lesson_id)
+
+    def _on_lesson_conflict(self, lesson: Lesson) -> None:
+        """Повідомляє, що на цей час уже є урок.
+
+        Args:
+            lesson (Lesson): Урок, який не вдалося зберегти.
+        """
+        self._show_notification(tr("app.lesson_dialog.existing_lesson_error"), False)
+
+    def _on_lesson_missing(self, lesson_id: int) -> None:
+        """Перезавантажує розклад, якщо урок зник з бази даних.
 
         Args:
-            lessons (list): Список уроків для додавання.
+            lesson_id (int): Ідентифікатор уроку, який не вдалося знайти.
         """
-        try:
-            with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM lessons")
-                for lesson in lessons:
-                    cursor.execute("""
-                        INSERT INTO lessons (id, day, subject, start_time, end_time, type, room, color)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        lesson.id, lesson.day, lesson.subject,
-                        lesson.start_time, lesson.end_time,
-                        lesson.type, lesson.room, lesson.color
-                    ))
-                conn.commit()
-                self._load_lessons()
-                self._show_notification(tr("app.import.success"), True)
-        except Exception as e:
-            print(f"Main window error: {e}")
-            self._show_notification(tr("app.import.file_corrupted"), False)
+        self._load_lessons()
+        self._show_notification(tr("app.database.lesson_missing"), False)
+
+    def _on_lessons_replaced(self, count: int) -> None:
+        """Оновлює розклад після імпорту.
+
+        Args:
+            count (int): Кількість імпортованих уроків.
+        """
+        self._load_lessons()
+        self._show_notification(tr("app.import.success"), True)
+
+    def _on_db_error(self, message_key: str) -> None:
+        """Показує повідомлення про помилку бази даних.
+
+        Args:
+            message_key (str): Ключ перекладу повідомлення.
+        """
+        self.schedule_widget.set_loading(False)
+        self._show_notification(tr(message_key), False)
 
     def _load_current_theme(self) -> None:
-        """Завантажує поточну тему інтерфейсу."""
-        current_theme = load_theme()
-        try:
-            with open(f"src/styles/{current_theme}.qss", "r") as f:
-                self.setStyleSheet(f.read())
-        except IOError as e:
-            print(f"Theme load error: {e}")
+        """Застосовує поточну тему інтерфейсу з кешу тем."""
+        self.setStyleSheet(get_theme_manager().stylesheet(load_theme()))
 
     def _toggle_theme(self) -> None:
         """Змінює тему інтерфейсу на протилежну."""
         current = load_theme()
         new_theme = "light_theme" if current == "dark_theme" else "dark_theme"
         save_theme(new_theme)
-        self._load_current_theme()
-        self._update_ui_texts()
-        self._update_all_button_icons()
+
+    def _on_setting_changed(self, name: str, value) -> None:
+        """Реагує на зміну налаштувань, зроблену будь-де в додатку.
+
+        Args:
+            name (str): Назва налаштування.
+            value: Нове значення.
+        """
+        if name == "theme":
+            self._load_current_theme()
+            self._update_theme_button_text()
+            self._update_all_button_icons()
 
     def _update_all_button_icons(self) -> None:
         """Оновлює іконки всіх кнопок відповідно до поточної теми."""
         current_theme = load_theme()
-        suffix = "-light" if current_theme == "light_theme" else "-dark"
+        themes = get_theme_manager()
 
         for btn in self.icon_buttons:
             if not hasattr(btn, "icon_name"):
                 continue
-
-            icon_name = f"{btn.icon_name}{suffix}.png"
-            icon_path = f"src/images/icons/{icon_name}"
-
-            if os.path.exists(icon_path):
-                btn.setIcon(QIcon(icon_path))
-            else:
-                fallback_icon_path = f"src/images/icons/{btn.icon_name}.png"
-                if os.path.exists(fallback_icon_path):
-                    btn.setIcon(QIcon(fallback_icon_path))
+            btn.setIcon(themes.icon(btn.icon_name, current_theme, btn.iconSize(), btn.devicePixelRatioF()))
 
     def _open_settings(self) -> None:
         """Відкриває діалогове вікно налаштувань."""
@@ -342,9 +339,15 @@ class MainWindow(QMainWindow):
                 self.current_language_index = i
                 break
         self._update_language_button_text()
-        self._update_ui_texts()
-        self._update_all_button_icons()
-        self.schedule_widget.refresh_translation()
+        retranslate()
+
+    def _set_render_engine(self, engine: str) -> None:
+        """Встановлює рушій відображення розкладу.
+
+        Args:
+            engine (str): Рушій ('widgets' або 'scene').
+        """
+        self.schedule_widget.set_render_engine(engine)
 
     def _open_export_dialog(self) -> None:
         """Відкриває діалогове вікно експорту."""
@@ -0,0 +1,300 @@
+"""
+Рушій відображення розкладу на основі QGraphicsScene.
+
+Кожен урок — легкий елемент сцени, який малює себе сам, без віджетів,
+макетів і таблиць стилів. Сцена індексує елементи BSP-деревом, тому
+малюються лише ті уроки, що потрапляють у видиму область, а фонова сітка
+малюється тільки для відкритого прямокутника. Масштаб часової осі
+змінюється трансформацією вигляду з плавною анімацією.
+"""
+
+from PyQt6.QtCore import Qt, QRectF, QVariantAnimation, QEasingCurve, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter, QPen, QFont, QFontMetricsF, QTransform
+from PyQt6.QtWidgets import QGraphicsItem, QGraphicsScene, QGraphicsView
+
+from src.lesson_store import LessonStore
+from src.signals import app_signals
+from src.ui.lesson_dialog import LessonDialog
+
+
+class LessonItem(QGraphicsItem):
+    """Елемент сцени, що відображає один урок."""
+
+    DEFAULT_COLOR = "#3a3a3a"
+    DETAILS_MIN_HEIGHT = 100
+    TEXT_MIN_HEIGHT = 14
+
+    def __init__(self, lesson, rect: QRectF):
+        """Ініціалізація елемента.
+
+        Args:
+            lesson: Урок, який відображається
+            rect: Прямокутник уроку в координатах сцени
+        """
+        super().__init__()
+        self.lesson = lesson
+        self._rect = rect
+        self._hovered = False
+        self.setAcceptHoverEvents(True)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+
+    def boundingRect(self) -> QRectF:
+        return self._rect
+
+    def set_lesson(self, lesson, rect: QRectF) -> None:
+        """Оновлює дані та геометрію елемента без його повторного створення."""
+        if rect != self._rect:
+            self.prepareGeometryChange()
+            self._rect = rect
+        self.lesson = lesson
+        self.update()
+
+    def hoverEnterEvent(self, event) -> None:
+        self._hovered = True
+        self.update()
+
+    def hoverLeaveEvent(self, event) -> None:
+        self._hovered = False
+        self.update()
+
+    def paint(self, painter: QPainter, option, widget=None) -> None:
+        color = QColor(self.lesson.color or self.DEFAULT_COLOR)
+        background = QColor(color)
+        background.setAlphaF(0.2 if self._hovered else 0.1)
+
+        rect = self._rect.adjusted(2, 2, -2, -2)
+        painter.setPen(QPen(color, 2))
+        painter.setBrush(background)
+        painter.drawRoundedRect(rect, 4, 4)
+
+        # Текст не масштабується разом з часовою віссю
+        scale_y = painter.worldTransform().m22()
+        height = rect.height() * scale_y
+        if height < self.TEXT_MIN_HEIGHT:
+            return
+
+        painter.save()
+        painter.scale(1, 1 / scale_y)
+        text_rect = QRectF(rect.x() + 5, rect.y() * scale_y + 3, rect.width() - 10, height - 6)
+        painter.setClipRect(text_rect)
+        painter.setPen(color)
+        self._paint_text(painter, text_rect, height)
+        painter.restore()
+
+    def _paint_text(self, painter: QPainter, rect: QRectF, height: float) -> None:
+        """Малює назву, час та (для високих блоків) тип і аудиторію."""
+        base_font_size = max(8, min(14, int(height) // 5))
+        lines = [(self.lesson.subject, min(16, base_font_size + 2), True)]
+        if self.lesson.start_time and self.lesson.end_time:
+            lines.append((f"{self.lesson.start_time} - {self.lesson.end_time}", base_font_size, False))
+        if height >= self.DETAILS_MIN_HEIGHT:
+            lines.extend((text, base_font_size, False) for text in (self.lesson.type, self.lesson.room) if text)
+
+        y = rect.y()
+        for text, font_size, bold in lines:
+            font = QFont(painter.font())
+            font.setPixelSize(font_size)
+            font.setBold(bold)
+            painter.setFont(font)
+            line_height = QFontMetricsF(font).lineSpacing()
+            painter.drawText(QRectF(rect.x(), y, rect.width(), line_height),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, text)
+            y += line_height + 2
+            if y > rect.bottom():
+                break
+
+
+class ScheduleCanvas(QGraphicsView):
+    """Розклад, що малюється на QGraphicsScene.
+
+    Має той самий інтерфейс, що й ScheduleView, тому ScheduleWidget може
+    використовувати будь-який з рушіїв.
+    """
+
+    # Signal to request lesson edit
+    lesson_edit_requested = pyqtSignal(object)
+
+    SLOT_MINUTES = 5
+    SLOT_COUNT = 23 * 60 // SLOT_MINUTES
+    DAY_COUNT = 5
+    GRID_COLOR = "#3a3a3a"
+    TEXT_COLOR = "#ffffff"
+    MIN_ZOOM = 0.5
+    MAX_ZOOM = 4.0
+    ZOOM_STEP = 1.25
+    ZOOM_DURATION = 150
+
+    def __init__(self, time_slot_height=20, day_header_width=100, min_day_width=210):
+        super().__init__()
+        app_signals.lesson_added.connect(self._handle_lesson_updated)
+        app_signals.lesson_saved.connect(self._handle_lesson_updated)
+        app_signals.lesson_removed.connect(self._handle_lesson_deleted)
+        self.lesson_edit_requested.connect(self._handle_lesson_edit_requested)
+        self.time_slot_height = time_slot_height
+        self.day_header_width = day_header_width
+        self.min_day_width = min_day_width
+        self.lesson_items = {}
+        self.lessons = LessonStore()
+        self._zoom = 1.0
+
+        self._setup_scene()
+        self._setup_zoom_animation()
+
+    def _setup_scene(self) -> None:
+        self._scene = QGraphicsScene(self)
+        self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+        self._scene.setSceneRect(
+            0, 0,
+            self.day_header_width + self.DAY_COUNT * self.min_day_width,
+            self.SLOT_COUNT * self.time_slot_height
+        )
+        self.setScene(self._scene)
+        self.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        self.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+
+    def _setup_zoom_animation(self) -> None:
+        self._zoom_animation = QVariantAnimation(self)
+        self._zoom_animation.setDuration(self.ZOOM_DURATION)
+        self._zoom_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self._zoom_animation.valueChanged.connect(self._apply_zoom)
+
+    def set_header_scroll_area(self, header_scroll):
+        self.horizontalScrollBar().valueChanged.connect(header_scroll.horizontalScrollBar().setValue)
+        header_scroll.horizontalScrollBar().valueChanged.connect(self.horizontalScrollBar().setValue)
+
+    def set_lessons(self, lessons):
+        # Блоки прив'язані до id, тому незбережені уроки без id не відображаються
+        self.lessons = LessonStore(lesson for lesson in lessons if lesson.id is not None)
+        self._render_lessons()
+
+    def _render_lessons(self):
+        rendered_keys = set()
+        for lesson in self.lessons:
+            if self._sync_lesson_item(lesson):
+                rendered_keys.add(lesson.id)
+
+        for key in list(self.lesson_items.keys() - rendered_keys):
+            self._remove_lesson_item(key)
+
+    def _lesson_rect(self, lesson):
+        """Повертає прямокутник уроку в координатах сцени або None."""
+        day_index = lesson.day_index
+        start = lesson.start_min
+        if day_index is None or start is None or start < 0 or start % self.SLOT_MINUTES:
+            return None
+        row_index = start // self.SLOT_MINUTES
+        if row_index >= self.SLOT_COUNT:
+            return None
+
+        end = lesson.end_min
+        row_span = max(1, (end - start) // self.SLOT_MINUTES) if end is not None else 1
+        return QRectF(
+            self.day_header_width + day_index * self.min_day_width + 5,
+            row_index * self.time_slot_height,
+            self.min_day_width - 10,
+            row_span * self.time_slot_height
+        )
+
+    def _sync_lesson_item(self, lesson):
+        """Додає або оновлює елемент уроку.
+
+        Returns:
+            bool: True, якщо урок відображено на сцені.
+        """
+        key = lesson.id
+        rect = self._lesson_rect(lesson)
+        if rect is None:
+            self._remove_lesson_item(key)
+            return False
+
+        item = self.lesson_items.get(key)
+        if item is None:
+            item = LessonItem(lesson, rect)
+            self._scene.addItem(item)
+            self.lesson_items[key] = item
+        elif item.lesson != lesson:
+            item.set_lesson(lesson, rect)
+        return True
+
+    def _remove_lesson_item(self, key):
+        item = self.lesson_items.pop(key, None)
+        if item is not None:
+            self._scene.removeItem(item)
+
+    def drawBackground(self, painter: QPainter, rect: QRectF) -> None:
+        """Малює сітку та мітки часу лише для відкритої області."""
+        super().drawBackground(painter, rect)
+        scene_rect = self.sceneRect()
+        hour_height = self.time_slot_height * 60 // self.SLOT_MINUTES
+        first_hour = max(0, int(rect.top() // hour_height))
+        last_hour = min(self.SLOT_COUNT * self.SLOT_MINUTES // 60, int(rect.bottom() // hour_height) + 1)
+        grid_left = self.day_header_width
+
+        painter.setPen(QPen(QColor(self.GRID_COLOR), 0))
+        for hour in range(first_hour, last_hour + 1):
+            y = hour * hour_height
+            painter.drawLine(int(grid_left), int(y), int(scene_rect.right()), int(y))
+        for day in range(self.DAY_COUNT + 1):
+            x = grid_left + day * self.min_day_width
+            painter.drawLine(int(x), int(rect.top()), int(x), int(rect.bottom()))
+
+        # Мітки часу малюються без вертикального масштабу
+        scale_y = painter.worldTransform().m22()
+        painter.save()
+        painter.scale(1, 1 / scale_y)
+        painter.setPen(QColor(self.TEXT_COLOR))
+        for hour in range(first_hour, min(last_hour, self.SLOT_COUNT * self.SLOT_MINUTES // 60)):
+            y = hour * hour_height * scale_y
+            painter.drawText(QRectF(0, y + self.time_slot_height // 2, grid_left, self.time_slot_height),
+                             Qt.AlignmentFlag.AlignCenter, f"{hour:02d}:00")
+        painter.restore()
+
+    def wheelEvent(self, event) -> None:
+        """Ctrl + коліщатко плавно змінює масштаб часової осі."""
+        if not event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            super().wheelEvent(event)
+            return
+
+        steps = event.angleDelta().y() / 120
+        current = self._zoom_animation.endValue() if self._zoom_animation.state() == \
+            QVariantAnimation.State.Running else self._zoom
+        target = max(self.MIN_ZOOM, min(self.MAX_ZOOM, current * self.ZOOM_STEP ** steps))
+        self._zoom_animation.stop()
+        self._zoom_animation.setStartValue(self._zoom)
+        self._zoom_animation.setEndValue(target)
+        self._zoom_animation.start()
+        event.accept()
+
+    def _apply_zoom(self, value) -> None:
+        self._zoom = float(value)
+        self.setTransform(QTransform.fromScale(1, self._zoom))
+
+    def mousePressEvent(self, event) -> None:
+        """Обробляє клік на уроці."""
+        if event.button() == Qt.MouseButton.LeftButton:
+            item = self.itemAt(event.position().toPoint())
+            if isinstance(item, LessonItem):
+                self.lesson_edit_requested.emit(item.lesson)
+                return
+        super().mousePressEvent(event)
+
+    def _handle_lesson_edit_requested(self, lesson):
+        """Відкриває діалог редагування для вибраного уроку."""
+        dialog = LessonDialog(lesson=lesson, edit_mode=True, parent=self)
+        dialog.exec()
+
+    def _handle_lesson_updated(self, lesson):
+        """Оновлює збережений урок у списку та лише його елемент."""
+        if lesson.id is None:
+            return
+        self.lessons.upsert(lesson)
+        self._sync_lesson_item(lesson)
+
+    def _handle_lesson_deleted(self, lesson_id):
+        """Видаляє урок зі списку та прибирає лише його елемент."""
+        self.lessons.remove(lesson_id)
+        self._remove_lesson_item(lesson_id)
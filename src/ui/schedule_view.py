@@ -1,14 +1,35 @@
-from PyQt6.QtGui import QColor, QPainter
+from PyQt6.QtGui import QColor, QPainter, QPixmap
 from PyQt6.QtWidgets import (
     QFrame, QVBoxLayout, QLabel, QScrollArea,
     QGridLayout, QWidget, QHBoxLayout, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from src.language import tr
+from PyQt6.QtCore import Qt, QEvent, QPoint, QRect, QRectF, pyqtSignal
+from src.language import bind_text, tr
+from src.lesson_store import LessonStore
+from src.settings import load_render_engine
 from src.signals import app_signals
 from src.ui.lesson_dialog import LessonDialog
+from src.ui.schedule_canvas import ScheduleCanvas
+
+# Ключі перекладу заголовків днів (понеділок–п'ятниця)
+DAY_KEYS = (
+    "app.days.monday",
+    "app.days.tuesday",
+    "app.days.wednesday",
+    "app.days.thursday",
+    "app.days.friday"
+)
 
 class GridBackground(QWidget):
+    """Фонова сітка розкладу.
+
+    Сітка періодична, тому одна година малюється один раз у QPixmap з
+    урахуванням devicePixelRatio, а paintEvent лише розкладає цю плитку
+    по відкритій області. Кеш скидається при зміні розміру або теми.
+    """
+
+    GRID_COLOR = "#3a3a3a"
+
     def __init__(self, time_slots: list, days: list,
                  time_slot_height: int = 20,  # Adjusted for 5-minute slots
                  day_header_width: int = 100,
@@ -18,6 +39,9 @@ class GridBackground(QWidget):
         self.days = days
         self.time_slot_height = time_slot_height
         self.day_header_width = day_header_width
+        # Full-hour rows are computed once instead of on every repaint
+        self.hour_rows = [i for i, time_slot in enumerate(time_slots) if time_slot.endswith(":00")]
+        self._tile = None
         self._setup_initial_size()
 
     def _setup_initial_size(self) -> None:
@@ -25,87 +49,169 @@ class GridBackground(QWidget):
         min_height = len(self.time_slots) * self.time_slot_height
         self.setMinimumSize(min_width, min_height)
 
-    def paintEvent(self, event) -> None:
-        painter = QPainter(self)
-        painter.setPen(QColor("#3a3a3a"))
-        width = self.width()
-        height = self.height()
-        day_width = width // len(self.days) if len(self.days) > 0 else 0
-
-        # Horizontal lines (only for full hours)
-        for i, time_slot in enumerate(self.time_slots):
-            if time_slot.endswith(":00"):  # Draw lines only for full hours
-                y = i * self.time_slot_height
-                painter.drawLine(0, y, width, y)
-
-        # Vertical lines (days)
+    def invalidate_cache(self) -> None:
+        self._tile = None
+        self.update()
+
+    def resizeEvent(self, event) -> None:
+        self._tile = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event) -> None:
+        if event.type() in (QEvent.Type.StyleChange, QEvent.Type.PaletteChange):
+            self.invalidate_cache()
+        super().changeEvent(event)
+
+    def _hour_period(self) -> int:
+        """Повертає висоту однієї години у пікселях."""
+        if len(self.hour_rows) > 1:
+            return (self.hour_rows[1] - self.hour_rows[0]) * self.time_slot_height
+        return len(self.time_slots) * self.time_slot_height
+
+    def _day_width(self) -> int:
+        return self.width() // len(self.days) if len(self.days) > 0 else 0
+
+    def _render_tile(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        period = self._hour_period()
+        tile = QPixmap(int(self.width() * dpr), int(period * dpr))
+        tile.setDevicePixelRatio(dpr)
+        tile.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(tile)
+        painter.setPen(QColor(self.GRID_COLOR))
+        # Horizontal line (full hour) at the top of the tile
+        painter.drawLine(0, 0, self.width(), 0)
+        self._draw_day_lines(painter, period)
+        painter.end()
+        return tile
+
+    def _draw_day_lines(self, painter: QPainter, height: int) -> None:
+        day_width = self._day_width()
         for i in range(len(self.days) + 1):
             x = i * day_width
             painter.drawLine(x, 0, x, height)
 
+    def paintEvent(self, event) -> None:
+        if self._tile is None or self._tile.devicePixelRatio() != self.devicePixelRatioF():
+            self._tile = self._render_tile()
+
+        painter = QPainter(self)
+        exposed = event.rect()
+        if not self.hour_rows:
+            painter.setPen(QColor(self.GRID_COLOR))
+            self._draw_day_lines(painter, self.height())
+            return
+
+        # Hour lines exist only between the first and the last full hour
+        period = self._hour_period()
+        grid_top = self.hour_rows[0] * self.time_slot_height
+        grid_bottom = self.hour_rows[-1] * self.time_slot_height + period
+        tiled = exposed.intersected(QRect(0, grid_top, self.width(), grid_bottom - grid_top))
+        if not tiled.isEmpty():
+            painter.drawTiledPixmap(tiled, self._tile, QPoint(tiled.x(), (tiled.y() - grid_top) % period))
+
+        painter.setPen(QColor(self.GRID_COLOR))
+        for band in (QRect(0, 0, self.width(), grid_top),
+                     QRect(0, grid_bottom, self.width(), self.height() - grid_bottom)):
+            band = exposed.intersected(band)
+            if not band.isEmpty():
+                painter.setClipRect(band)
+                self._draw_day_lines(painter, self.height())
+
+
 class TimeColumn(QWidget):
+    """Колонка з мітками часу, попередньо намальована у QPixmap."""
+
+    LINE_COLOR = "#3a3a3a"
+    TEXT_COLOR = "#ffffff"
+
     def __init__(self, time_slots, time_slot_height=20, day_header_width=100):  # Adjusted height
         super().__init__()
         self.time_slots = time_slots
         self.time_slot_height = time_slot_height
         self.day_header_width = day_header_width
+        # Only full hours get a label
+        self.hour_rows = [(i, time_slot) for i, time_slot in enumerate(time_slots) if time_slot.endswith(":00")]
+        self._pixmap = None
         self.setFixedWidth(day_header_width)
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
         self.setMinimumHeight(len(time_slots) * time_slot_height)
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def invalidate_cache(self) -> None:
+        self._pixmap = None
+        self.update()
+
+    def resizeEvent(self, event) -> None:
+        self._pixmap = None
+        super().resizeEvent(event)
 
+    def changeEvent(self, event) -> None:
+        if event.type() in (QEvent.Type.StyleChange, QEvent.Type.PaletteChange, QEvent.Type.FontChange):
+            self.invalidate_cache()
+        super().changeEvent(event)
+
+    def _render_pixmap(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setFont(self.font())
         # Draw right border with gray color
-        painter.setPen(QColor("#3a3a3a"))  # Сіра лінія
+        painter.setPen(QColor(self.LINE_COLOR))  # Сіра лінія
         painter.drawLine(self.width() - 1, 0, self.width() - 1, self.height())
 
         # Draw time labels with white color
-        painter.setPen(QColor("#ffffff"))  # Білий текст
-        for i, time_slot in enumerate(self.time_slots):
-            if time_slot.endswith(":00"):  # Show labels only for full hours
-                y = i * self.time_slot_height
-                painter.drawText(0, y + self.time_slot_height // 2, self.width(), self.time_slot_height,
-                                 Qt.AlignmentFlag.AlignCenter, time_slot)
+        painter.setPen(QColor(self.TEXT_COLOR))  # Білий текст
+        for i, time_slot in self.hour_rows:
+            y = i * self.time_slot_height
+            painter.drawText(0, y + self.time_slot_height // 2, self.width(), self.time_slot_height,
+                             Qt.AlignmentFlag.AlignCenter, time_slot)
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        if self._pixmap is None or self._pixmap.devicePixelRatio() != self.devicePixelRatioF():
+            self._pixmap = self._render_pixmap()
+
+        # Blit only the exposed region
+        dpr = self._pixmap.devicePixelRatio()
+        rect = QRectF(event.rect())
+        source = QRectF(rect.x() * dpr, rect.y() * dpr, rect.width() * dpr, rect.height() * dpr)
+        painter = QPainter(self)
+        painter.drawPixmap(rect, self._pixmap, source)
 
 class ScheduleView(QWidget):
     # Signal to request lesson edit
     lesson_edit_requested = pyqtSignal(object)
 
-    # Create time slots for every 5 minutes from 01:00 to 23:55
+    SLOT_MINUTES = 5
+
+    # Create time slots for every 5 minutes from 00:00 to 22:55
     TIME_SLOTS = []
     for hour in range(0, 23):
         for minute in [0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55]:
             TIME_SLOTS.append(f"{hour:02d}:{minute:02d}")
 
-    DAY_TRANSLATIONS = {
-        'en': ["monday", "tuesday", "wednesday", "thursday", "friday"],
-        'uk': ["понеділок", "вівторок", "середа", "четвер", "п'ятниця"],
-        'pl': ["poniedziałek", "wtorek", "środa", "czwartek", "piątek"]
-    }
-
     def __init__(self, time_slot_height=20, day_header_width=100, min_day_width=210):  # Adjusted height
         super().__init__()
-        app_signals.render_lessons.connect(self._render_lessons)
-        app_signals.lesson_updated.connect(self._handle_lesson_updated)
-        app_signals.lesson_deleted.connect(self._handle_lesson_deleted)
+        app_signals.lesson_added.connect(self._handle_lesson_updated)
+        app_signals.lesson_saved.connect(self._handle_lesson_updated)
+        app_signals.lesson_removed.connect(self._handle_lesson_deleted)
         self.time_slot_height = time_slot_height
         self.day_header_width = day_header_width
         self.min_day_width = min_day_width
-        self.lesson_blocks = []
-        self.lessons = []
+        # Keyed by lesson id so renders only touch blocks whose lessons changed
+        self.lesson_blocks = {}
+        self.lessons = LessonStore()
 
         self._setup_ui()
 
     @property
     def days(self) -> list:
-        return [
-            tr("app.days.monday"),
-            tr("app.days.tuesday"),
-            tr("app.days.wednesday"),
-            tr("app.days.thursday"),
-            tr("app.days.friday")
-        ]
+        return [tr(key) for key in DAY_KEYS]
 
     def _setup_ui(self):
         main_layout = QHBoxLayout(self)
@@ -165,122 +271,124 @@ class ScheduleView(QWidget):
         self.content_widget.setMinimumSize(min_width, min_height)
 
     def set_lessons(self, lessons):
-        self.lessons = lessons
+        # Блоки прив'язані до id, тому незбережені уроки без id не відображаються
+        self.lessons = LessonStore(lesson for lesson in lessons if lesson.id is not None)
         self._render_lessons()
 
     def _render_lessons(self):
-        self._clear_existing_blocks()
         self._update_background()
-        day_mapping = self._create_day_mapping()
+        rendered_keys = set()
         for lesson in self.lessons:
-            try:
-                day_index = day_mapping.get(lesson.day.lower().strip())
-                if day_index is None:
-                    continue
-                row_index = self._get_time_row_index(lesson.start_time)
-                if row_index is None:
-                    continue
-                block = self._create_lesson_block(lesson)
-                # Connect block click to edit handler
-                block.lesson_clicked.connect(self._handle_lesson_block_clicked)
-                # Span rows based on duration
-                row_span = self._calculate_row_span(lesson.start_time, lesson.end_time)
-                self.grid_layout.addWidget(block, row_index, day_index, row_span, 1)
-                self.lesson_blocks.append(block)
-            except (ValueError, AttributeError):
-                continue
+            if self._sync_lesson_block(lesson):
+                rendered_keys.add(lesson.id)
 
-    def _update_background(self):
-        self.background.setParent(None)
-        self.background = GridBackground(
-            self.TIME_SLOTS,
-            self.days,
-            time_slot_height=self.time_slot_height,
-            day_header_width=0
-        )
-        self.grid_layout.addWidget(
-            self.background,
-            0, 0,
-            len(self.TIME_SLOTS),
-            len(self.days),
-            alignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft
-        )
+        for key in list(self.lesson_blocks.keys() - rendered_keys):
+            self._remove_lesson_block(key)
 
-    def _clear_existing_blocks(self):
-        for block in self.lesson_blocks:
-            block.setParent(None)
-        self.lesson_blocks.clear()
-
-    def _create_day_mapping(self):
-        reverse_mapping = {}
-        for lang, days in self.DAY_TRANSLATIONS.items():
-            for idx, day in enumerate(days):
-                normalized_day = day.lower().strip()
-                if normalized_day not in reverse_mapping:
-                    reverse_mapping[normalized_day] = idx
-        return reverse_mapping
-
-    def _get_time_row_index(self, time_str):
-        if not time_str or ":" not in time_str:
+    def _lesson_placement(self, lesson):
+        """Повертає (рядок, день, кількість рядків) блоку або None."""
+        if lesson.day_index is None:
             return None
+        row_index = self._get_time_row_index(lesson.start_min)
+        if row_index is None:
+            return None
+        # Span rows based on duration
+        row_span = self._calculate_row_span(lesson.start_min, lesson.end_min)
+        return row_index, lesson.day_index, row_span
+
+    def _sync_lesson_block(self, lesson):
+        """Додає, переміщує або оновлює блок уроку.
+
+        Returns:
+            bool: True, якщо урок відображено у розкладі.
+        """
+        key = lesson.id
+        placement = self._lesson_placement(lesson)
+        if placement is None:
+            self._remove_lesson_block(key)
+            return False
+
+        block = self.lesson_blocks.get(key)
+        if block is None:
+            block = self._create_lesson_block(lesson)
+            # Connect block click to edit handler
+            block.lesson_clicked.connect(self._handle_lesson_block_clicked)
+            self.lesson_blocks[key] = block
+        elif block.placement == placement and block.lesson == lesson:
+            return True
+        else:
+            block.set_lesson(lesson)
+            self._apply_block_size(block, lesson)
+            if block.placement == placement:
+                return True
+            self.grid_layout.removeWidget(block)
+
+        block.placement = placement
+        self.grid_layout.addWidget(block, *placement, 1)
+        return True
+
+    def _remove_lesson_block(self, key):
+        block = self.lesson_blocks.pop(key, None)
+        if block is not None:
+            self.grid_layout.removeWidget(block)
+            block.setParent(None)
+
+    def _update_background(self):
+        """Оновлює фон без повторного створення віджета."""
+        self.background.days = self.days
+        self.background.update()
 
-        try:
-            hour, minute = map(int, time_str.split(":"))
-            time_str_formatted = f"{hour:02d}:{minute:02d}"
-            return self.TIME_SLOTS.index(time_str_formatted)
-        except (ValueError, AttributeError):
+    def _get_time_row_index(self, start_min):
+        if start_min is None or start_min % self.SLOT_MINUTES:
             return None
+        row_index = start_min // self.SLOT_MINUTES
+        return row_index if row_index < len(self.TIME_SLOTS) else None
 
-    @staticmethod
-    def _calculate_row_span(start_time, end_time):
-        try:
-            start_h, start_m = map(int, start_time.split(':'))
-            end_h, end_m = map(int, end_time.split(':'))
-            start_total = start_h * 60 + start_m
-            end_total = end_h * 60 + end_m
-            duration_minutes = end_total - start_total
-            row_span = max(1, duration_minutes // 5)
-            return row_span
-        except (ValueError, AttributeError):
+    @classmethod
+    def _calculate_row_span(cls, start_min, end_min):
+        if start_min is None or end_min is None:
             return 1
+        return max(1, (end_min - start_min) // cls.SLOT_MINUTES)
 
     def _create_lesson_block(self, lesson):
         block = ScheduleBlock(lesson)
         block.setFixedWidth(self.min_day_width - 10)
-
-        try:
-            row_span = self._calculate_row_span(lesson.start_time, lesson.end_time)
-            min_height = row_span * self.time_slot_height
-            block.setMinimumHeight(max(30, min_height))
-            block.setMaximumHeight(min_height)
-        except (ValueError, AttributeError):
-            block.setMinimumHeight(30)
-
+        self._apply_block_size(block, lesson)
         return block
 
+    def _apply_block_size(self, block, lesson):
+        row_span = self._calculate_row_span(lesson.start_min, lesson.end_min)
+        min_height = row_span * self.time_slot_height
+        block.setMinimumHeight(max(30, min_height))
+        block.setMaximumHeight(min_height)
+
     def _handle_lesson_block_clicked(self, lesson):
         """Відкриває діалог редагування для вибраного уроку."""
         dialog = LessonDialog(lesson=lesson, edit_mode=True, parent=self)
         dialog.exec()
 
     def _handle_lesson_updated(self, lesson):
-        """Оновлює урок у списку та перемальовує розклад."""
-        for i, existing_lesson in enumerate(self.lessons):
-            if existing_lesson.id == lesson.id:
-                self.lessons[i] = lesson
-                break
-        else:
-            self.lessons.append(lesson)
-        self._render_lessons()
+        """Оновлює збережений урок у списку та перебудовує лише його блок."""
+        if lesson.id is None:
+            return
+        self.lessons.upsert(lesson)
+        self._sync_lesson_block(lesson)
 
     def _handle_lesson_deleted(self, lesson_id):
-        """Видаляє урок зі списку та перемальовує розклад."""
-        self.lessons = [lesson for lesson in self.lessons if lesson.id != lesson_id]
-        self._render_lessons()
+        """Видаляє урок зі списку та прибирає лише його блок."""
+        self.lessons.remove(lesson_id)
+        self._remove_lesson_block(lesson_id)
 
 class ScheduleWidget(QWidget):
+    # Available rendering engines for the schedule grid
+    ENGINES = {
+        "widgets": ScheduleView,
+        "scene": ScheduleCanvas
+    }
+
     def __init__(self):
         super().__init__()
+        self.render_engine = load_render_engine()
         self._setup_ui()
 
     def _setup_ui(self):
@@ -303,8 +411,9 @@ class ScheduleWidget(QWidget):
         header_layout.setContentsMargins(100, 0, 100, 0)
         header_layout.setSpacing(0)
 
-        for day in self.days:
-            label = QLabel(day)
+        for day_key in DAY_KEYS:
+            label = QLabel()
+            bind_text(label, day_key)
             label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             label.setFixedWidth(200)
             label.setStyleSheet("""
@@ -317,30 +426,41 @@ class ScheduleWidget(QWidget):
         self.header_scroll_area.setWidget(self.header_frame)
         layout.addWidget(self.header_scroll_area)
 
-        self.schedule_view = ScheduleView()
-        self.schedule_view.set_header_scroll_area(self.header_scroll_area)
+        self.loading_label = QLabel()
+        bind_text(self.loading_label, "app.schedule.loading")
+        self.loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.loading_label.hide()
+        layout.addWidget(self.loading_label)
+
+        self.schedule_view = self._create_schedule_view(self.render_engine)
         layout.addWidget(self.schedule_view)
 
+    def _create_schedule_view(self, engine):
+        view = self.ENGINES.get(engine, ScheduleView)()
+        view.set_header_scroll_area(self.header_scroll_area)
+        return view
+
+    def set_render_engine(self, engine):
+        """Замінює рушій відображення, зберігаючи поточні уроки."""
+        if engine == self.render_engine or engine not in self.ENGINES:
+            return
+        self.render_engine = engine
+        old_view = self.schedule_view
+        self.schedule_view = self._create_schedule_view(engine)
+        self.layout().replaceWidget(old_view, self.schedule_view)
+        old_view.deleteLater()
+        self.schedule_view.set_lessons(old_view.lessons)
+
     @property
     def days(self):
-        return [
-            tr("app.days.monday"),
-            tr("app.days.tuesday"),
-            tr("app.days.wednesday"),
-            tr("app.days.thursday"),
-            tr("app.days.friday")
-        ]
+        return [tr(key) for key in DAY_KEYS]
 
     def set_lessons(self, lessons):
         self.schedule_view.set_lessons(lessons)
 
-    def refresh_translation(self):
-        for i, day in enumerate(self.days):
-            label = self.header_frame.layout().itemAt(i).widget()
-            if isinstance(label, QLabel):
-                label.setText(day)
-
-        app_signals.render_lessons.emit()
+    def set_loading(self, loading: bool):
+        """Показує або ховає індикатор завантаження розкладу."""
+        self.loading_label.setVisible(loading)
 
 class ScrollSyncManager:
     def __init__(self, main_scroll, time_scroll=None, header_scroll=None):
@@ -360,6 +480,7 @@ class ScheduleBlock(QFrame):
     def __init__(self, lesson):
         super().__init__()
         self.lesson = lesson
+        self.placement = None
         self.setMouseTracking(True)  # Enable mouse tracking for click events
         self._setup_ui()
 
@@ -389,6 +510,20 @@ class ScheduleBlock(QFrame):
         self.block_layout = layout
         self.setLayout(layout)
 
+    def set_lesson(self, lesson) -> None:
+        """Оновлює дані блоку без його повторного створення."""
+        old_color = self.lesson.color
+        self.lesson = lesson
+        if lesson.color != old_color:
+            self._apply_styles()
+
+        self.labels['subject'].setText(lesson.subject)
+        self.labels['time'].setText(self._format_time_text())
+        for key, text in (('type', self._format_type_text()), ('room', self._format_room_text())):
+            if key in self.labels:
+                self.labels[key].setText(text)
+        self._apply_text_styles()
+
     def mousePressEvent(self, event):
         """Обробляє клік на блоці уроку."""
         if event.button() == Qt.MouseButton.LeftButton:
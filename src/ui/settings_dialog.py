@@ -5,6 +5,7 @@
 - Теми інтерфейсу (світла/темна)
 - Мови інтерфейсу (англійська, українська, польська)
 - Режиму відображення розкладу (день/тиждень)
+- Рушія відображення розкладу (стандартний/прискорений)
 - Сповіщень (включити/виключити)
 """
 
@@ -21,7 +22,8 @@ from src.settings import (
     save_language, save_view_mode,
     save_notifications, save_theme,
     load_notifications, load_language,
-    load_view_mode, load_theme
+    load_view_mode, load_theme,
+    save_render_engine, load_render_engine
 )
 
 
@@ -30,7 +32,7 @@ class SettingsDialog(QDialog):
 
     # Константи класу
     MIN_WIDTH = 400
-    MIN_HEIGHT = 450
+    MIN_HEIGHT = 520
     ICON_PATH = "src/images/icons/settings-dark.png"
     LANGUAGES = {
         "en": "English",
@@ -62,6 +64,7 @@ class SettingsDialog(QDialog):
         # Додаємо секції налаштувань
         self._init_theme_section(layout)
         self._init_view_mode_section(layout)
+        self._init_render_engine_section(layout)
         self._init_language_section(layout)
         self._init_notifications_section(layout)
         self._init_action_buttons(layout)
@@ -101,6 +104,23 @@ class SettingsDialog(QDialog):
         view_layout.addWidget(self.view_weekly_btn)
         layout.addLayout(view_layout)
 
+    def _init_render_engine_section(self, layout: QVBoxLayout) -> None:
+        """Ініціалізує секцію вибору рушія відображення розкладу."""
+        layout.addWidget(self._create_section_label(tr("app.settings.render_engine")))
+
+        self.engine_widgets_btn = self._create_option_button(tr("app.settings.engine_widgets"))
+        self.engine_scene_btn = self._create_option_button(tr("app.settings.engine_scene"))
+
+        self.engine_group = self._create_button_group(
+            [self.engine_widgets_btn, self.engine_scene_btn],
+            "scene" if load_render_engine() == "scene" else "widgets"
+        )
+
+        engine_layout = QHBoxLayout()
+        engine_layout.addWidget(self.engine_widgets_btn)
+        engine_layout.addWidget(self.engine_scene_btn)
+        layout.addLayout(engine_layout)
+
     def _init_language_section(self, layout: QVBoxLayout) -> None:
         """Ініціалізує секцію вибору мови."""
         layout.addWidget(self._create_section_label(tr("app.settings.language")))
@@ -223,6 +243,12 @@ class SettingsDialog(QDialog):
         elif button_text == tr("app.settings.weekly"):
             return "weekly"
 
+        # Для рушія відображення ("Standard" / "Accelerated" → "widgets" / "scene")
+        if button_text == tr("app.settings.engine_widgets"):
+            return "widgets"
+        elif button_text == tr("app.settings.engine_scene"):
+            return "scene"
+
         # Для сповіщень ("Yes" / "No" → "yes" / "no")
         if button_text == tr("app.settings.yes"):
             return "yes"
@@ -242,14 +268,13 @@ class SettingsDialog(QDialog):
         self._save_theme()
         self._save_language()
         self._save_view_mode()
+        self._save_render_engine()
         self._save_notifications()
 
     def _save_theme(self) -> None:
         """Зберігає вибрану тему."""
         theme = "light_theme" if self.theme_light_btn.isChecked() else "dark_theme"
         save_theme(theme)
-        app_signals.load_current_theme.emit()
-        app_signals.update_all_button_icons.emit()
 
     def _save_language(self) -> None:
         """Зберігає вибрану мову."""
@@ -267,6 +292,12 @@ class SettingsDialog(QDialog):
         view_mode = "weekly" if self.view_weekly_btn.isChecked() else "daily"
         save_view_mode(view_mode)
 
+    def _save_render_engine(self) -> None:
+        """Зберігає вибраний рушій відображення розкладу."""
+        engine = "scene" if self.engine_scene_btn.isChecked() else "widgets"
+        save_render_engine(engine)
+        app_signals.set_render_engine.emit(engine)
+
     def _save_notifications(self) -> None:
         """Зберігає налаштування сповіщень."""
         state = self.notif_yes_btn.isChecked()
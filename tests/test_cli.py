@@ -0,0 +1,123 @@
+"""Тести командного рядка: коди завершення та збереження файлів."""
+
+import csv
+import json
+import sqlite3
+
+import pytest
+
+from src.cli import EXIT_FAILED, EXIT_OK, EXIT_USAGE, main
+from src.database import LessonRepository
+
+HEADER = "ID,Day,Subject,Start_time,End_time,Type,Room,Color\n"
+
+
+@pytest.fixture
+def db(tmp_path):
+    return str(tmp_path / "schedule.db")
+
+
+def write_csv(path, *rows):
+    path.write_text(HEADER + "".join(row + "\n" for row in rows), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def good_csv(tmp_path):
+    return write_csv(
+        tmp_path / "good.csv",
+        "1,Monday,Math,08:00,09:00,Offline,A019,#00a7e5",
+        "2,Monday,Physics,09:00,10:00,Online,,#ff0000",
+    )
+
+
+@pytest.fixture
+def bad_csv(tmp_path):
+    return write_csv(
+        tmp_path / "bad.csv",
+        "1,Monday,Math,08:00,09:00,Offline,A019,#00a7e5",
+        "x,Monday,Math,,09:00,Offline,A019,#00a7e5",
+    )
+
+
+def test_validate(db, good_csv, bad_csv, capsys):
+    assert main(["--db", db, "validate", good_csv]) == EXIT_OK
+    assert "2 lessons OK" in capsys.readouterr().out
+    assert main(["--db", db, "validate", bad_csv]) == EXIT_FAILED
+    assert "line 3" in capsys.readouterr().err
+
+
+def test_import_replace_and_merge(db, good_csv, tmp_path, capsys):
+    assert main(["--db", db, "import", good_csv]) == EXIT_OK
+    assert "2 lessons imported" in capsys.readouterr().out
+
+    update = write_csv(tmp_path / "update.csv",
+                       "2,Monday,Physics,09:00,10:00,Online,,#00ff00",
+                       "3,Tuesday,Art,08:00,09:00,Offline,B1,#00a7e5")
+    assert main(["--db", db, "import", update, "--mode", "merge"]) == EXIT_OK
+    assert "1 added, 1 updated, 0 unchanged" in capsys.readouterr().out
+    assert main(["--db", db, "import", update, "--mode", "merge"]) == EXIT_OK
+    assert "0 added, 0 updated, 2 unchanged" in capsys.readouterr().out
+
+
+def test_failed_import_keeps_schedule(db, good_csv, bad_csv):
+    assert main(["--db", db, "import", good_csv]) == EXIT_OK
+    assert main(["--db", db, "import", bad_csv]) == EXIT_FAILED
+    repository = LessonRepository(db)
+    try:
+        assert repository.count() == 2
+    finally:
+        repository.close()
+
+
+@pytest.mark.parametrize("name", ["out.csv", "out.json", "out.ndjson.gz"])
+def test_export_round_trip(db, good_csv, tmp_path, name):
+    target = str(tmp_path / name)
+    assert main(["--db", db, "import", good_csv]) == EXIT_OK
+    assert main(["--db", db, "export", target]) == EXIT_OK
+    assert main(["--db", db, "validate", target]) == EXIT_OK
+
+
+def test_export_reads_back_as_csv(db, good_csv, tmp_path):
+    target = tmp_path / "out.csv"
+    main(["--db", db, "import", good_csv])
+    main(["--db", db, "export", str(target)])
+    with open(target, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["Subject"] for row in rows] == ["Math", "Physics"]
+
+
+def test_failed_export_leaves_existing_file(db, good_csv, tmp_path, monkeypatch):
+    target = tmp_path / "out.json"
+    original = json.dumps([{"keep": "me"}]).encode("utf-8")
+    target.write_bytes(original)
+    main(["--db", db, "import", good_csv])
+
+    def broken_rows(self, batch_size=LessonRepository.BULK_CHUNK_SIZE):
+        yield [(1, "Monday", "Math", "08:00", "09:00", "Offline", "A019", "#00a7e5")]
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(LessonRepository, "iter_rows", broken_rows)
+    assert main(["--db", db, "export", str(target)]) == EXIT_FAILED
+    assert target.read_bytes() == original
+    assert [path.name for path in tmp_path.iterdir() if path.name.startswith("out")] == ["out.json"]
+
+
+def test_conflicts(db, tmp_path, capsys):
+    overlapping = write_csv(tmp_path / "overlap.csv",
+                            "1,Monday,Math,08:00,09:00,Offline,A019,#00a7e5",
+                            "2,Monday,Physics,08:30,09:30,Online,,#ff0000")
+    separate = write_csv(tmp_path / "separate.csv",
+                         "1,Monday,Math,08:00,09:00,Offline,A019,#00a7e5")
+    assert main(["--db", db, "import", overlapping]) == EXIT_OK
+    assert main(["--db", db, "conflicts"]) == EXIT_FAILED
+    assert "1 conflicts" in capsys.readouterr().err
+    assert main(["--db", db, "import", separate]) == EXIT_OK
+    assert main(["--db", db, "conflicts"]) == EXIT_OK
+
+
+def test_usage_errors(db, tmp_path):
+    assert main(["--db", db, "validate", str(tmp_path / "schedule.txt")]) == EXIT_USAGE
+    with pytest.raises(SystemExit) as error:
+        main(["--db", db, "import"])
+    assert error.value.code == EXIT_USAGE
@@ -0,0 +1,93 @@
+"""Тести злиття та заміни уроків у LessonRepository."""
+
+import pytest
+
+from src.database import LessonRepository
+from src.models import Lesson
+
+
+@pytest.fixture
+def repository(tmp_path):
+    repo = LessonRepository(str(tmp_path / "schedule.db"))
+    repo.init_schema()
+    yield repo
+    repo.close()
+
+
+def lesson(lesson_id=None, subject="Math", start="08:00", end="09:00", room="A019", color="#00a7e5"):
+    return Lesson(lesson_id, "Monday", subject, start, end, "Offline", room, color)
+
+
+def counts(result):
+    return result.inserted, result.updated, result.unchanged
+
+
+def test_replace_all_swaps_whole_schedule(repository):
+    repository.replace_all([lesson(1), lesson(2, subject="Physics")])
+    assert repository.replace_all([lesson(3, subject="Art")]) == 1
+    assert [l.subject for l in repository.fetch_all()] == ["Art"]
+
+
+def test_replace_all_keeps_schedule_on_error(repository):
+    repository.replace_all([lesson(1)])
+    with pytest.raises(Exception):
+        repository.replace_all([lesson(2), lesson(2, subject="Physics")])
+    assert [l.id for l in repository.fetch_all()] == [1]
+
+
+def test_merge_by_id_counts(repository):
+    repository.replace_all([lesson(1), lesson(2, subject="Physics")])
+    result = repository.merge_all([
+        lesson(1),
+        lesson(2, subject="Physics", color="#ff0000"),
+        lesson(3, subject="Art"),
+    ])
+    assert counts(result) == (1, 1, 1)
+    assert repository.count() == 3
+    assert {l.id: l.color for l in repository.fetch_all()}[2] == "#ff0000"
+
+
+def test_merge_rerun_is_idempotent(repository):
+    lessons = [lesson(1), lesson(2, subject="Physics", room=None)]
+    assert counts(repository.merge_all(lessons)) == (2, 0, 0)
+    assert counts(repository.merge_all(lessons)) == (0, 0, 2)
+    assert counts(repository.merge_all(lessons, key="natural")) == (0, 0, 2)
+    assert repository.count() == 2
+
+
+def test_merge_natural_key_matches_null_and_empty_room(repository):
+    repository.replace_all([lesson(1, room=None)])
+    result = repository.merge_all([lesson(None, room="", color="#ff0000")], key="natural")
+    assert counts(result) == (0, 1, 0)
+    [stored] = repository.fetch_all()
+    assert stored.id == 1 and stored.color == "#ff0000"
+
+
+def test_merge_natural_key_ignores_file_ids(repository):
+    repository.replace_all([lesson(1)])
+    result = repository.merge_all([lesson(42), lesson(7, subject="Art")], key="natural")
+    assert counts(result) == (1, 0, 1)
+    assert sorted(l.id for l in repository.fetch_all())[0] == 1
+    assert 42 not in {l.id for l in repository.fetch_all()}
+
+
+@pytest.mark.parametrize("key, first, last", [
+    ("id", lesson(5, color="#111111"), lesson(5, color="#222222")),
+    ("natural", lesson(None, room="", color="#111111"), lesson(None, room=None, color="#222222")),
+])
+def test_merge_duplicate_keys_last_wins(repository, key, first, last):
+    result = repository.merge_all([first, last], key=key)
+    assert counts(result) == (1, 0, 0)
+    [stored] = repository.fetch_all()
+    assert stored.color == "#222222"
+
+
+def test_merge_duplicate_keys_count_distinct_targets(repository):
+    repository.replace_all([lesson(1)])
+    result = repository.merge_all([lesson(1, color="#111111"), lesson(1, color="#222222")])
+    assert counts(result) == (0, 1, 0)
+
+
+def test_merge_rejects_unknown_key(repository):
+    with pytest.raises(ValueError):
+        repository.merge_all([lesson(1)], key="room")
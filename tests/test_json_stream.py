@@ -0,0 +1,70 @@
+"""Тести інкрементного читання JSON масивів."""
+
+import io
+import json
+import random
+
+import pytest
+
+from src.json_stream import JsonArrayReader, JsonStreamError
+
+
+def read_items(text, chunk_size=JsonArrayReader.CHUNK_SIZE):
+    return list(JsonArrayReader(io.StringIO(text), chunk_size))
+
+
+def random_value(rng, depth=0):
+    kinds = ["int", "float", "str", "bool", "null"] + (["list", "dict"] if depth < 3 else [])
+    kind = rng.choice(kinds)
+    if kind == "int":
+        return rng.randint(-10 ** 6, 10 ** 6)
+    if kind == "float":
+        return rng.uniform(-1000, 1000)
+    if kind == "str":
+        return "".join(rng.choice('ab "\\\n\tю€😀') for _ in range(rng.randint(0, 12)))
+    if kind == "bool":
+        return rng.choice([True, False])
+    if kind == "null":
+        return None
+    if kind == "list":
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {f"k{i}": random_value(rng, depth + 1) for i in range(rng.randint(0, 4))}
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 21))
+def test_matches_json_loads(chunk_size):
+    rng = random.Random(chunk_size)
+    for _ in range(20):
+        items = [random_value(rng) for _ in range(rng.randint(0, 8))]
+        text = json.dumps(items, indent=rng.choice([None, 2, 4]), ensure_ascii=rng.random() < 0.5)
+        assert [item for _, item in read_items(text, chunk_size)] == json.loads(text)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+def test_reports_item_lines(chunk_size):
+    text = '[\n  {"a": 1},\n\n  {"b": [\n 2]},\n  3\n]\n'
+    assert [line for line, _ in read_items(text, chunk_size)] == [2, 4, 6]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64])
+@pytest.mark.parametrize("text, line", [
+    ('', 1),
+    ('{"a": 1}', 1),
+    ('[\n1,\n2\n', 4),
+    ('[\n1,\n{"a": tru}\n]', 3),
+    ('[\n1\n2\n]', 3),
+    ('[\n1,\n]', 3),
+    ('[\n"unterminated\n]', 2),
+    ('[1]\n\n[2]', 3),
+])
+def test_malformed_input_reports_line(chunk_size, text, line):
+    with pytest.raises(JsonStreamError) as error:
+        read_items(text, chunk_size)
+    assert error.value.line == line
+
+
+def test_error_mid_buffer_stops_without_reading_rest():
+    stream = io.StringIO('[1, {"a": nope}, 2]' + " " * 10000 + "]")
+    with pytest.raises(JsonStreamError):
+        list(JsonArrayReader(stream, chunk_size=1000))
+    assert stream.tell() <= 1000